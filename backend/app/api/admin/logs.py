@@ -7,8 +7,9 @@ Provides request log query endpoints.
 from datetime import datetime
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from app.api.deps import LogServiceDep, require_admin_auth
@@ -164,6 +165,66 @@ async def list_logs(
         return JSONResponse(content=e.to_dict(), status_code=e.status_code)
 
 
+@router.get("/export")
+async def export_logs(
+    service: LogServiceDep,
+    start_time: Optional[datetime] = Query(None, description="Start Time"),
+    end_time: Optional[datetime] = Query(None, description="End Time"),
+    requested_model: Optional[str] = Query(None, description="Requested Model (Fuzzy Match)"),
+    target_model: Optional[str] = Query(None, description="Target Model (Fuzzy Match)"),
+    provider_id: Optional[int] = Query(None, description="Provider ID"),
+    status_min: Optional[int] = Query(None, description="Min Status Code"),
+    status_max: Optional[int] = Query(None, description="Max Status Code"),
+    has_error: Optional[bool] = Query(None, description="Has Error"),
+    api_key_id: Optional[int] = Query(None, description="API Key ID"),
+    api_key_name: Optional[str] = Query(None, description="API Key Name"),
+    retry_count_min: Optional[int] = Query(None, description="Min Retry Count"),
+    retry_count_max: Optional[int] = Query(None, description="Max Retry Count"),
+    input_tokens_min: Optional[int] = Query(None, description="Min Input Tokens"),
+    input_tokens_max: Optional[int] = Query(None, description="Max Input Tokens"),
+    total_time_min: Optional[int] = Query(None, description="Min Total Time (ms)"),
+    total_time_max: Optional[int] = Query(None, description="Max Total Time (ms)"),
+    sort_by: str = Query("request_time", description="Sort Field"),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort Order"),
+):
+    """
+    Export request logs
+
+    Streams every matching log (list view fields) as newline-delimited JSON,
+    reading the database in batches instead of loading all rows first.
+    """
+    query = RequestLogQuery(
+        start_time=start_time,
+        end_time=end_time,
+        requested_model=requested_model,
+        target_model=target_model,
+        provider_id=provider_id,
+        status_min=status_min,
+        status_max=status_max,
+        has_error=has_error,
+        api_key_id=api_key_id,
+        api_key_name=api_key_name,
+        retry_count_min=retry_count_min,
+        retry_count_max=retry_count_max,
+        input_tokens_min=input_tokens_min,
+        input_tokens_max=input_tokens_max,
+        total_time_min=total_time_min,
+        total_time_max=total_time_max,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+
+    async def _ndjson():
+        async for item in service.iter_query(query):
+            yield orjson.dumps(item.model_dump(mode="json")) + b"\n"
+
+    return StreamingResponse(
+        _ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="request_logs.ndjson"'},
+    )
+
+
 @router.get("/{log_id}", response_model=RequestLogDetailResponse)
 async def get_log(
     log_id: int,
@@ -35,7 +35,7 @@ class LoginResponse(BaseModel):
 def _extract_bearer_token(authorization: str | None) -> str | None:
     if not authorization:
         return None
-    if authorization.lower().startswith("bearer "):
+    if authorization[:7].lower() == "bearer ":
         return authorization[7:].strip() or None
     return authorization.strip() or None
 
@@ -28,6 +28,7 @@ from app.services import (
     RoundRobinStrategy,
     CostFirstStrategy,
     PriorityStrategy,
+    ModelAffinityStrategy,
 )
 
 
@@ -35,6 +36,7 @@ from app.services import (
 _round_robin_strategy = RoundRobinStrategy()
 _cost_first_strategy = CostFirstStrategy()
 _priority_strategy = PriorityStrategy()
+_model_affinity_strategy = ModelAffinityStrategy()
 
 
 async def get_db():
@@ -113,6 +115,7 @@ def get_proxy_service(db: DbSession) -> ProxyService:
         round_robin_strategy=_round_robin_strategy,
         cost_first_strategy=_cost_first_strategy,
         priority_strategy=_priority_strategy,
+        model_affinity_strategy=_model_affinity_strategy,
     )
 
 
@@ -121,7 +124,7 @@ def get_proxy_service(db: DbSession) -> ProxyService:
 def _extract_bearer_token(authorization: str | None) -> str | None:
     if not authorization:
         return None
-    if authorization.lower().startswith("bearer "):
+    if authorization[:7].lower() == "bearer ":
         return authorization[7:].strip() or None
     return authorization.strip() or None
 
@@ -0,0 +1,219 @@
+"""
+Proxy API Common Handler
+
+Shared request handling for all proxy endpoints, regardless of client protocol.
+"""
+
+import logging
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, status
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.api.deps import CurrentApiKey, ProxyServiceDep
+from app.common.errors import AppError
+from app.common.proxy_headers import (
+    build_raw_response_headers,
+    build_streaming_response_headers,
+    decode_request_headers,
+)
+from app.common.response_cache import ResponseCache
+from app.common.responses import ORJSONResponse
+from app.providers.base import ProviderResponse
+from app.services.proxy_service import LogInfo
+
+logger = logging.getLogger(__name__)
+
+
+_CONTENT_TYPE = frozenset({b"content-type"})
+
+
+def _provider_response_to_response(
+    response: ProviderResponse, trace_id: Optional[str] = None
+) -> Response:
+    """
+    Convert a buffered provider response into an HTTP response
+
+    Upstream headers are appended as pre-encoded ASGI pairs; a body re-serialized
+    here keeps its own Content-Type instead of the upstream one.
+    """
+    content = response.body
+    if isinstance(content, (dict, list)):
+        resp: Response = ORJSONResponse(content=content, status_code=response.status_code)
+        skip = _CONTENT_TYPE
+    else:
+        resp = Response(content=content, status_code=response.status_code)
+        skip = frozenset()
+    resp.raw_headers.extend(
+        build_raw_response_headers(response.headers, trace_id, skip=skip)
+    )
+    return resp
+
+
+async def _write_pending_log(log_info: LogInfo) -> None:
+    """Run a deferred request log write, logging instead of raising on failure"""
+    if log_info.pending_log is None:
+        return
+    try:
+        await log_info.pending_log()
+    except Exception:
+        logger.exception("Failed to write request log: trace_id=%s", log_info.trace_id)
+
+
+async def forward_with_body(
+    request: Request,
+    api_key: CurrentApiKey,
+    service: ProxyServiceDep,
+    path: str,
+    body: dict[str, Any],
+    request_protocol: str,
+    *,
+    hedge: bool = False,
+    raw_body: Optional[bytes] = None,
+    response_cache: Optional[ResponseCache] = None,
+) -> Response:
+    """
+    Forward a proxy request with an already parsed body
+
+    Args:
+        request: Incoming request
+        api_key: Authenticated gateway API Key
+        service: Proxy service
+        path: Request path in the client protocol
+        body: Parsed request body
+        request_protocol: Client protocol ("openai", "openai_responses", "anthropic")
+        hedge: Opt the route into hedged (non-streaming) requests; only for
+            idempotent endpoints
+        raw_body: Serialized form of body, reused for upstream requests that
+            need no protocol conversion
+        response_cache: Cache answering repeated (non-streaming) requests; only
+            for idempotent endpoints
+
+    Returns:
+        Response: Streaming response for successful stream requests, otherwise
+            the buffered upstream (or error) response
+    """
+    try:
+        headers = decode_request_headers(request.scope["headers"])
+        api_key_id = api_key.id
+        api_key_name = api_key.key_name
+        method = request.method
+
+        # Determine if it's a streaming request
+        if body.get("stream", False):
+            (
+                initial_response,
+                stream_gen,
+                log_info,
+            ) = await service.process_request_stream(
+                api_key_id=api_key_id,
+                api_key_name=api_key_name,
+                request_protocol=request_protocol,
+                path=path,
+                method=method,
+                headers=headers,
+                body=body,
+                raw_body=raw_body,
+            )
+
+            # If initial response is error, return directly
+            if not initial_response.is_success:
+                return _provider_response_to_response(
+                    initial_response, log_info.trace_id
+                )
+
+            return StreamingResponse(
+                stream_gen,
+                status_code=initial_response.status_code,
+                headers=build_streaming_response_headers(
+                    initial_response.headers, log_info.trace_id
+                ),
+                media_type="text/event-stream",
+            )
+
+        response, log_info = await service.process_request(
+            api_key_id=api_key_id,
+            api_key_name=api_key_name,
+            request_protocol=request_protocol,
+            path=path,
+            method=method,
+            headers=headers,
+            body=body,
+            hedge=hedge,
+            raw_body=raw_body,
+            defer_log=True,
+            response_cache=response_cache,
+        )
+        resp = _provider_response_to_response(response, log_info.trace_id)
+        # Usage accounting and the log write run after the response is sent
+        resp.background = BackgroundTask(_write_pending_log, log_info)
+        return resp
+
+    except AppError as e:
+        return Response(
+            content=e.to_json(),
+            status_code=e.status_code,
+            media_type="application/json",
+        )
+    except Exception as e:
+        # Unexpected errors return 500
+        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        return ORJSONResponse(
+            content={
+                "error": {
+                    "message": "Internal server error",
+                    "type": "internal_error",
+                    "code": "internal_error",
+                }
+            },
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+async def forward(
+    request: Request,
+    api_key: CurrentApiKey,
+    service: ProxyServiceDep,
+    path: str,
+    request_protocol: str,
+    *,
+    hedge: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+) -> Response:
+    """
+    Forward a JSON proxy request
+
+    Parses the request body and delegates to forward_with_body(), keeping the
+    raw bytes so they can be forwarded without re-serialization. A body that is
+    not a JSON object is rejected with a 400 error.
+    """
+    raw_body = await request.body()
+    try:
+        body = orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        body = None
+    if not isinstance(body, dict):
+        error = AppError(
+            message="Request body must be a JSON object",
+            error_type="invalid_request_error",
+            code="invalid_json",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        return Response(
+            content=error.to_json(),
+            status_code=error.status_code,
+            media_type="application/json",
+        )
+    return await forward_with_body(
+        request,
+        api_key,
+        service,
+        path,
+        body,
+        request_protocol,
+        hedge=hedge,
+        raw_body=raw_body,
+        response_cache=response_cache,
+    )
@@ -4,16 +4,16 @@ OpenAI Proxy API
 Provides OpenAI-compatible API endpoints.
 """
 
-import json
 from typing import Any
 
-from fastapi import APIRouter, Header, Request, status
-from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 from starlette.datastructures import UploadFile
 
 from app.api.deps import CurrentApiKey, ModelServiceDep, ProxyServiceDep
+from app.api.proxy._common import forward, forward_with_body
 from app.common.errors import AppError
-from app.common.proxy_headers import sanitize_upstream_response_headers
+from app.common.response_cache import get_embeddings_cache
 
 router = APIRouter(tags=["Proxy - OpenAI"])
 
@@ -44,120 +44,12 @@ async def list_models(
             ],
         }
     except AppError as e:
-        return JSONResponse(content=e.to_dict(), status_code=e.status_code)
-
-
-async def _handle_proxy_request_with_body(
-    request: Request,
-    api_key: CurrentApiKey,
-    service: ProxyServiceDep,
-    path: str,
-    body: dict[str, Any],
-):
-    """
-    Handle generic proxy request logic with an already parsed body.
-    """
-    try:
-        headers = dict(request.headers)
-
-        # Determine if it's a streaming request
-        is_stream = body.get("stream", False)
-
-        if is_stream:
-            (
-                initial_response,
-                stream_gen,
-                log_info,
-            ) = await service.process_request_stream(
-                api_key_id=api_key.id,
-                api_key_name=api_key.key_name,
-                request_protocol="openai",
-                path=path,
-                method=request.method,
-                headers=headers,
-                body=body,
-            )
-
-            # If initial response is error, return directly
-            if not initial_response.is_success:
-                content = initial_response.body
-                if isinstance(content, (dict, list)):
-                    return JSONResponse(
-                        content=content,
-                        status_code=initial_response.status_code,
-                        headers=sanitize_upstream_response_headers(
-                            initial_response.headers
-                        ),
-                    )
-                return Response(
-                    content=content,
-                    status_code=initial_response.status_code,
-                    headers=sanitize_upstream_response_headers(
-                        initial_response.headers
-                    ),
-                )
-
-            return StreamingResponse(
-                stream_gen,
-                status_code=initial_response.status_code,
-                headers=sanitize_upstream_response_headers(initial_response.headers),
-                media_type="text/event-stream",
-            )
-
-        response, log_info = await service.process_request(
-            api_key_id=api_key.id,
-            api_key_name=api_key.key_name,
-            request_protocol="openai",
-            path=path,
-            method=request.method,
-            headers=headers,
-            body=body,
-        )
-
-        content = response.body
-        if isinstance(content, (dict, list)):
-            return JSONResponse(
-                content=content,
-                status_code=response.status_code,
-                headers=sanitize_upstream_response_headers(response.headers),
-            )
         return Response(
-            content=content,
-            status_code=response.status_code,
-            headers=sanitize_upstream_response_headers(response.headers),
+            content=e.to_json(),
+            status_code=e.status_code,
+            media_type="application/json",
         )
 
-    except AppError as e:
-        return JSONResponse(content=e.to_dict(), status_code=e.status_code)
-    except Exception as e:
-        # Unexpected errors return 500
-        import logging
-
-        logging.getLogger(__name__).error(f"Unexpected error: {str(e)}", exc_info=True)
-        return JSONResponse(
-            content={
-                "error": {
-                    "message": "Internal server error",
-                    "type": "internal_error",
-                    "code": "internal_error",
-                }
-            },
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-
-async def _handle_proxy_request(
-    request: Request,
-    api_key: CurrentApiKey,
-    service: ProxyServiceDep,
-    path: str,
-):
-    """
-    Handle generic proxy request logic
-    """
-    body = await request.json()
-    return await _handle_proxy_request_with_body(request, api_key, service, path, body)
-
 
 async def _parse_multipart_body(request: Request) -> dict[str, Any]:
     form = await request.form()
@@ -193,7 +85,7 @@ async def _handle_proxy_request_multipart(
     path: str,
 ):
     body = await _parse_multipart_body(request)
-    return await _handle_proxy_request_with_body(request, api_key, service, path, body)
+    return await forward_with_body(request, api_key, service, path, body, "openai")
 
 
 @router.post("/v1/chat/completions")
@@ -205,9 +97,7 @@ async def chat_completions(
     """
     OpenAI Chat Completions API Proxy
     """
-    return await _handle_proxy_request(
-        request, api_key, service, "/v1/chat/completions"
-    )
+    return await forward(request, api_key, service, "/v1/chat/completions", "openai")
 
 
 @router.post("/v1/completions")
@@ -219,7 +109,7 @@ async def completions(
     """
     OpenAI Completions API Proxy
     """
-    return await _handle_proxy_request(request, api_key, service, "/v1/completions")
+    return await forward(request, api_key, service, "/v1/completions", "openai")
 
 
 @router.post("/v1/embeddings")
@@ -230,8 +120,20 @@ async def embeddings(
 ):
     """
     OpenAI Embeddings API Proxy
-    """
-    return await _handle_proxy_request(request, api_key, service, "/v1/embeddings")
+
+    Successful responses are served from the embeddings cache when
+    EMBEDDING_CACHE_TTL is set; cache hits are logged like upstream responses.
+    """
+    # Embeddings are idempotent, so slow attempts may be hedged (HEDGE_DELAY_MS)
+    return await forward(
+        request,
+        api_key,
+        service,
+        "/v1/embeddings",
+        "openai",
+        hedge=True,
+        response_cache=get_embeddings_cache(),
+    )
 
 
 @router.post("/v1/audio/speech")
@@ -243,7 +145,7 @@ async def audio_speech(
     """
     OpenAI Audio Speech API Proxy
     """
-    return await _handle_proxy_request(request, api_key, service, "/v1/audio/speech")
+    return await forward(request, api_key, service, "/v1/audio/speech", "openai")
 
 
 @router.post("/v1/audio/transcriptions")
@@ -283,9 +185,7 @@ async def images_generations(
     """
     OpenAI Images Generations API Proxy
     """
-    return await _handle_proxy_request(
-        request, api_key, service, "/v1/images/generations"
-    )
+    return await forward(request, api_key, service, "/v1/images/generations", "openai")
 
 
 @router.post("/v1/responses")
@@ -300,102 +200,7 @@ async def responses(
     Uses openai_responses protocol directly, letting the protocol conversion
     system handle any necessary transformations based on the target provider.
     """
-    return await _handle_proxy_request_openai_responses(
-        request, api_key, service, "/v1/responses"
+    return await forward(
+        request, api_key, service, "/v1/responses", "openai_responses"
     )
 
-
-async def _handle_proxy_request_openai_responses(
-    request: Request,
-    api_key: CurrentApiKey,
-    service: ProxyServiceDep,
-    path: str,
-):
-    """
-    Handle proxy request with openai_responses protocol.
-    """
-    try:
-        body = await request.json()
-        headers = dict(request.headers)
-
-        is_stream = body.get("stream", False)
-
-        if is_stream:
-            (
-                initial_response,
-                stream_gen,
-                log_info,
-            ) = await service.process_request_stream(
-                api_key_id=api_key.id,
-                api_key_name=api_key.key_name,
-                request_protocol="openai_responses",
-                path=path,
-                method=request.method,
-                headers=headers,
-                body=body,
-            )
-
-            if not initial_response.is_success:
-                content = initial_response.body
-                if isinstance(content, (dict, list)):
-                    return JSONResponse(
-                        content=content,
-                        status_code=initial_response.status_code,
-                        headers=sanitize_upstream_response_headers(
-                            initial_response.headers
-                        ),
-                    )
-                return Response(
-                    content=content,
-                    status_code=initial_response.status_code,
-                    headers=sanitize_upstream_response_headers(
-                        initial_response.headers
-                    ),
-                )
-
-            return StreamingResponse(
-                stream_gen,
-                status_code=initial_response.status_code,
-                headers=sanitize_upstream_response_headers(initial_response.headers),
-                media_type="text/event-stream",
-            )
-
-        response, log_info = await service.process_request(
-            api_key_id=api_key.id,
-            api_key_name=api_key.key_name,
-            request_protocol="openai_responses",
-            path=path,
-            method=request.method,
-            headers=headers,
-            body=body,
-        )
-
-        content = response.body
-        if isinstance(content, (dict, list)):
-            return JSONResponse(
-                content=content,
-                status_code=response.status_code,
-                headers=sanitize_upstream_response_headers(response.headers),
-            )
-        return Response(
-            content=content,
-            status_code=response.status_code,
-            headers=sanitize_upstream_response_headers(response.headers),
-        )
-
-    except AppError as e:
-        return JSONResponse(content=e.to_dict(), status_code=e.status_code)
-    except Exception as e:
-        import logging
-
-        logging.getLogger(__name__).error(f"Unexpected error: {str(e)}", exc_info=True)
-        return JSONResponse(
-            content={
-                "error": {
-                    "message": "Internal server error",
-                    "type": "internal_error",
-                    "code": "internal_error",
-                }
-            },
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
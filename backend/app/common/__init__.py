@@ -9,6 +9,7 @@ from app.common.errors import (
     ConflictError,
     ValidationError,
     UpstreamError,
+    UpstreamOverloadedError,
     ServiceError,
 )
 from app.common.sanitizer import sanitize_authorization, sanitize_headers
@@ -24,6 +25,7 @@ __all__ = [
     "ConflictError",
     "ValidationError",
     "UpstreamError",
+    "UpstreamOverloadedError",
     "ServiceError",
     # 工具函数
     "sanitize_authorization",
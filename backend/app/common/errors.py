@@ -6,6 +6,8 @@ Defines custom exception classes used in the application for unified error handl
 
 from typing import Any, Optional
 
+import orjson
+
 
 class AppError(Exception):
     """
@@ -38,24 +40,36 @@ class AppError(Exception):
         self.code = code
         self.details = details or {}
         self.status_code = status_code
+        # Attributes are fixed after construction, so the response payload is built once
+        error: dict[str, Any] = {
+            "message": message,
+            "type": error_type,
+            "code": code,
+        }
+        if self.details:
+            error["details"] = self.details
+        self._payload: dict[str, Any] = {"error": error}
+        self._json: Optional[bytes] = None
     
     def to_dict(self) -> dict[str, Any]:
         """
         Convert to dictionary format (for API response)
         
         Returns:
-            dict: Error information dictionary
+            dict: Error information dictionary (shared, do not mutate)
         """
-        result = {
-            "error": {
-                "message": self.message,
-                "type": self.error_type,
-                "code": self.code,
-            }
-        }
-        if self.details:
-            result["error"]["details"] = self.details
-        return result
+        return self._payload
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON bytes (for API response)
+        
+        Returns:
+            bytes: Encoded error information, cached after the first call
+        """
+        if self._json is None:
+            self._json = orjson.dumps(self._payload)
+        return self._json
 
 
 class AuthenticationError(AppError):
@@ -169,6 +183,30 @@ class UpstreamError(AppError):
         )
 
 
+class UpstreamOverloadedError(AppError):
+    """
+    Upstream Overloaded Error
+    
+    Raised when too many requests are already queued for an upstream provider.
+    """
+    
+    def __init__(
+        self,
+        message: str = "Too many requests queued for upstream provider",
+        code: str = "upstream_overloaded",
+        details: Optional[dict[str, Any]] = None,
+        retry_after: int = 1,
+    ):
+        super().__init__(
+            message=message,
+            error_type="rate_limit_error",
+            code=code,
+            details=details,
+            status_code=429,
+        )
+        self.retry_after = retry_after
+
+
 class ServiceError(AppError):
     """
     Service Error
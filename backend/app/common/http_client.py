@@ -2,115 +2,358 @@
 HTTP Client Wrapper Module
 
 Provides a unified asynchronous HTTP client for communicating with upstream providers.
+
+Upstream connections are served from a process-wide pool of ``httpx.AsyncClient``
+instances (one per proxy/timeout combination), so TCP/TLS connections are kept alive
+and reused across requests instead of being re-established per call.
 """
 
-from typing import Any, AsyncGenerator, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
 
 import httpx
 
+from app.common.errors import UpstreamOverloadedError
 from app.config import get_settings
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Shared clients keyed by (proxy_url, timeout)
+_shared_clients: dict[tuple[Optional[str], float], httpx.AsyncClient] = {}
+
+
+class UpstreamBulkhead:
+    """
+    Per-Upstream Concurrency Limiter
+
+    Bounds in-flight requests to one upstream. Excess requests wait in the gateway
+    instead of opening more sockets; once the wait queue is full, new requests are
+    rejected immediately so memory stays bounded under bursts.
+    """
+
+    def __init__(self, max_concurrency: int, max_queued: int):
+        """
+        Initialize Bulkhead
+
+        Args:
+            max_concurrency: Max concurrent requests
+            max_queued: Max requests waiting for a slot
+        """
+        self.max_queued = max_queued
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._waiting = 0
+        self._active = 0
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot"""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for a slot"""
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot for the duration of a block
+
+        Raises:
+            UpstreamOverloadedError: When the wait queue is full
+        """
+        if self._semaphore.locked() and self._waiting >= self.max_queued:
+            raise UpstreamOverloadedError()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._active += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+
+
+# Bulkheads keyed by upstream base URL
+_bulkheads: dict[str, UpstreamBulkhead] = {}
+
+
+def get_bulkhead(upstream: str) -> Optional[UpstreamBulkhead]:
+    """
+    Get the concurrency limiter for an upstream
+
+    Args:
+        upstream: Upstream base URL
+
+    Returns:
+        Optional[UpstreamBulkhead]: Limiter, or None when limiting is disabled
+    """
+    bulkhead = _bulkheads.get(upstream)
+    if bulkhead is None:
+        settings = get_settings()
+        if settings.UPSTREAM_MAX_CONCURRENCY <= 0:
+            return None
+        bulkhead = _bulkheads.setdefault(
+            upstream,
+            UpstreamBulkhead(
+                settings.UPSTREAM_MAX_CONCURRENCY, settings.UPSTREAM_MAX_QUEUED
+            ),
+        )
+    return bulkhead
+
+
+def get_upstream_load(upstream: str) -> tuple[int, int]:
+    """
+    Get the current load of an upstream
+
+    Args:
+        upstream: Upstream base URL
+
+    Returns:
+        tuple[int, int]: (In-flight requests, Waiting requests); zeros when the
+            upstream has not been used or limiting is disabled
+    """
+    bulkhead = _bulkheads.get(upstream.rstrip("/"))
+    if bulkhead is None:
+        return 0, 0
+    return bulkhead.active, bulkhead.waiting
+
+
+async def get_shared_client(
+    proxy_url: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client for a proxy/timeout combination
+
+    The client is created on first use and kept open until close_shared_clients()
+    is called on application shutdown. HTTP/2 is enabled when the optional ``h2``
+    package is installed.
+
+    Args:
+        proxy_url: Outbound proxy URL, None for direct connections
+        timeout: Request timeout (seconds), defaults to configuration
+
+    Returns:
+        httpx.AsyncClient: Shared, already opened client
+    """
+    settings = get_settings()
+    key = (proxy_url, float(timeout or settings.HTTP_TIMEOUT))
+    client = _shared_clients.get(key)
+    if client is not None:
+        return client
+
+    new_client = await httpx.AsyncClient(
+        timeout=key[1],
+        proxy=proxy_url,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    ).__aenter__()
+
+    # Another task may have created the client while we were awaiting
+    client = _shared_clients.setdefault(key, new_client)
+    if client is not new_client:
+        await new_client.__aexit__(None, None, None)
+    return client
+
+
+@asynccontextmanager
+async def shared_client(
+    proxy_url: Optional[str] = None,
+    timeout: Optional[float] = None,
+    upstream: Optional[str] = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Borrow the pooled HTTP client for the duration of a block
+
+    Unlike ``async with httpx.AsyncClient()``, leaving the block does not close the
+    client, so its connections stay available to subsequent requests.
+
+    Args:
+        proxy_url: Outbound proxy URL
+        timeout: Request timeout (seconds)
+        upstream: Upstream base URL; when given, a concurrency slot for that
+            upstream is held until the block exits
+
+    Raises:
+        UpstreamOverloadedError: When the upstream's wait queue is full
+    """
+    client = await get_shared_client(proxy_url, timeout)
+    bulkhead = get_bulkhead(upstream) if upstream else None
+    if bulkhead is None:
+        yield client
+        return
+    async with bulkhead.slot():
+        yield client
+
+
+async def close_shared_clients() -> None:
+    """Close all pooled HTTP clients (called on application shutdown)"""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.__aexit__(None, None, None)
+
+
+def reset_shared_clients() -> None:
+    """Forget pooled clients and limiters without closing them (useful for testing)"""
+    _shared_clients.clear()
+    _bulkheads.clear()
+
+
+def iter_response_bytes(response: httpx.Response) -> AsyncIterator[bytes]:
+    """
+    Iterate a streamed response body with as little copying as possible
+
+    Identity-encoded ``text/event-stream`` bodies are read with ``aiter_raw()``,
+    skipping httpx's decoder and its internal buffer; anything else (compressed
+    or non-SSE) goes through ``aiter_bytes()`` so content-encoding is still undone.
+
+    Args:
+        response: Streaming httpx response
+
+    Returns:
+        AsyncIterator[bytes]: Body chunks
+    """
+    headers = response.headers
+    if "text/event-stream" in headers.get("content-type", "") and headers.get(
+        "content-encoding", "identity"
+    ) in ("", "identity"):
+        return response.aiter_raw()
+    return response.aiter_bytes()
+
 
 class HttpClient:
     """
     Asynchronous HTTP Client Wrapper
-    
-    Wraps httpx.AsyncClient, providing unified request methods and timeout configuration.
+
+    Holds per-upstream settings (base URL, default headers, timeout) and delegates
+    requests to the shared connection pool.
     Supports normal requests and streaming requests.
     """
-    
+
     def __init__(
         self,
         base_url: str = "",
         timeout: Optional[int] = None,
         headers: Optional[dict[str, str]] = None,
+        proxy_url: Optional[str] = None,
     ):
         """
         Initialize HTTP Client
-        
+
         Args:
             base_url: Base URL
             timeout: Request timeout (seconds), defaults to configuration
             headers: Default request headers
+            proxy_url: Outbound proxy URL
         """
         settings = get_settings()
-        self.base_url = base_url
+        self.base_url = base_url.rstrip("/")
         self.timeout = timeout or settings.HTTP_TIMEOUT
         self.default_headers = headers or {}
-        self._client: Optional[httpx.AsyncClient] = None
-    
+        self.proxy_url = proxy_url
+
     async def _get_client(self) -> httpx.AsyncClient:
         """
-        Get or create HTTP client instance
-        
+        Get the shared HTTP client instance
+
         Returns:
             httpx.AsyncClient: HTTP client instance
         """
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-                headers=self.default_headers,
-            )
-        return self._client
-    
+        return await get_shared_client(self.proxy_url, self.timeout)
+
+    def _build_url(self, url: str) -> str:
+        """Resolve a URL relative to base_url"""
+        if not self.base_url or url.startswith(("http://", "https://")):
+            return url
+        return f"{self.base_url}/{url.lstrip('/')}"
+
+    def _merge_headers(self, headers: Optional[dict[str, str]]) -> dict[str, str]:
+        """Merge per-request headers over the default headers"""
+        if not headers:
+            return dict(self.default_headers)
+        return {**self.default_headers, **headers}
+
     async def close(self) -> None:
-        """Close HTTP Client"""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
-    
+        """Close HTTP Client (connections are owned by the shared pool)"""
+        return None
+
     async def request(
         self,
         method: str,
         url: str,
         headers: Optional[dict[str, str]] = None,
         json: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
         Send HTTP Request
-        
+
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Request URL (relative to base_url)
             headers: Request headers
             json: JSON request body
+            content: Pre-serialized request body (takes precedence over json)
             **kwargs: Other httpx parameters
-        
+
         Returns:
             httpx.Response: HTTP response
         """
-        client = await self._get_client()
-        return await client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            **kwargs,
-        )
-    
+        if content is not None:
+            kwargs["content"] = content
+        else:
+            kwargs["json"] = json
+        async with shared_client(
+            self.proxy_url, self.timeout, upstream=self.base_url or None
+        ) as client:
+            return await client.request(
+                method=method,
+                url=self._build_url(url),
+                headers=self._merge_headers(headers),
+                **kwargs,
+            )
+
     async def post(
         self,
         url: str,
         headers: Optional[dict[str, str]] = None,
         json: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
         Send POST Request
-        
+
         Args:
             url: Request URL
             headers: Request headers
             json: JSON request body
+            content: Pre-serialized request body (takes precedence over json)
             **kwargs: Other parameters
-        
+
         Returns:
             httpx.Response: HTTP response
         """
-        return await self.request("POST", url, headers=headers, json=json, **kwargs)
-    
+        return await self.request(
+            "POST", url, headers=headers, json=json, content=content, **kwargs
+        )
+
     async def stream_request(
         self,
         method: str,
@@ -121,27 +364,29 @@ class HttpClient:
     ) -> AsyncGenerator[bytes, None]:
         """
         Send Streaming Request
-        
+
         Args:
             method: HTTP method
             url: Request URL
             headers: Request headers
             json: JSON request body
             **kwargs: Other parameters
-        
+
         Yields:
             bytes: Response data chunk
         """
-        client = await self._get_client()
-        async with client.stream(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            **kwargs,
-        ) as response:
-            async for chunk in response.aiter_bytes():
-                yield chunk
+        async with shared_client(
+            self.proxy_url, self.timeout, upstream=self.base_url or None
+        ) as client:
+            async with client.stream(
+                method=method,
+                url=self._build_url(url),
+                headers=self._merge_headers(headers),
+                json=json,
+                **kwargs,
+            ) as response:
+                async for chunk in iter_response_bytes(response):
+                    yield chunk
 
 
 async def create_client(
@@ -151,17 +396,17 @@ async def create_client(
 ) -> HttpClient:
     """
     Create configured HTTP client
-    
+
     Args:
         base_url: Base URL
         api_key: API Key (used for Authorization header)
         timeout: Timeout duration
-    
+
     Returns:
         HttpClient: Configured client instance
     """
     headers = {}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
-    
-    return HttpClient(base_url=base_url, timeout=timeout, headers=headers)
\ No newline at end of file
+
+    return HttpClient(base_url=base_url, timeout=timeout, headers=headers)
@@ -8,11 +8,12 @@ OpenAI Responses API (`/v1/responses`) and Chat Completions so clients can use t
 
 from __future__ import annotations
 
-import json
 import time
 import uuid
 from typing import Any, AsyncGenerator, Optional
 
+import orjson
+
 from app.common.stream_usage import SSEDecoder
 from app.common.token_counter import get_token_counter
 
@@ -472,12 +473,14 @@ async def chat_completions_sse_to_responses_sse(
 
     msg_id = _new_id("msg")
 
+    created_at = int(time.time())
+
     created = {
         "type": "response.created",
         "response": {
             "id": resp_id,
             "object": "response",
-            "created_at": int(time.time()),
+            "created_at": created_at,
             "model": model,
             "status": "in_progress",
             "output": [
@@ -491,9 +494,7 @@ async def chat_completions_sse_to_responses_sse(
         },
     }
 
-    yield f"event: response.created\ndata: {json.dumps(created, ensure_ascii=False)}\n\n".encode(
-        "utf-8"
-    )
+    yield b"event: response.created\ndata: " + orjson.dumps(created) + b"\n\n"
 
     text_parts: list[str] = []
 
@@ -502,17 +503,17 @@ async def chat_completions_sse_to_responses_sse(
     final_usage = None
 
     async for chunk in upstream:
-        for payload in decoder.feed(chunk):
+        for payload in decoder.feed_bytes(chunk):
             if not payload:
                 continue
 
-            if payload.strip() == "[DONE]":
+            if payload.strip() == b"[DONE]":
                 saw_done = True
 
                 break
 
             try:
-                data = json.loads(payload)
+                data = orjson.loads(payload)
 
             except Exception:
                 continue
@@ -548,8 +549,10 @@ async def chat_completions_sse_to_responses_sse(
                         "item_id": msg_id,
                     }
 
-                    yield f"event: response.output_text.delta\ndata: {json.dumps(evt, ensure_ascii=False)}\n\n".encode(
-                        "utf-8"
+                    yield (
+                        b"event: response.output_text.delta\ndata: "
+                        + orjson.dumps(evt)
+                        + b"\n\n"
                     )
 
         if saw_done:
@@ -587,7 +590,7 @@ async def chat_completions_sse_to_responses_sse(
         "response": {
             "id": resp_id,
             "object": "response",
-            "created_at": int(time.time()),
+            "created_at": created_at,
             "model": model,
             "status": "completed",
             "output": [
@@ -602,9 +605,7 @@ async def chat_completions_sse_to_responses_sse(
         },
     }
 
-    yield f"event: response.completed\ndata: {json.dumps(completed, ensure_ascii=False)}\n\n".encode(
-        "utf-8"
-    )
+    yield b"event: response.completed\ndata: " + orjson.dumps(completed) + b"\n\n"
 
 
 async def responses_sse_to_chat_completions_sse(
@@ -618,6 +619,7 @@ async def responses_sse_to_chat_completions_sse(
     """
     decoder = SSEDecoder()
     resp_id = response_id or _new_id("chatcmpl")
+    created = int(time.time())
     sent_role = False
     done = False
 
@@ -627,17 +629,17 @@ async def responses_sse_to_chat_completions_sse(
     next_tool_index = 0
 
     async for chunk in upstream:
-        for payload in decoder.feed(chunk):
+        for payload in decoder.feed_bytes(chunk):
             if not payload:
                 continue
-            if payload.strip() == "[DONE]":
+            if payload.strip() == b"[DONE]":
                 if not done:
                     yield b"data: [DONE]\n\n"
                     done = True
                 continue
 
             try:
-                data = json.loads(payload)
+                data = orjson.loads(payload)
             except Exception:
                 continue
 
@@ -681,15 +683,13 @@ async def responses_sse_to_chat_completions_sse(
                     payload_obj = {
                         "id": resp_id,
                         "object": "chat.completion.chunk",
-                        "created": int(time.time()),
+                        "created": created,
                         "model": model,
                         "choices": [
                             {"index": 0, "delta": delta, "finish_reason": None}
                         ],
                     }
-                    yield f"data: {json.dumps(payload_obj, ensure_ascii=False)}\n\n".encode(
-                        "utf-8"
-                    )
+                    yield b"data: " + orjson.dumps(payload_obj) + b"\n\n"
                 continue
 
             if event_type == "response.function_call_arguments.delta":
@@ -709,15 +709,13 @@ async def responses_sse_to_chat_completions_sse(
                     payload_obj = {
                         "id": resp_id,
                         "object": "chat.completion.chunk",
-                        "created": int(time.time()),
+                        "created": created,
                         "model": model,
                         "choices": [
                             {"index": 0, "delta": delta, "finish_reason": None}
                         ],
                     }
-                    yield f"data: {json.dumps(payload_obj, ensure_ascii=False)}\n\n".encode(
-                        "utf-8"
-                    )
+                    yield b"data: " + orjson.dumps(payload_obj) + b"\n\n"
                 continue
 
             if event_type == "response.output_text.delta":
@@ -730,15 +728,13 @@ async def responses_sse_to_chat_completions_sse(
                     payload_obj = {
                         "id": resp_id,
                         "object": "chat.completion.chunk",
-                        "created": int(time.time()),
+                        "created": created,
                         "model": model,
                         "choices": [
                             {"index": 0, "delta": delta, "finish_reason": None}
                         ],
                     }
-                    yield f"data: {json.dumps(payload_obj, ensure_ascii=False)}\n\n".encode(
-                        "utf-8"
-                    )
+                    yield b"data: " + orjson.dumps(payload_obj) + b"\n\n"
                 continue
 
             if event_type == "response.output_item.done":
@@ -762,15 +758,13 @@ async def responses_sse_to_chat_completions_sse(
                 payload_obj = {
                     "id": resp_id,
                     "object": "chat.completion.chunk",
-                    "created": int(time.time()),
+                    "created": created,
                     "model": model,
                     "choices": [
                         {"index": 0, "delta": {}, "finish_reason": finish_reason}
                     ],
                 }
-                yield f"data: {json.dumps(payload_obj, ensure_ascii=False)}\n\n".encode(
-                    "utf-8"
-                )
+                yield b"data: " + orjson.dumps(payload_obj) + b"\n\n"
                 if not done:
                     yield b"data: [DONE]\n\n"
                     done = True
@@ -22,20 +22,25 @@ class Protocol(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "Protocol":
         """Convert string to Protocol enum with normalization."""
-        normalized = value.lower().strip()
-        mapping = {
-            "openai": cls.OPENAI,
-            "openai_chat": cls.OPENAI,
-            "openai_classic": cls.OPENAI,
-            "openai_responses": cls.OPENAI_RESPONSES,
-            "anthropic": cls.ANTHROPIC,
-            "anthropic_messages": cls.ANTHROPIC,
-        }
-        if normalized in mapping:
-            return mapping[normalized]
+        protocol = _PROTOCOL_ALIASES.get(value)
+        if protocol is None:
+            protocol = _PROTOCOL_ALIASES.get(value.lower().strip())
+        if protocol is not None:
+            return protocol
         raise ValueError(f"Unknown protocol: {value}")
 
 
+# Alias table built once; canonical names hit on the first lookup
+_PROTOCOL_ALIASES: Dict[str, Protocol] = {
+    "openai": Protocol.OPENAI,
+    "openai_chat": Protocol.OPENAI,
+    "openai_classic": Protocol.OPENAI,
+    "openai_responses": Protocol.OPENAI_RESPONSES,
+    "anthropic": Protocol.ANTHROPIC,
+    "anthropic_messages": Protocol.ANTHROPIC,
+}
+
+
 @dataclass
 class ConversionContext:
     """Context for protocol conversion operations."""
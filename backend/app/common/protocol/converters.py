@@ -7,13 +7,15 @@ Intermediate Representation (IR).
 
 from __future__ import annotations
 
-import copy
-import json
 import logging
 import time
 import uuid
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
+import orjson
+
+from app.common.stream_usage import SSEDecoder
+
 from .base import (
     ConversionResult,
     IRequestConverter,
@@ -85,7 +87,8 @@ def _normalize_openai_tooling_fields(body: Dict[str, Any]) -> Dict[str, Any]:
     - functions -> tools
     - function_call -> tool_choice
     """
-    out = copy.deepcopy(body)
+    # Only top-level keys are replaced, so a shallow copy keeps the caller's body intact
+    out = dict(body)
 
     # Legacy: functions + function_call -> tools + tool_choice
     if "tools" not in out and isinstance(out.get("functions"), list):
@@ -226,7 +229,7 @@ class SDKRequestConverter(IRequestConverter):
         We need to ensure the appropriate field exists for the source protocol
         so the SDK decoder can read it properly.
         """
-        body = copy.deepcopy(body)
+        body = dict(body)
 
         if self._source == Protocol.OPENAI_RESPONSES:
             # For OpenAI Responses, ensure max_output_tokens is set
@@ -256,7 +259,7 @@ class SDKRequestConverter(IRequestConverter):
         Some OpenAI-compatible providers do not support these parameters
         and will return an error like "Unknown parameter: 'include_usage'".
         """
-        body = copy.deepcopy(body)
+        body = dict(body)
 
         # Remove stream_options (contains include_usage)
         if "stream_options" in body:
@@ -419,24 +422,28 @@ class SDKStreamConverter(IStreamConverter):
         model: str,
     ) -> AsyncGenerator[bytes, None]:
         """Convert Anthropic stream to OpenAI format."""
-        decoder = _SSEDecoder()
+        decoder = SSEDecoder()
         response_id: Optional[str] = None
+        # Built on first output, once message_start has supplied the response id
+        frames: Optional[_OpenAIChunkFrames] = None
         sent_role = False
         current_tool_id: Optional[str] = None
         current_tool_name: Optional[str] = None
         current_tool_index = 0
         done = False
         final_usage: Optional[Dict[str, Any]] = None
+        # Frames produced from one upstream chunk are sent as a single write
+        out: List[bytes] = []
 
         async for chunk in upstream:
-            for payload in decoder.feed(chunk):
+            for payload in decoder.feed_bytes(chunk):
                 if not payload:
                     continue
-                if payload.strip() == "[DONE]":
+                if payload.strip() == b"[DONE]":
                     continue
 
                 try:
-                    data = json.loads(payload)
+                    data = orjson.loads(payload)
                 except Exception:
                     continue
 
@@ -465,15 +472,12 @@ class SDKStreamConverter(IStreamConverter):
                         if block_type == "text":
                             text = content_block.get("text") or ""
                             if text:
-                                delta: Dict[str, Any] = {"content": text}
-                                if not sent_role:
-                                    delta["role"] = "assistant"
-                                    sent_role = True
-                                yield _encode_sse_json(
-                                    self._create_openai_chunk(
-                                        response_id, model, delta, None
-                                    )
+                                if frames is None:
+                                    frames = _OpenAIChunkFrames(response_id, model)
+                                out.append(
+                                    frames.content(text, with_role=not sent_role)
                                 )
+                                sent_role = True
                         elif block_type == "tool_use":
                             current_tool_id = content_block.get("id")
                             current_tool_name = content_block.get("name")
@@ -481,12 +485,12 @@ class SDKStreamConverter(IStreamConverter):
                                 current_tool_index = data["index"]
                             tool_args = content_block.get("input")
                             if isinstance(tool_args, dict):
-                                arguments = json.dumps(tool_args, ensure_ascii=False)
+                                arguments = orjson.dumps(tool_args).decode()
                             elif isinstance(tool_args, str):
                                 arguments = tool_args
                             else:
                                 arguments = "{}"
-                            delta = {
+                            delta: Dict[str, Any] = {
                                 "tool_calls": [
                                     {
                                         "index": current_tool_index,
@@ -502,11 +506,9 @@ class SDKStreamConverter(IStreamConverter):
                             if not sent_role:
                                 delta["role"] = "assistant"
                                 sent_role = True
-                            yield _encode_sse_json(
-                                self._create_openai_chunk(
-                                    response_id, model, delta, None
-                                )
-                            )
+                            if frames is None:
+                                frames = _OpenAIChunkFrames(response_id, model)
+                            out.append(frames.chunk(delta))
                     continue
 
                 if event_type == "content_block_delta":
@@ -516,15 +518,12 @@ class SDKStreamConverter(IStreamConverter):
                         if delta_type == "text_delta":
                             text = delta_obj.get("text") or ""
                             if text:
-                                delta = {"content": text}
-                                if not sent_role:
-                                    delta["role"] = "assistant"
-                                    sent_role = True
-                                yield _encode_sse_json(
-                                    self._create_openai_chunk(
-                                        response_id, model, delta, None
-                                    )
+                                if frames is None:
+                                    frames = _OpenAIChunkFrames(response_id, model)
+                                out.append(
+                                    frames.content(text, with_role=not sent_role)
                                 )
+                                sent_role = True
                         elif delta_type == "input_json_delta":
                             partial_json = delta_obj.get("partial_json") or ""
                             if partial_json:
@@ -544,11 +543,9 @@ class SDKStreamConverter(IStreamConverter):
                                 if not sent_role:
                                     delta["role"] = "assistant"
                                     sent_role = True
-                                yield _encode_sse_json(
-                                    self._create_openai_chunk(
-                                        response_id, model, delta, None
-                                    )
-                                )
+                                if frames is None:
+                                    frames = _OpenAIChunkFrames(response_id, model)
+                                out.append(frames.chunk(delta))
                     continue
 
                 if event_type == "message_delta":
@@ -577,34 +574,29 @@ class SDKStreamConverter(IStreamConverter):
                                 ),
                             }
 
-                    yield _encode_sse_json(
-                        self._create_openai_chunk(response_id, model, {}, finish_reason)
-                    )
+                    if frames is None:
+                        frames = _OpenAIChunkFrames(response_id, model)
+                    out.append(frames.chunk({}, finish_reason))
 
                     # Emit usage chunk before [DONE] (OpenAI format with empty choices)
                     if final_usage:
-                        usage_chunk = {
-                            "id": response_id or f"chatcmpl-{uuid.uuid4().hex}",
-                            "object": "chat.completion.chunk",
-                            "created": int(time.time()),
-                            "model": model,
-                            "choices": [],
-                            "usage": final_usage,
-                        }
-                        yield _encode_sse_json(usage_chunk)
+                        out.append(frames.usage(final_usage))
 
-                    yield _encode_sse_data("[DONE]")
+                    out.append(_SSE_DONE)
                     done = True
                     continue
 
                 if event_type == "message_stop":
                     if not done:
-                        yield _encode_sse_data("[DONE]")
+                        out.append(_SSE_DONE)
                         done = True
                     continue
+            if out:
+                yield b"".join(out)
+                out.clear()
 
         if not done:
-            yield _encode_sse_data("[DONE]")
+            yield _SSE_DONE
 
     async def _convert_openai_to_anthropic(
         self,
@@ -612,7 +604,7 @@ class SDKStreamConverter(IStreamConverter):
         model: str,
     ) -> AsyncGenerator[bytes, None]:
         """Convert OpenAI stream to Anthropic format."""
-        decoder = _SSEDecoder()
+        decoder = SSEDecoder()
         sent_message_start = False
         sent_message_stop = False
 
@@ -623,35 +615,39 @@ class SDKStreamConverter(IStreamConverter):
         # OpenAI tool index -> Anthropic block index mapping is implicit
         # We track the current OpenAI tool index being processed to detect switches
         current_openai_tool_index: Optional[int] = None
+        # Frames produced from one upstream chunk are sent as a single write
+        out: List[bytes] = []
 
         async for chunk in upstream:
-            for payload in decoder.feed(chunk):
+            for payload in decoder.feed_bytes(chunk):
                 if not payload:
                     continue
-                if payload.strip() == "[DONE]":
+                if payload.strip() == b"[DONE]":
                     continue
 
                 if not sent_message_start:
                     sent_message_start = True
-                    yield _encode_sse_json(
-                        {
-                            "type": "message_start",
-                            "message": {
-                                "id": f"msg_{uuid.uuid4().hex}",
-                                "type": "message",
-                                "role": "assistant",
-                                "content": [],
-                                "model": model,
-                                "stop_reason": None,
-                                "stop_sequence": None,
-                                "usage": {"input_tokens": 0, "output_tokens": 0},
+                    out.append(
+                        _encode_sse_json(
+                            {
+                                "type": "message_start",
+                                "message": {
+                                    "id": f"msg_{uuid.uuid4().hex}",
+                                    "type": "message",
+                                    "role": "assistant",
+                                    "content": [],
+                                    "model": model,
+                                    "stop_reason": None,
+                                    "stop_sequence": None,
+                                    "usage": {"input_tokens": 0, "output_tokens": 0},
+                                },
                             },
-                        },
-                        event="message_start",
+                            event="message_start",
+                        )
                     )
 
                 try:
-                    data = json.loads(payload)
+                    data = orjson.loads(payload)
                 except Exception:
                     continue
 
@@ -670,34 +666,25 @@ class SDKStreamConverter(IStreamConverter):
                     if current_block_type != "text":
                         if current_block_type is not None:
                             # Close previous block
-                            yield _encode_sse_json(
+                            out.append(_encode_anthropic_block_stop(current_block_index))
+                            current_block_index += 1
+
+                        # Start new text block
+                        out.append(
+                            _encode_sse_json(
                                 {
-                                    "type": "content_block_stop",
+                                    "type": "content_block_start",
                                     "index": current_block_index,
+                                    "content_block": {"type": "text", "text": ""},
                                 },
-                                event="content_block_stop",
+                                event="content_block_start",
                             )
-                            current_block_index += 1
-
-                        # Start new text block
-                        yield _encode_sse_json(
-                            {
-                                "type": "content_block_start",
-                                "index": current_block_index,
-                                "content_block": {"type": "text", "text": ""},
-                            },
-                            event="content_block_start",
                         )
                         current_block_type = "text"
                         current_openai_tool_index = None
 
-                    yield _encode_sse_json(
-                        {
-                            "type": "content_block_delta",
-                            "index": current_block_index,
-                            "delta": {"type": "text_delta", "text": content},
-                        },
-                        event="content_block_delta",
+                    out.append(
+                        _encode_anthropic_text_delta(current_block_index, content)
                     )
 
                 # Handle Tool Calls
@@ -705,6 +692,7 @@ class SDKStreamConverter(IStreamConverter):
                 if tool_calls:
                     for tool_call in tool_calls:
                         idx = tool_call.get("index")
+                        function = tool_call.get("function") or {}
 
                         # Check if we switched to a new tool call or from text
                         if (
@@ -713,81 +701,70 @@ class SDKStreamConverter(IStreamConverter):
                         ):
                             if current_block_type is not None:
                                 # Close previous block
-                                yield _encode_sse_json(
-                                    {
-                                        "type": "content_block_stop",
-                                        "index": current_block_index,
-                                    },
-                                    event="content_block_stop",
+                                out.append(
+                                    _encode_anthropic_block_stop(current_block_index)
                                 )
                                 current_block_index += 1
 
                             # Start new tool block
                             t_id = tool_call.get("id", "")
-                            t_name = tool_call.get("function", {}).get("name", "")
+                            t_name = function.get("name", "")
 
-                            yield _encode_sse_json(
-                                {
-                                    "type": "content_block_start",
-                                    "index": current_block_index,
-                                    "content_block": {
-                                        "type": "tool_use",
-                                        "id": t_id,
-                                        "name": t_name,
-                                        "input": {},  # Empty input for now
+                            out.append(
+                                _encode_sse_json(
+                                    {
+                                        "type": "content_block_start",
+                                        "index": current_block_index,
+                                        "content_block": {
+                                            "type": "tool_use",
+                                            "id": t_id,
+                                            "name": t_name,
+                                            "input": {},  # Empty input for now
+                                        },
                                     },
-                                },
-                                event="content_block_start",
+                                    event="content_block_start",
+                                )
                             )
                             current_block_type = "tool_use"
                             current_openai_tool_index = idx
 
                         # Handle arguments
-                        args = tool_call.get("function", {}).get("arguments")
+                        args = function.get("arguments")
                         if args:
-                            yield _encode_sse_json(
-                                {
-                                    "type": "content_block_delta",
-                                    "index": current_block_index,
-                                    "delta": {
-                                        "type": "input_json_delta",
-                                        "partial_json": args,
-                                    },
-                                },
-                                event="content_block_delta",
+                            out.append(
+                                _encode_anthropic_input_json_delta(
+                                    current_block_index, args
+                                )
                             )
 
                 # Handle Finish Reason
                 if finish_reason:
                     # Close any open block
                     if current_block_type is not None:
-                        yield _encode_sse_json(
+                        out.append(_encode_anthropic_block_stop(current_block_index))
+
+                    stop_reason = _map_openai_to_anthropic_finish_reason(finish_reason)
+                    out.append(
+                        _encode_sse_json(
                             {
-                                "type": "content_block_stop",
-                                "index": current_block_index,
+                                "type": "message_delta",
+                                "delta": {"stop_reason": stop_reason},
+                                "usage": {"output_tokens": 0},
                             },
-                            event="content_block_stop",
+                            event="message_delta",
                         )
-
-                    stop_reason = _map_openai_to_anthropic_finish_reason(finish_reason)
-                    yield _encode_sse_json(
-                        {
-                            "type": "message_delta",
-                            "delta": {"stop_reason": stop_reason},
-                            "usage": {"output_tokens": 0},
-                        },
-                        event="message_delta",
                     )
 
                     if not sent_message_stop:
                         sent_message_stop = True
-                        yield _encode_sse_json(
-                            {"type": "message_stop"}, event="message_stop"
-                        )
+                        out.append(_MESSAGE_STOP_FRAME)
+            if out:
+                yield b"".join(out)
+                out.clear()
 
         if not sent_message_stop:
             sent_message_stop = True
-            yield _encode_sse_json({"type": "message_stop"}, event="message_stop")
+            yield _MESSAGE_STOP_FRAME
 
     async def _convert_openai_responses_to_openai(
         self,
@@ -827,69 +804,112 @@ class SDKStreamConverter(IStreamConverter):
         async for chunk in upstream:
             yield chunk
 
-    def _create_openai_chunk(
-        self,
-        response_id: Optional[str],
-        model: str,
-        delta: Dict[str, Any],
-        finish_reason: Optional[str],
-    ) -> Dict[str, Any]:
-        """Create an OpenAI chat completion chunk."""
-        return {
-            "id": response_id or f"chatcmpl-{uuid.uuid4().hex}",
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": model,
-            "choices": [
-                {
-                    "index": 0,
-                    "delta": delta,
-                    "finish_reason": finish_reason,
-                }
-            ],
-        }
 
+class _OpenAIChunkFrames:
+    """
+    Pre-encoded ``chat.completion.chunk`` SSE frames for one converted stream.
 
-class _SSEDecoder:
-    """SSE decoder for streaming responses."""
+    The id/object/created/model prefix is serialized once per stream, so each
+    token only costs an ``orjson.dumps`` of its delta and a bytes concatenation.
+    """
 
-    def __init__(self):
-        self._buffer = ""
+    __slots__ = ("response_id", "created", "_head")
+
+    def __init__(self, response_id: Optional[str], model: str):
+        self.response_id = response_id or f"chatcmpl-{uuid.uuid4().hex}"
+        self.created = int(time.time())
+        self._head = (
+            b'data: {"id":'
+            + orjson.dumps(self.response_id)
+            + b',"object":"chat.completion.chunk","created":'
+            + str(self.created).encode()
+            + b',"model":'
+            + orjson.dumps(model)
+        )
 
-    def feed(self, chunk: bytes) -> List[str]:
-        """Feed bytes and return complete SSE data payloads."""
-        try:
-            text = chunk.decode("utf-8")
-        except UnicodeDecodeError:
-            return []
+    def content(self, text: str, *, with_role: bool = False) -> bytes:
+        """Frame a text delta (the per-token hot path)."""
+        return b"".join(
+            (
+                self._head,
+                _ROLE_CONTENT_DELTA if with_role else _CONTENT_DELTA,
+                orjson.dumps(text),
+                _CONTENT_DELTA_TAIL,
+            )
+        )
 
-        self._buffer += text
-        payloads = []
+    def chunk(self, delta: Dict[str, Any], finish_reason: Optional[str] = None) -> bytes:
+        """Frame an arbitrary delta, optionally with a finish reason."""
+        return b"".join(
+            (
+                self._head,
+                b',"choices":[{"index":0,"delta":',
+                orjson.dumps(delta),
+                b',"finish_reason":',
+                orjson.dumps(finish_reason),
+                b"}]}\n\n",
+            )
+        )
 
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
-            line = line.strip()
+    def usage(self, usage: Dict[str, Any]) -> bytes:
+        """Frame the trailing usage chunk (empty choices)."""
+        return b"".join(
+            (self._head, b',"choices":[],"usage":', orjson.dumps(usage), b"}\n\n")
+        )
 
-            if line.startswith("data:"):
-                data = line[5:].strip()
-                if data:
-                    payloads.append(data)
 
-        return payloads
+_CONTENT_DELTA = b',"choices":[{"index":0,"delta":{"content":'
+_ROLE_CONTENT_DELTA = b',"choices":[{"index":0,"delta":{"role":"assistant","content":'
+_CONTENT_DELTA_TAIL = b'},"finish_reason":null}]}\n\n'
 
 
-def _encode_sse_data(payload: str) -> bytes:
-    """Encode string as SSE data line."""
-    return f"data: {payload}\n\n".encode("utf-8")
+_SSE_DONE = b"data: [DONE]\n\n"
+_MESSAGE_STOP_FRAME = b'event: message_stop\ndata: {"type":"message_stop"}\n\n'
+_CONTENT_BLOCK_STOP_HEAD = (
+    b'event: content_block_stop\ndata: {"type":"content_block_stop","index":'
+)
 
 
 def _encode_sse_json(obj: Dict[str, Any], event: Optional[str] = None) -> bytes:
     """Encode dict as SSE JSON data line."""
+    # A single join allocates the frame once instead of once per concatenation
     if event:
-        return f"event: {event}\n".encode("utf-8") + _encode_sse_data(
-            json.dumps(obj, ensure_ascii=False)
+        return b"".join(
+            (b"event: ", event.encode("utf-8"), b"\ndata: ", orjson.dumps(obj), b"\n\n")
+        )
+    return b"".join((b"data: ", orjson.dumps(obj), b"\n\n"))
+
+
+def _encode_anthropic_block_delta(index: int, delta_head: bytes, value: str) -> bytes:
+    """Encode an Anthropic content_block_delta event without building the event dict."""
+    return b"".join(
+        (
+            b'event: content_block_delta\ndata: {"type":"content_block_delta","index":',
+            str(index).encode(),
+            delta_head,
+            orjson.dumps(value),
+            b"}}\n\n",
         )
-    return _encode_sse_data(json.dumps(obj, ensure_ascii=False))
+    )
+
+
+def _encode_anthropic_block_stop(index: int) -> bytes:
+    """Encode an Anthropic content_block_stop event."""
+    return b"".join((_CONTENT_BLOCK_STOP_HEAD, str(index).encode(), b"}\n\n"))
+
+
+def _encode_anthropic_text_delta(index: int, text: str) -> bytes:
+    """Encode an Anthropic text_delta event."""
+    return _encode_anthropic_block_delta(
+        index, b',"delta":{"type":"text_delta","text":', text
+    )
+
+
+def _encode_anthropic_input_json_delta(index: int, partial_json: str) -> bytes:
+    """Encode an Anthropic input_json_delta event."""
+    return _encode_anthropic_block_delta(
+        index, b',"delta":{"type":"input_json_delta","partial_json":', partial_json
+    )
 
 
 def _map_anthropic_to_openai_finish_reason(stop_reason: Optional[str]) -> str:
@@ -335,10 +335,10 @@ class ProtocolConverterManager:
         Normalizes the request and updates the model field.
         Also normalizes legacy OpenAI function-calling fields.
         """
-        import copy
         from typing import List
 
-        new_body = copy.deepcopy(body)
+        # Only top-level keys are set or removed below, so a shallow copy suffices
+        new_body = dict(body)
         new_body["model"] = target_model
 
         # Normalize OpenAI legacy functions to tools
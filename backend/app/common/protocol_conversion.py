@@ -17,6 +17,7 @@ Main entry points:
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Optional
 
 from app.common.errors import ServiceError
@@ -51,10 +52,14 @@ from app.common.provider_protocols import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
 def normalize_protocol(protocol: str) -> str:
     """
     Normalize a protocol string to its canonical form.
 
+    Results are cached; unsupported protocols raise on every call since
+    lru_cache does not cache exceptions.
+
     Args:
         protocol: Protocol string (e.g., "openai", "openai_chat", "anthropic")
 
@@ -8,7 +8,7 @@ re-frames the response body (e.g. via Starlette StreamingResponse and httpx auto
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 
 
 # RFC 7230 hop-by-hop headers, plus response framing headers we must not forward.
@@ -26,6 +26,31 @@ _DROP_HEADERS = {
     "content-encoding",
 }
 
+def decode_request_headers(
+    scope_headers: Iterable[tuple[bytes, bytes]],
+) -> dict[str, str]:
+    """
+    Build the request header dict from raw ASGI request headers in a single pass.
+
+    Gives the same result as ``dict(request.headers)``: names are lower-cased (ASGI
+    already delivers them that way) and the first value of a repeated header wins.
+    Nothing is dropped, so routing rules and request logs see every header; provider
+    clients strip credentials and hop-by-hop headers when forwarding
+    (``ProviderClient.STRIPPED_HEADERS``).
+
+    Args:
+        scope_headers: ``request.scope["headers"]``
+
+    Returns:
+        dict: Lower-cased header names mapped to values
+    """
+    headers: dict[str, str] = {}
+    for key, value in scope_headers:
+        name = key.decode("latin-1")
+        if name not in headers:
+            headers[name] = value.decode("latin-1")
+    return headers
+
 
 def sanitize_upstream_response_headers(headers: Mapping[str, str] | None) -> dict[str, str]:
     """
@@ -44,3 +69,58 @@ def sanitize_upstream_response_headers(headers: Mapping[str, str] | None) -> dic
         sanitized[key] = value
     return sanitized
 
+
+def build_raw_response_headers(
+    headers: Mapping[str, str] | None,
+    trace_id: str | None = None,
+    *,
+    skip: frozenset[bytes] = frozenset(),
+) -> list[tuple[bytes, bytes]]:
+    """
+    Build an ASGI raw header list for a buffered proxy response.
+
+    Sanitizes upstream headers and encodes them in the same pass, so the result can be
+    appended to ``Response.raw_headers`` without Starlette re-encoding a header dict.
+
+    Args:
+        headers: Upstream response headers
+        trace_id: Gateway trace ID, exposed as ``X-Trace-ID``
+        skip: Extra lower-cased header names to leave out (e.g. ones the response
+            already sets itself)
+
+    Returns:
+        list: ``(name, value)`` byte pairs with lower-cased names
+    """
+    raw: list[tuple[bytes, bytes]] = []
+    if headers:
+        for key, value in headers.items():
+            name = key.lower()
+            if name in _DROP_HEADERS:
+                continue
+            encoded = name.encode("latin-1")
+            if encoded in skip:
+                continue
+            raw.append((encoded, value.encode("latin-1")))
+    if trace_id:
+        raw.append((b"x-trace-id", trace_id.encode("latin-1")))
+    return raw
+
+
+def build_streaming_response_headers(
+    headers: Mapping[str, str] | None,
+    trace_id: str | None = None,
+) -> dict[str, str]:
+    """
+    Build response headers for an SSE passthrough response.
+
+    Upstream headers are sanitized, then anti-buffering hints are added so reverse
+    proxies (e.g. nginx) flush each chunk to the client immediately instead of
+    holding the stream until completion. The gateway trace ID is exposed so clients
+    can correlate a stream with its request log.
+    """
+    sanitized = sanitize_upstream_response_headers(headers)
+    sanitized.setdefault("Cache-Control", "no-cache")
+    sanitized["X-Accel-Buffering"] = "no"
+    if trace_id:
+        sanitized["X-Trace-ID"] = trace_id
+    return sanitized
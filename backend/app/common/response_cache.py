@@ -0,0 +1,56 @@
+"""
+Response Cache Module
+
+Provides an in-process TTL/LRU cache for successful upstream responses of
+idempotent requests (e.g. embeddings).
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from app.common.ttl_cache import TTLCache
+from app.config import get_settings
+
+
+class CachedResponse(NamedTuple):
+    """Successful upstream response kept for replay"""
+
+    status_code: int
+    # Upstream response headers, returned again on a hit
+    headers: dict[str, str]
+    # Body as returned to the client (raw bytes or parsed JSON)
+    body: Any
+    # Routing of the request that filled the entry, recorded in hit logs
+    target_model: Optional[str]
+    provider_id: Optional[int]
+    provider_name: Optional[str]
+    supplier_protocol: Optional[str]
+
+
+class ResponseCache(TTLCache[bytes, CachedResponse]):
+    """
+    In-Process Response Cache
+
+    Entries expire after a fixed TTL; when full, the least recently used entry is
+    evicted. Not shared between worker processes.
+    """
+
+
+_embeddings_cache: Optional[ResponseCache] = None
+
+
+def get_embeddings_cache() -> Optional[ResponseCache]:
+    """
+    Get the embeddings response cache
+
+    Returns:
+        Optional[ResponseCache]: Cache instance, or None when caching is disabled
+    """
+    global _embeddings_cache
+    settings = get_settings()
+    if settings.EMBEDDING_CACHE_TTL <= 0 or settings.EMBEDDING_CACHE_MAX_ENTRIES <= 0:
+        return None
+    if _embeddings_cache is None:
+        _embeddings_cache = ResponseCache(
+            settings.EMBEDDING_CACHE_MAX_ENTRIES, settings.EMBEDDING_CACHE_TTL
+        )
+    return _embeddings_cache
@@ -0,0 +1,32 @@
+"""
+Response Classes Module
+
+Provides HTTP response classes shared by API endpoints.
+"""
+
+import json
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+class ORJSONResponse(Response):
+    """
+    JSON Response Serialized with orjson
+
+    Emits compact UTF-8 instead of ASCII-escaped output, which keeps non-ASCII
+    payloads (e.g. Chinese completions) small and is considerably faster than
+    the standard library encoder used by JSONResponse.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits parsed from an upstream body
+            return json.dumps(
+                content, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
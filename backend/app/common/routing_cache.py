@@ -0,0 +1,65 @@
+"""
+Routing Cache Module
+
+Caches each requested model's routing data (model mapping, active provider
+mappings with their compiled rules, and their providers) in-process, so proxied requests for hot models
+skip the database lookups.
+
+Missing and inactive models are cached too. The cache is per worker: model and
+provider writes clear it only in the worker that made them, so other workers
+can serve stale routing for up to ROUTING_CACHE_TTL seconds.
+"""
+
+from typing import NamedTuple, Optional
+
+from app.common.ttl_cache import TTLCache
+from app.config import get_settings
+from app.domain.model import ModelMapping, ModelMappingProviderResponse
+from app.domain.provider import Provider
+from app.rules.models import RuleSet
+
+
+class RoutingEntry(NamedTuple):
+    """Routing data of one requested model"""
+
+    # None when the model is not configured
+    model_mapping: Optional[ModelMapping]
+    # Active provider mappings (empty when the model is missing or disabled)
+    provider_mappings: list[ModelMappingProviderResponse]
+    # Providers of those mappings by ID (missing providers are omitted)
+    providers: dict[int, Provider]
+    # Compiled provider rules by provider mapping ID (None = no rules)
+    rule_sets: dict[int, Optional[RuleSet]]
+
+
+_routing_cache: Optional[TTLCache[str, RoutingEntry]] = None
+
+
+def get_routing_cache() -> Optional[TTLCache[str, RoutingEntry]]:
+    """
+    Get the routing cache (requested model -> routing data)
+
+    Returns:
+        Optional[TTLCache]: Cache instance, or None when caching is disabled
+    """
+    global _routing_cache
+    settings = get_settings()
+    if settings.ROUTING_CACHE_TTL <= 0 or settings.ROUTING_CACHE_MAX_ENTRIES <= 0:
+        return None
+    if _routing_cache is None:
+        _routing_cache = TTLCache(
+            settings.ROUTING_CACHE_MAX_ENTRIES, settings.ROUTING_CACHE_TTL
+        )
+    return _routing_cache
+
+
+def invalidate_routing_cache() -> None:
+    """Drop all cached routing data (called after model/provider writes)"""
+    if _routing_cache is not None:
+        _routing_cache.clear()
+
+
+def reset_routing_cache() -> None:
+    """Drop the routing cache instance (for tests)"""
+    global _routing_cache
+    _routing_cache = None
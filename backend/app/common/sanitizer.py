@@ -8,6 +8,9 @@ to ensure logs do not contain plain text sensitive data.
 from urllib.parse import urlparse
 from typing import Any
 
+# Header fields to sanitize (lowercase)
+_SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "api-key"})
+
 
 def sanitize_authorization(value: str) -> str:
     """
@@ -30,12 +33,13 @@ def sanitize_authorization(value: str) -> str:
     if not value:
         return value
     
-    # Handle Bearer prefix
-    prefix = ""
-    token = value
-    if value.lower().startswith("bearer "):
+    # Handle Bearer prefix (lower-case only the prefix, not the whole value)
+    if value[:7].lower() == "bearer ":
         prefix = "Bearer "
         token = value[7:]
+    else:
+        prefix = ""
+        token = value
     
     # If token is too short, mask directly
     if len(token) <= 8:
@@ -68,16 +72,19 @@ def sanitize_headers(headers: dict[str, Any]) -> dict[str, Any]:
     if not headers:
         return {}
     
-    # Fields to sanitize (lowercase)
-    sensitive_fields = {"authorization", "x-api-key", "api-key"}
+    # Header names are usually lowercase already, so only lower-case the others
+    sensitive_keys = [
+        key
+        for key in headers
+        if (key if key.islower() else key.lower()) in _SENSITIVE_HEADERS
+    ]
     
     # Create new dictionary to avoid modifying original data
-    sanitized = {}
-    for key, value in headers.items():
-        if key.lower() in sensitive_fields and isinstance(value, str):
+    sanitized = dict(headers)
+    for key in sensitive_keys:
+        value = sanitized[key]
+        if isinstance(value, str):
             sanitized[key] = sanitize_authorization(value)
-        else:
-            sanitized[key] = value
     
     return sanitized
 
@@ -10,6 +10,8 @@ import json
 from dataclasses import dataclass
 from typing import Any, Optional
 
+import orjson
+
 from app.common.token_counter import get_token_counter
 from app.common.usage_extractor import UsageDetails, extract_usage_details
 
@@ -30,14 +32,28 @@ class SSEDecoder:
         """
         Append bytes and return list of parsed data payloads (one string per event).
         """
+        return [
+            payload.decode("utf-8", errors="ignore")
+            for payload in self.feed_bytes(chunk)
+        ]
+
+    def feed_bytes(self, chunk: bytes) -> list[bytes]:
+        """
+        Append bytes and return the data payloads undecoded.
+
+        For consumers that parse payloads with orjson or compare them to
+        ``b"[DONE]"``, which saves a UTF-8 decode per event.
+        """
         if not chunk:
             return []
 
-        data = (self._buf + chunk).replace(b"\r\n", b"\n")
+        data = self._buf + chunk if self._buf else chunk
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n")
         parts = data.split(b"\n\n")
         self._buf = parts.pop()  # Keep last incomplete event
 
-        payloads: list[str] = []
+        payloads: list[bytes] = []
         for event in parts:
             payload = self._extract_data_payload(event)
             if payload is not None:
@@ -45,7 +61,14 @@ class SSEDecoder:
         return payloads
 
     @staticmethod
-    def _extract_data_payload(event: bytes) -> Optional[str]:
+    def _extract_data_payload(event: bytes) -> Optional[bytes]:
+        # Fast path: the common single-line "data: ..." event
+        if event.startswith(b"data:") and b"\n" not in event:
+            value = event[5:]
+            if value.startswith(b" "):
+                value = value[1:]
+            return value
+
         data_lines: list[bytes] = []
         for line in event.split(b"\n"):
             if not line:
@@ -57,10 +80,7 @@ class SSEDecoder:
                 data_lines.append(value)
         if not data_lines:
             return None
-        try:
-            return b"\n".join(data_lines).decode("utf-8", errors="ignore")
-        except Exception:
-            return None
+        return b"\n".join(data_lines)
 
 
 @dataclass
@@ -98,7 +118,7 @@ class StreamUsageAccumulator:
         self._usage_details: Optional[UsageDetails] = None
 
     def feed(self, chunk: bytes) -> None:
-        for payload in self._decoder.feed(chunk):
+        for payload in self._decoder.feed_bytes(chunk):
             self._handle_payload(payload)
 
     def finalize(self) -> StreamUsageResult:
@@ -138,16 +158,16 @@ class StreamUsageAccumulator:
             usage_details=self._usage_details.__dict__ if self._usage_details else None,
         )
 
-    def _handle_payload(self, payload: str) -> None:
+    def _handle_payload(self, payload: bytes) -> None:
         if not payload:
             return
 
         stripped = payload.strip()
-        if stripped == "[DONE]":
+        if stripped == b"[DONE]":
             return
 
         try:
-            data = json.loads(payload)
+            data = orjson.loads(payload)
         except Exception:
             return
 
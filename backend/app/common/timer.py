@@ -16,7 +16,8 @@ class Timer:
     - Time to First Byte (TTFB)
     - Total Time
     
-    Uses time.perf_counter() to ensure high precision.
+    Uses integer time.perf_counter_ns() readings, so millisecond values are
+    exact integer divisions with no float rounding.
     
     Example:
         timer = Timer()
@@ -31,9 +32,9 @@ class Timer:
     
     def __init__(self):
         """Initialize Timer"""
-        self._start_time: Optional[float] = None
-        self._first_byte_time: Optional[float] = None
-        self._end_time: Optional[float] = None
+        self._start_time: Optional[int] = None
+        self._first_byte_time: Optional[int] = None
+        self._end_time: Optional[int] = None
     
     def start(self) -> "Timer":
         """
@@ -42,7 +43,7 @@ class Timer:
         Returns:
             Timer: Returns self for chaining
         """
-        self._start_time = time.perf_counter()
+        self._start_time = time.perf_counter_ns()
         self._first_byte_time = None
         self._end_time = None
         return self
@@ -58,7 +59,7 @@ class Timer:
             Timer: Returns self for chaining
         """
         if self._first_byte_time is None:
-            self._first_byte_time = time.perf_counter()
+            self._first_byte_time = time.perf_counter_ns()
         return self
     
     def stop(self) -> "Timer":
@@ -68,7 +69,7 @@ class Timer:
         Returns:
             Timer: Returns self for chaining
         """
-        self._end_time = time.perf_counter()
+        self._end_time = time.perf_counter_ns()
         # If first byte time not marked, use end time
         if self._first_byte_time is None:
             self._first_byte_time = self._end_time
@@ -84,7 +85,7 @@ class Timer:
         """
         if self._start_time is None or self._first_byte_time is None:
             return None
-        return int((self._first_byte_time - self._start_time) * 1000)
+        return (self._first_byte_time - self._start_time) // 1_000_000
     
     @property
     def total_time_ms(self) -> Optional[int]:
@@ -96,7 +97,7 @@ class Timer:
         """
         if self._start_time is None or self._end_time is None:
             return None
-        return int((self._end_time - self._start_time) * 1000)
+        return (self._end_time - self._start_time) // 1_000_000
     
     def reset(self) -> "Timer":
         """
@@ -6,10 +6,15 @@ Provides Token counting implementations for different protocols (OpenAI, Anthrop
 
 import base64
 import json
+import logging
 import math
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
+
 try:
     import tiktoken
 
@@ -17,6 +22,8 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class TokenCounter(ABC):
     """
@@ -125,12 +132,12 @@ class TokenCounter(ABC):
             return 0
         if isinstance(body, (bytes, bytearray)):
             try:
-                body = json.loads(body.decode("utf-8"))
-            except Exception:
+                body = orjson.loads(body)
+            except orjson.JSONDecodeError:
                 return 0
         if isinstance(body, str):
             try:
-                body = json.loads(body)
+                body = orjson.loads(body)
             except Exception:
                 return self.count_tokens(body, model)
 
@@ -185,6 +192,9 @@ class OpenAITokenCounter(TokenCounter):
     # Default encoding
     DEFAULT_ENCODING = "cl100k_base"
 
+    # Minimum number of texts before count_messages switches to encode_batch
+    BATCH_ENCODE_MIN_TEXTS = 8
+
     # Map models to encodings
     MODEL_ENCODING_MAP = {
         "gpt-4": "cl100k_base",
@@ -212,12 +222,7 @@ class OpenAITokenCounter(TokenCounter):
         if not TIKTOKEN_AVAILABLE:
             return None
 
-        # Find encoding for model
-        encoding_name = self.DEFAULT_ENCODING
-        for model_prefix, enc_name in self.MODEL_ENCODING_MAP.items():
-            if model.startswith(model_prefix):
-                encoding_name = enc_name
-                break
+        encoding_name = _resolve_encoding_name(model)
 
         # Cache encoder
         if encoding_name not in self._encodings:
@@ -249,11 +254,35 @@ class OpenAITokenCounter(TokenCounter):
         # Fallback estimation: average 4 chars per token
         return len(text) // 4
 
+    def _count_texts(self, texts: list[str], model: str = "") -> int:
+        """
+        Count tokens across several texts
+
+        Large batches go through tiktoken's ``encode_batch``, which tokenizes on a
+        thread pool outside the GIL; small ones are encoded inline since spinning
+        up the pool costs more than it saves.
+
+        Args:
+            texts: Texts to count
+            model: Model name
+
+        Returns:
+            int: Total token count
+        """
+        encoding = self._get_encoding(model)
+        if not encoding:
+            return sum(len(text) // 4 for text in texts)
+        if len(texts) < self.BATCH_ENCODE_MIN_TEXTS:
+            return sum(len(encoding.encode(text)) for text in texts)
+        encoded = encoding.encode_batch(texts, num_threads=os.cpu_count() or 4)
+        return sum(len(tokens) for tokens in encoded)
+
     def count_messages(self, messages: list[dict[str, Any]], model: str = "") -> int:
         """
         Count tokens in a message list
 
         Calculates based on OpenAI message format, including role and content overhead.
+        All text is collected first and tokenized in one batch.
 
         Args:
             messages: Message list
@@ -269,28 +298,28 @@ class OpenAITokenCounter(TokenCounter):
         tokens_per_message = 4  # <|start|>role<|separator|>content<|end|>
         tokens_per_name = -1  # If there's a name field
 
+        texts: list[str] = []
         total_tokens = 0
         for message in messages:
             total_tokens += tokens_per_message
             for key, value in message.items():
                 if key == "content":
-                    total_tokens += _count_openai_content(value, model, self)
+                    total_tokens += _collect_openai_content(value, texts)
                     continue
                 if key in ("tool_calls", "function_call") and value is not None:
                     try:
-                        total_tokens += self.count_tokens(
-                            json.dumps(value, ensure_ascii=False), model
-                        )
+                        texts.append(json.dumps(value, ensure_ascii=False))
                     except Exception:
                         pass
                     continue
                 if isinstance(value, str):
-                    total_tokens += self.count_tokens(value, model)
+                    texts.append(value)
                 elif isinstance(value, list):
-                    total_tokens += _count_openai_list(value, model, self)
+                    total_tokens += _collect_openai_content(value, texts)
                 if key == "name":
                     total_tokens += tokens_per_name
 
+        total_tokens += self._count_texts([text for text in texts if text], model)
         total_tokens += 3  # Every reply is primed with <|start|>assistant<|message|>
         return total_tokens
 
@@ -353,18 +382,17 @@ class AnthropicTokenCounter(TokenCounter):
         if not messages:
             return 0
 
+        # Collect every counted string and estimate over their combined length
+        texts: list[str] = []
         total_tokens = 0
         for message in messages:
             role = message.get("role", "")
-            content = message.get("content", "")
-
-            total_tokens += self.count_tokens(role, model)
-            total_tokens += _count_anthropic_content(content, model, self)
-
-            # Message overhead
-            total_tokens += 4
+            if role:
+                texts.append(role)
+            total_tokens += _collect_anthropic_content(message.get("content", ""), texts)
 
-        return total_tokens
+        # Message overhead: 4 tokens per message
+        return total_tokens + sum(map(len, texts)) // 4 + 4 * len(messages)
 
     def count_request(self, body: dict[str, Any], model: str = "") -> int:
         if not isinstance(body, dict):
@@ -388,6 +416,33 @@ class AnthropicTokenCounter(TokenCounter):
         return total
 
 
+# Model prefixes, longest first so e.g. "gpt-4-32k" wins over "gpt-4"
+_ENCODING_PREFIXES = sorted(OpenAITokenCounter.MODEL_ENCODING_MAP, key=len, reverse=True)
+
+
+@lru_cache(maxsize=256)
+def _resolve_encoding_name(model: str) -> str:
+    """
+    Resolve the tiktoken encoding name for a model
+
+    Exact matches win, then the longest matching prefix; results are cached
+    since the same model name repeats for every text in a request.
+    """
+    encoding_map = OpenAITokenCounter.MODEL_ENCODING_MAP
+    exact = encoding_map.get(model)
+    if exact is not None:
+        return exact
+    for prefix in _ENCODING_PREFIXES:
+        if model.startswith(prefix):
+            return encoding_map[prefix]
+    return OpenAITokenCounter.DEFAULT_ENCODING
+
+
+# Process-wide counters, so loaded tiktoken encodings are reused across requests
+_OPENAI_COUNTER = OpenAITokenCounter()
+_ANTHROPIC_COUNTER = AnthropicTokenCounter()
+
+
 def get_token_counter(protocol: str) -> TokenCounter:
     """
     Get Token Counter for specified protocol
@@ -396,11 +451,27 @@ def get_token_counter(protocol: str) -> TokenCounter:
         protocol: Protocol type, "openai", "openai_responses", or "anthropic"
 
     Returns:
-        TokenCounter: Corresponding counter instance
+        TokenCounter: Shared counter instance
     """
     if protocol.lower() == "anthropic":
-        return AnthropicTokenCounter()
-    return OpenAITokenCounter()
+        return _ANTHROPIC_COUNTER
+    return _OPENAI_COUNTER
+
+
+def warm_token_counter() -> None:
+    """
+    Load the default tiktoken encoding into the shared OpenAI counter
+
+    Meant to run off the event loop at startup so the first request does not
+    pay the encoding load. Failures (e.g. no network to fetch the BPE file)
+    are logged and counting loads the encoding lazily later.
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return
+    try:
+        _OPENAI_COUNTER._get_encoding("")
+    except Exception as e:
+        logger.warning("Failed to preload tiktoken encoding: %s", e)
 
 
 def _extract_text_from_content(content: Any) -> str:
@@ -427,32 +498,38 @@ def _extract_text_from_content(content: Any) -> str:
     return ""
 
 
-def _count_openai_list(items: list[Any], model: str, counter: TokenCounter) -> int:
-    total = 0
-    for item in items:
-        if isinstance(item, dict):
-            total += _count_openai_content(item, model, counter)
-        elif isinstance(item, str):
-            total += counter.count_tokens(item, model)
+def _count_openai_content(content: Any, model: str, counter: TokenCounter) -> int:
+    texts: list[str] = []
+    total = _collect_openai_content(content, texts)
+    for text in texts:
+        total += counter.count_tokens(text, model)
     return total
 
 
-def _count_openai_content(content: Any, model: str, counter: TokenCounter) -> int:
+def _collect_openai_content(content: Any, texts: list[str]) -> int:
+    """
+    Collect the text parts of OpenAI content into ``texts``
+
+    Returns:
+        int: Estimated tokens for the non-text parts (images, audio, video)
+    """
     if isinstance(content, str):
-        return counter.count_tokens(content, model)
+        texts.append(content)
+        return 0
     if isinstance(content, list):
         total = 0
         for item in content:
             if isinstance(item, dict):
-                total += _count_openai_content(item, model, counter)
+                total += _collect_openai_content(item, texts)
             elif isinstance(item, str):
-                total += counter.count_tokens(item, model)
+                texts.append(item)
         return total
     if isinstance(content, dict):
         if content.get("type") in ("text", "input_text", "output_text"):
             text = content.get("text") or content.get("content")
             if isinstance(text, str):
-                return counter.count_tokens(text, model)
+                texts.append(text)
+                return 0
         if content.get("type") in ("image_url", "input_image"):
             return _estimate_image_tokens(content, protocol="openai")
         if content.get("type") in ("input_audio", "audio"):
@@ -460,13 +537,28 @@ def _count_openai_content(content: Any, model: str, counter: TokenCounter) -> in
         if content.get("type") in ("video", "input_video"):
             return _estimate_video_tokens(content)
         if "text" in content and isinstance(content["text"], str):
-            return counter.count_tokens(content["text"], model)
+            texts.append(content["text"])
     return 0
 
 
 def _count_anthropic_content(content: Any, model: str, counter: TokenCounter) -> int:
+    texts: list[str] = []
+    total = _collect_anthropic_content(content, texts)
+    for text in texts:
+        total += counter.count_tokens(text, model)
+    return total
+
+
+def _collect_anthropic_content(content: Any, texts: list[str]) -> int:
+    """
+    Collect the text parts of Anthropic content into ``texts``
+
+    Returns:
+        int: Estimated tokens for the non-text parts (images)
+    """
     if isinstance(content, str):
-        return counter.count_tokens(content, model)
+        texts.append(content)
+        return 0
     if isinstance(content, list):
         total = 0
         for item in content:
@@ -474,16 +566,14 @@ def _count_anthropic_content(content: Any, model: str, counter: TokenCounter) ->
                 continue
             item_type = item.get("type")
             if item_type == "text" and isinstance(item.get("text"), str):
-                total += counter.count_tokens(item["text"], model)
+                texts.append(item["text"])
             elif item_type == "tool_use":
-                total += counter.count_tokens(
-                    json.dumps(item, ensure_ascii=False), model
-                )
+                texts.append(json.dumps(item, ensure_ascii=False))
             elif item_type == "image":
                 total += _estimate_image_tokens(item, protocol="anthropic")
         return total
     if isinstance(content, dict) and isinstance(content.get("text"), str):
-        return counter.count_tokens(content["text"], model)
+        texts.append(content["text"])
     return 0
 
 
@@ -8,10 +8,11 @@ pass through raw bytes without parsing the JSON body.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Optional
 
+import orjson
+
 
 def _coerce_json_obj(body: Any) -> Any | None:
     if body is None:
@@ -34,8 +35,8 @@ def _coerce_json_obj(body: Any) -> Any | None:
         return None
 
     try:
-        return json.loads(stripped)
-    except Exception:
+        return orjson.loads(stripped)
+    except orjson.JSONDecodeError:
         return None
 
 
@@ -94,6 +95,31 @@ def _safe_int(value: Any) -> Optional[int]:
     return None
 
 
+# Usage keys normalized into UsageDetails fields; the rest go to extra_usage
+_MAPPED_KEYS = frozenset(
+    {
+        "prompt_tokens",
+        "completion_tokens",
+        "total_tokens",
+        "input_tokens",
+        "output_tokens",
+        "cached_tokens",
+        "cache_creation_input_tokens",
+        "cache_read_input_tokens",
+        "input_tokens_details",
+        "prompt_tokens_details",
+        "input_token_details",
+        "output_tokens_details",
+        "completion_tokens_details",
+        "output_token_details",
+        "promptTokenCount",
+        "candidatesTokenCount",
+        "totalTokenCount",
+        "cachedContentTokenCount",
+    }
+)
+
+
 def _normalize_usage(usage: dict[str, Any], usage_kind: str) -> UsageDetails:
     input_tokens = None
     output_tokens = None
@@ -152,27 +178,7 @@ def _normalize_usage(usage: dict[str, Any], usage_kind: str) -> UsageDetails:
     if total_tokens is None and input_tokens is not None and output_tokens is not None:
         total_tokens = input_tokens + output_tokens
 
-    mapped_keys = {
-        "prompt_tokens",
-        "completion_tokens",
-        "total_tokens",
-        "input_tokens",
-        "output_tokens",
-        "cached_tokens",
-        "cache_creation_input_tokens",
-        "cache_read_input_tokens",
-        "input_tokens_details",
-        "prompt_tokens_details",
-        "input_token_details",
-        "output_tokens_details",
-        "completion_tokens_details",
-        "output_token_details",
-        "promptTokenCount",
-        "candidatesTokenCount",
-        "totalTokenCount",
-        "cachedContentTokenCount",
-    }
-    extra_usage = {k: v for k, v in usage.items() if k not in mapped_keys} or None
+    extra_usage = {k: v for k, v in usage.items() if k not in _MAPPED_KEYS} or None
 
     return UsageDetails(
         input_tokens=input_tokens,
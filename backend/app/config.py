@@ -27,16 +27,78 @@ class Settings(BaseSettings):
     DATABASE_TYPE: Literal["sqlite", "postgresql"] = "sqlite"
     # SQLite default database path, PostgreSQL requires full connection string
     DATABASE_URL: str = "sqlite+aiosqlite:///./llm_gateway.db"
+    # PostgreSQL connection pool size (SQLite keeps SQLAlchemy's default pool)
+    DB_POOL_SIZE: int = 20
+    # Extra PostgreSQL connections allowed beyond DB_POOL_SIZE under burst load
+    DB_MAX_OVERFLOW: int = 10
+    # Recycle pooled PostgreSQL connections older than this many seconds
+    DB_POOL_RECYCLE: int = 1800
     
     # Retry Config
     # Max retries on same provider (triggered when status code >= 500)
     RETRY_MAX_ATTEMPTS: int = 3
-    # Retry interval (ms)
+    # Retry interval (ms) before the first retry on the same provider
     RETRY_DELAY_MS: int = 1000
+    # Each further retry on the same provider waits this many times longer (1 keeps it fixed)
+    RETRY_BACKOFF_BASE: float = 2.0
+    # Random extra delay of up to this many ms per retry, so concurrent requests do not
+    # retry a failing provider in lockstep (0 disables)
+    RETRY_JITTER_MS: int = 250
+    # Hedge delay (ms): for routes that opt in, start the next provider when the first
+    # attempt has not completed within this delay (0 disables hedging)
+    HEDGE_DELAY_MS: int = 0
+    # Failover mode for non-streaming requests: "sequential" tries providers one by one;
+    # "parallel" starts each next provider HEDGE_DELAY_MS after the previous one (or as
+    # soon as it fails) and keeps the first success (other providers may be billed too).
+    # Parallel only applies to routes that allow hedging (embeddings) and needs
+    # HEDGE_DELAY_MS > 0; other requests fail over sequentially
+    FAILOVER_MODE: Literal["sequential", "parallel"] = "sequential"
+    # Skip a provider after this many consecutive server errors (>= 500) until the
+    # cooldown has passed (e.g. 5). State is per worker process; when every
+    # candidate is skipped they are all tried anyway (default 0, disabled)
+    CIRCUIT_BREAKER_THRESHOLD: int = 0
+    # Seconds a provider is skipped once its circuit breaker has opened
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: int = 30
+    
+    # Embeddings Cache Config
+    # Cache successful /v1/embeddings responses in-process for this many seconds,
+    # keyed by API Key and request body (0 disables caching)
+    EMBEDDING_CACHE_TTL: int = 0
+    # Max cached embeddings responses (least recently used are evicted)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 1024
+    
+    # API Key Auth Cache Config
+    # Cache API Key lookups by key value in-process for this many seconds (0 disables);
+    # edits and deletes invalidate the local worker at once, other workers within the TTL
+    API_KEY_CACHE_TTL: int = 30
+    # Max cached API Keys (least recently used are evicted)
+    API_KEY_CACHE_MAX_ENTRIES: int = 4096
+    # Write API Key last-used times in batches every this many seconds instead of on
+    # each request (0 writes on every authentication)
+    API_KEY_LAST_USED_FLUSH_SECONDS: int = 1
+    
+    # Routing Cache Config
+    # Cache each model's mapping, active provider mappings and providers in-process for
+    # this many seconds (0 disables), including missing or inactive models; edits clear
+    # only the worker that made them, other workers can serve stale routing until the TTL
+    ROUTING_CACHE_TTL: int = 10
+    # Max cached models (least recently used are evicted)
+    ROUTING_CACHE_MAX_ENTRIES: int = 1024
     
     # HTTP Client Config
     # Request timeout (seconds)
     HTTP_TIMEOUT: int = 1800
+    # Max upstream connections per shared client (pooled across requests)
+    HTTP_MAX_CONNECTIONS: int = 512
+    # Max idle keep-alive connections retained per shared client
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 256
+    # Max in-flight requests per upstream base URL (0 disables the limit)
+    UPSTREAM_MAX_CONCURRENCY: int = 512
+    # Max requests waiting for a slot per upstream before rejecting with 429
+    UPSTREAM_MAX_QUEUED: int = 1024
+    # model_affinity strategy: stop preferring a backend that already serves the model
+    # once this many requests are queued for it
+    AFFINITY_MAX_QUEUED: int = 16
     
     # API Key Config
     # Generated API Key prefix
@@ -54,9 +116,19 @@ class Settings(BaseSettings):
     # Log Cleanup Config
     # Log retention days (default 7 days)
     LOG_RETENTION_DAYS: int = 7
-    # Log cleanup execution hour (0-23, default 4 AM)
+    # Log cleanup execution hour (0-23, server local time, default 4 AM)
     LOG_CLEANUP_HOUR: int = 4
 
+    # Request Log Write Config
+    # Buffer request logs and insert them in batches at most this many milliseconds
+    # after the first buffered log (0 writes each log on its own)
+    LOG_WRITE_BATCH_MS: int = 100
+    # Insert buffered logs immediately once this many are waiting
+    LOG_WRITE_BATCH_SIZE: int = 100
+    # Store request/response bodies in request logs (false keeps only metadata,
+    # headers, usage and cost, and skips buffering stream chunks for the log)
+    LOG_BODIES: bool = True
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -89,7 +89,7 @@ class ModelMapping(Base):
     requested_model: Mapped[str] = mapped_column(
         String(100), primary_key=True, nullable=False
     )
-    # Selection strategy: round_robin / cost_first / priority
+    # Selection strategy: round_robin / cost_first / priority / model_affinity
     strategy: Mapped[str] = mapped_column(String(50), default="round_robin")
     # Model type: chat / speech / transcription / embedding / images
     model_type: Mapped[str] = mapped_column(String(50), default="chat")
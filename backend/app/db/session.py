@@ -4,30 +4,77 @@ Database Session Management Module
 Provides asynchronous database session management, supporting SQLite and PostgreSQL.
 """
 
-from typing import AsyncGenerator
+import json
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy import inspect, text
+from sqlalchemy import event, inspect, text
 
 from app.config import get_settings
 
 # Get configuration
 settings = get_settings()
 
+# Per-connection SQLite settings: WAL lets log writes proceed alongside reads
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson (stdlib json for values it rejects, e.g. >64-bit ints)"""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(value)
+
+
+def json_deserializer(value: str) -> Any:
+    """Parse JSON column values with orjson (stdlib json for NaN/Infinity written by older rows)"""
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+
+
 # Create asynchronous database engine
 # echo=True prints SQL statements in DEBUG mode
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    # SQLite specific configuration
-    connect_args={"check_same_thread": False} 
-    if settings.DATABASE_TYPE == "sqlite" 
-    else {},
-)
+if settings.DATABASE_TYPE == "sqlite":
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+else:
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
 
 # Create asynchronous session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -43,7 +90,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get database session (for dependency injection)
     
-    Uses async with to ensure session is closed correctly.
+    Uses async with to ensure session is closed correctly; closing also rolls
+    back any transaction left open by a failed request.
     Used as Depends in FastAPI.
     
     Yields:
@@ -55,11 +103,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             ...
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
+        yield session
 
 
 async def init_db() -> None:
@@ -30,39 +30,33 @@ class ApiKeyUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class ApiKeyModel(ApiKeyBase):
-    """API Key Complete Model"""
+class _ApiKeyReadBase(ApiKeyBase):
+    """Fields shared by the API Key read models"""
     
     id: int = Field(..., description="API Key ID")
-    key_value: str = Field(..., description="Key Value")
     is_active: bool = Field(True, description="Is Active")
     created_at: datetime = Field(..., description="Creation Time")
     last_used_at: Optional[datetime] = Field(None, description="Last Used Time")
     
-    model_config = ConfigDict(from_attributes=True)
+    # Read models are built once per lookup and never reassigned
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
-class ApiKeyResponse(ApiKeyBase):
+class ApiKeyModel(_ApiKeyReadBase):
+    """API Key Complete Model"""
+    
+    key_value: str = Field(..., description="Key Value")
+
+
+class ApiKeyResponse(_ApiKeyReadBase):
     """API Key Response Model (key_value sanitized)"""
     
-    id: int = Field(..., description="API Key ID")
     # key_value sanitized display
     key_value: str = Field(..., description="Key Value (Sanitized)")
-    is_active: bool = Field(True, description="Is Active")
-    created_at: datetime = Field(..., description="Creation Time")
-    last_used_at: Optional[datetime] = Field(None, description="Last Used Time")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
-class ApiKeyCreateResponse(ApiKeyBase):
+class ApiKeyCreateResponse(_ApiKeyReadBase):
     """Create API Key Response Model (key_value fully displayed, once only)"""
     
-    id: int = Field(..., description="API Key ID")
     # Return full key_value on creation, not displayed afterwards
     key_value: str = Field(..., description="Key Value (Fully displayed only on creation)")
-    is_active: bool = Field(True, description="Is Active")
-    created_at: datetime = Field(..., description="Creation Time")
-    last_used_at: Optional[datetime] = Field(None, description="Last Used Time")
-    
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -4,13 +4,15 @@ Request/Response Domain Model
 Defines data structures related to proxy requests and responses.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
-from app.common.time import utc_now
+from app.common.time import UTC
 
-@dataclass
+
+@dataclass(slots=True)
 class ProxyRequest:
     """
     Proxy Request Data Class
@@ -34,21 +36,24 @@ class ProxyRequest:
     api_key_name: str
     # Trace ID
     trace_id: str
-    # Request Time
-    request_time: datetime = field(default_factory=utc_now)
+    # Request Time (Unix seconds; a float is cheaper to take than a datetime)
+    request_time_unix: float = field(default_factory=time.time)
+    # Requested model name (read from body once at construction)
+    requested_model: Optional[str] = field(init=False)
+    # Is stream request (read from body once at construction)
+    is_stream: bool = field(init=False)
     
-    @property
-    def requested_model(self) -> Optional[str]:
-        """Get requested model name"""
-        return self.body.get("model")
+    def __post_init__(self) -> None:
+        self.requested_model = self.body.get("model")
+        self.is_stream = self.body.get("stream", False)
     
     @property
-    def is_stream(self) -> bool:
-        """Is stream request"""
-        return self.body.get("stream", False)
+    def request_time(self) -> datetime:
+        """Request time as a UTC-aware datetime"""
+        return datetime.fromtimestamp(self.request_time_unix, tz=UTC)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyResponse:
     """
     Proxy Response Data Class
@@ -87,29 +92,3 @@ class ProxyResponse:
     def is_error(self) -> bool:
         """Is error response"""
         return not self.success or self.status_code >= 400
-
-
-@dataclass
-class CandidateProvider:
-    """
-    Candidate Provider Data Class
-    
-    Candidate provider information output after rule engine matching.
-    """
-    
-    # Provider ID
-    provider_id: int
-    # Provider Name
-    provider_name: str
-    # Provider Base URL
-    base_url: str
-    # Provider Protocol
-    protocol: str
-    # Provider API Key
-    api_key: Optional[str]
-    # Target Model Name (Actual model corresponding to this provider)
-    target_model: str
-    # Priority
-    priority: int = 0
-    # Weight
-    weight: int = 1
@@ -4,6 +4,7 @@ LLM Gateway Application Entry Point
 FastAPI application main entry, including router registration and application configuration.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 import os
 from pathlib import Path
@@ -11,17 +12,21 @@ from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.routing import APIRouter
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
 from app.logging_config import setup_logging
 from app.db.session import init_db
 from app.common.errors import AppError
+from app.common.http_client import close_shared_clients
+from app.common.token_counter import warm_token_counter
 from app.api.proxy import openai_router, anthropic_router
 from app.api.admin import providers_router, models_router, api_keys_router, logs_router
 from app.api.auth import router as auth_router
 from app.scheduler import start_scheduler, shutdown_scheduler
+from app.services.api_key_usage import flush_last_used
+from app.services.log_writer import drain_logs
 
 
 # Initialize logging configuration
@@ -39,9 +44,14 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     start_scheduler()
+    # Load the tokenizer in the background; requests load it lazily if this is still running
+    asyncio.get_running_loop().run_in_executor(None, warm_token_counter)
     yield
     # Shutdown
-    shutdown_scheduler()
+    await shutdown_scheduler()
+    await flush_last_used()
+    await drain_logs()
+    await close_shared_clients()
 
 
 # Create FastAPI application
@@ -75,9 +85,10 @@ async def app_error_handler(request: Request, exc: AppError):
     """
     Handle application custom exceptions
     """
-    return JSONResponse(
+    return Response(
+        content=exc.to_json(),
         status_code=exc.status_code,
-        content=exc.to_dict(),
+        media_type="application/json",
     )
 
 
@@ -172,6 +183,8 @@ if frontend_enabled:
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
     
     uvicorn.run(
@@ -179,4 +192,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        # libuv event loop + C HTTP parser (uvloop is unavailable on Windows)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -10,9 +10,11 @@ from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
+from app.common.errors import UpstreamOverloadedError
+from app.common.http_client import iter_response_bytes, shared_client
 from app.common.timer import Timer
 from app.config import get_settings
-from app.providers.base import ProviderClient, ProviderResponse
+from app.providers.base import ProviderClient, ProviderResponse, parse_json_body
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +54,13 @@ class AnthropicClient(ProviderClient):
         Returns:
             dict: Processed request headers
         """
-        new_headers = dict(headers)
-        
-        # Remove original authentication headers and auto-generated headers
-        keys_to_remove = ["authorization", "x-api-key", "api-key", "content-length", "host", "content-type", "accept-encoding"]
-        for key in list(new_headers.keys()):
-            if key.lower() in keys_to_remove:
-                del new_headers[key]
+        # Copy while dropping original authentication headers and auto-generated headers
+        stripped = self.STRIPPED_HEADERS
+        new_headers = {
+            key: value
+            for key, value in headers.items()
+            if key.lower() not in stripped
+        }
         
         # Add Anthropic specific header
         if api_key:
@@ -86,6 +88,7 @@ class AnthropicClient(ProviderClient):
         response_mode: str = "parsed",
         extra_headers: Optional[dict[str, str]] = None,
         proxy_config: Optional[dict[str, str]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> ProviderResponse:
         """
         Forward request to Anthropic-compatible provider
@@ -100,6 +103,7 @@ class AnthropicClient(ProviderClient):
             target_model: Target model name
             response_mode: Response mode, "parsed" (parse JSON) or "raw" (return raw bytes)
             extra_headers: Extra headers
+            raw_body: Serialized form of body, sent with only the model patched
         
         Returns:
             ProviderResponse: Provider response
@@ -112,6 +116,7 @@ class AnthropicClient(ProviderClient):
             cleaned_path = ''
         url = f"{cleaned_base}{cleaned_path}"
         prepared_body = self._prepare_body(body, target_model)
+        prepared_content = self._prepare_content(raw_body, target_model)
         prepared_headers = self._prepare_headers(headers, api_key, extra_headers)
         prepared_headers["Content-Type"] = "application/json"
         
@@ -127,12 +132,18 @@ class AnthropicClient(ProviderClient):
         
         try:
             proxy_url = proxy_config.get("all://") if proxy_config else None
-            async with httpx.AsyncClient(timeout=self.timeout, proxy=proxy_url) as client:
+            async with shared_client(
+                proxy_url, self.timeout, upstream=cleaned_base
+            ) as client:
+                if prepared_content is not None:
+                    body_kwargs: dict[str, Any] = {"content": prepared_content}
+                else:
+                    body_kwargs = {"json": prepared_body}
                 response = await client.request(
                     method=method,
                     url=url,
                     headers=prepared_headers,
-                    json=prepared_body,
+                    **body_kwargs,
                 )
                 
                 timer.mark_first_byte()
@@ -140,11 +151,7 @@ class AnthropicClient(ProviderClient):
                 if response_mode == "raw":
                     response_body: Any = response.content
                 else:
-                    response_body = response.text
-                    try:
-                        response_body = response.json()
-                    except json.JSONDecodeError:
-                        pass
+                    response_body = parse_json_body(response)
                 
                 timer.stop()
                 
@@ -156,6 +163,10 @@ class AnthropicClient(ProviderClient):
                     total_time_ms=timer.total_time_ms,
                 )
         
+        except UpstreamOverloadedError as e:
+            timer.stop()
+            return self._overloaded_response(e, timer)
+        
         except httpx.TimeoutException as e:
             timer.stop()
             return ProviderResponse(
@@ -212,7 +223,7 @@ class AnthropicClient(ProviderClient):
 
         try:
             proxy_url = proxy_config.get("all://") if proxy_config else None
-            async with httpx.AsyncClient(timeout=self.timeout, proxy=proxy_url) as client:
+            async with shared_client(proxy_url, self.timeout) as client:
                 response = await client.request(
                     method="GET",
                     url=url,
@@ -275,6 +286,7 @@ class AnthropicClient(ProviderClient):
         target_model: str,
         extra_headers: Optional[dict[str, str]] = None,
         proxy_config: Optional[dict[str, str]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> AsyncGenerator[tuple[bytes, ProviderResponse], None]:
         """
         Forward streaming request to Anthropic-compatible provider
@@ -288,6 +300,7 @@ class AnthropicClient(ProviderClient):
             body: Request body
             target_model: Target model name
             extra_headers: Extra headers
+            raw_body: Serialized form of body, sent with only the model patched
         
         Yields:
             tuple[bytes, ProviderResponse]: (Data chunk, Response info)
@@ -300,6 +313,7 @@ class AnthropicClient(ProviderClient):
             cleaned_path = ''
         url = f"{cleaned_base}{cleaned_path}"
         prepared_body = self._prepare_body(body, target_model)
+        prepared_content = self._prepare_content(raw_body, target_model)
         prepared_headers = self._prepare_headers(headers, api_key, extra_headers)
         prepared_headers["Content-Type"] = "application/json"
         
@@ -316,12 +330,18 @@ class AnthropicClient(ProviderClient):
         
         try:
             proxy_url = proxy_config.get("all://") if proxy_config else None
-            async with httpx.AsyncClient(timeout=self.timeout, proxy=proxy_url) as client:
+            async with shared_client(
+                proxy_url, self.timeout, upstream=cleaned_base
+            ) as client:
+                if prepared_content is not None:
+                    body_kwargs: dict[str, Any] = {"content": prepared_content}
+                else:
+                    body_kwargs = {"json": prepared_body}
                 async with client.stream(
                     method=method,
                     url=url,
                     headers=prepared_headers,
-                    json=prepared_body,
+                    **body_kwargs,
                 ) as response:
                     provider_response = ProviderResponse(
                         status_code=response.status_code,
@@ -340,7 +360,7 @@ class AnthropicClient(ProviderClient):
                         yield body_bytes or b"", provider_response
                         return
                     
-                    async for chunk in response.aiter_bytes():
+                    async for chunk in iter_response_bytes(response):
                         if first_chunk:
                             timer.mark_first_byte()
                             provider_response.first_byte_delay_ms = (
@@ -353,6 +373,10 @@ class AnthropicClient(ProviderClient):
                     timer.stop()
                     provider_response.total_time_ms = timer.total_time_ms
         
+        except UpstreamOverloadedError as e:
+            timer.stop()
+            yield b"", self._overloaded_response(e, timer)
+        
         except httpx.TimeoutException as e:
             timer.stop()
             yield b"", ProviderResponse(
@@ -4,12 +4,45 @@ Upstream Provider Client Base Class
 Defines the abstract interface for provider clients.
 """
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Optional
 
+import httpx
+import orjson
 
-@dataclass
+from app.common.errors import UpstreamOverloadedError
+from app.common.timer import Timer
+from app.common.utils import rewrite_model_field
+
+
+def parse_json_body(response: httpx.Response) -> Any:
+    """
+    Parse an upstream response body as JSON
+
+    The raw bytes go straight to orjson instead of being decoded to text and
+    parsed by the stdlib. Bodies orjson rejects (e.g. a non-UTF-8 charset) fall
+    back to httpx's charset-aware text; non-JSON bodies are returned as text.
+
+    Args:
+        response: Upstream response
+
+    Returns:
+        Any: Parsed JSON, or the body text
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        pass
+    text = response.text
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+@dataclass(slots=True)
 class ProviderResponse:
     """
     Provider Response Data Class
@@ -48,6 +81,27 @@ class ProviderClient(ABC):
     Defines the common interface for provider clients, including normal requests and streaming requests.
     """
     
+    # Inbound headers never forwarded upstream (lower-case): the client's gateway
+    # credentials, headers httpx sets itself, and RFC 7230 hop-by-hop headers
+    STRIPPED_HEADERS = frozenset(
+        {
+            "authorization",
+            "x-api-key",
+            "api-key",
+            "content-length",
+            "host",
+            "content-type",
+            "accept-encoding",
+            "connection",
+            "keep-alive",
+            "proxy-authorization",
+            "te",
+            "trailer",
+            "transfer-encoding",
+            "upgrade",
+        }
+    )
+    
     @abstractmethod
     async def forward(
         self,
@@ -61,6 +115,7 @@ class ProviderClient(ABC):
         response_mode: str = "parsed",
         extra_headers: Optional[dict[str, str]] = None,
         proxy_config: Optional[dict[str, str]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> ProviderResponse:
         """
         Forward request to upstream provider
@@ -78,6 +133,8 @@ class ProviderClient(ABC):
             response_mode: Response mode, "parsed" (parse JSON) or "raw" (return raw bytes)
             extra_headers: Extra headers
             proxy_config: httpx proxy configuration
+            raw_body: Serialized form of body; when given it is sent with only the
+                model field patched, instead of re-serializing body
         
         Returns:
             ProviderResponse: Provider response
@@ -118,6 +175,7 @@ class ProviderClient(ABC):
         target_model: str,
         extra_headers: Optional[dict[str, str]] = None,
         proxy_config: Optional[dict[str, str]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> AsyncGenerator[tuple[bytes, ProviderResponse], None]:
         """
         Forward streaming request to upstream provider
@@ -132,12 +190,54 @@ class ProviderClient(ABC):
             target_model: Target model name
             extra_headers: Extra headers
             proxy_config: httpx proxy configuration
+            raw_body: Serialized form of body (see forward())
         
         Yields:
             tuple[bytes, ProviderResponse]: (Data chunk, Response info)
         """
         pass
     
+    @staticmethod
+    def _overloaded_response(
+        error: UpstreamOverloadedError, timer: Timer
+    ) -> ProviderResponse:
+        """
+        Build the response returned when the upstream's request queue is full
+        
+        Args:
+            error: Overload error raised by the upstream bulkhead
+            timer: Request timer (already stopped)
+        
+        Returns:
+            ProviderResponse: 429 response carrying a Retry-After header
+        """
+        return ProviderResponse(
+            status_code=error.status_code,
+            headers={"Retry-After": str(error.retry_after)},
+            body=error.to_dict(),
+            error=error.message,
+            first_byte_delay_ms=timer.first_byte_delay_ms,
+            total_time_ms=timer.total_time_ms,
+        )
+    
+    @staticmethod
+    def _prepare_content(
+        raw_body: Optional[bytes], target_model: str
+    ) -> Optional[bytes]:
+        """
+        Prepare pre-serialized request body
+
+        Args:
+            raw_body: Serialized request body, or None
+            target_model: Target model name
+
+        Returns:
+            Optional[bytes]: Body with the model field replaced, or None
+        """
+        if raw_body is None:
+            return None
+        return rewrite_model_field(raw_body, target_model)
+
     def _prepare_body(self, body: dict[str, Any], target_model: str) -> dict[str, Any]:
         """
         Prepare request body
@@ -174,13 +274,13 @@ class ProviderClient(ABC):
         Returns:
             dict: Processed request headers (new dictionary)
         """
-        new_headers = dict(headers)
-        
-        # Remove original authentication headers and auto-generated headers
-        keys_to_remove = ["authorization", "x-api-key", "api-key", "content-length", "host", "content-type", "accept-encoding"]
-        for key in list(new_headers.keys()):
-            if key.lower() in keys_to_remove:
-                del new_headers[key]
+        # Copy while dropping original authentication headers and auto-generated headers
+        stripped = self.STRIPPED_HEADERS
+        new_headers = {
+            key: value
+            for key, value in headers.items()
+            if key.lower() not in stripped
+        }
         
         # Add provider API Key
         if api_key:
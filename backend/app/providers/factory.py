@@ -9,15 +9,21 @@ from app.providers.openai_client import OpenAIClient
 from app.providers.anthropic_client import AnthropicClient
 
 
-# Client cache
-_clients: dict[str, ProviderClient] = {}
+# Clients are stateless, so they are built once at import: the steady-state
+# lookup never allocates and no two requests can race to create a client
+_openai_client = OpenAIClient()
+_clients: dict[str, ProviderClient] = {
+    "openai": _openai_client,
+    "openai_responses": _openai_client,
+    "anthropic": AnthropicClient(),
+}
 
 
 def get_provider_client(protocol: str) -> ProviderClient:
     """
     Get provider client for the specified protocol
     
-    Uses caching to avoid repeated client instantiation.
+    Callers passing the canonical lower-case protocol get a single dict lookup.
     
     Args:
         protocol: Protocol type, "openai", "openai_responses", or "anthropic"
@@ -28,14 +34,9 @@ def get_provider_client(protocol: str) -> ProviderClient:
     Raises:
         ValueError: Unsupported protocol type
     """
-    protocol = protocol.lower()
-    
-    if protocol not in _clients:
-        if protocol in ("openai", "openai_responses"):
-            _clients[protocol] = OpenAIClient()
-        elif protocol == "anthropic":
-            _clients[protocol] = AnthropicClient()
-        else:
+    client = _clients.get(protocol)
+    if client is None:
+        client = _clients.get(protocol.lower())
+        if client is None:
             raise ValueError(f"Unsupported protocol: {protocol}")
-    
-    return _clients[protocol]
+    return client
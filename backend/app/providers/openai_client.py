@@ -10,9 +10,11 @@ from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
+from app.common.errors import UpstreamOverloadedError
+from app.common.http_client import iter_response_bytes, shared_client
 from app.common.timer import Timer
 from app.config import get_settings
-from app.providers.base import ProviderClient, ProviderResponse
+from app.providers.base import ProviderClient, ProviderResponse, parse_json_body
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,7 @@ class OpenAIClient(ProviderClient):
         response_mode: str = "parsed",
         extra_headers: Optional[dict[str, str]] = None,
         proxy_config: Optional[dict[str, str]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> ProviderResponse:
         """
         Forward request to OpenAI-compatible provider
@@ -60,6 +63,7 @@ class OpenAIClient(ProviderClient):
             target_model: Target model name
             response_mode: Response mode, "parsed" (parse JSON) or "raw" (return raw bytes)
             extra_headers: Extra headers
+            raw_body: Serialized form of body, sent with only the model patched
         
         Returns:
             ProviderResponse: Provider response
@@ -73,6 +77,7 @@ class OpenAIClient(ProviderClient):
             cleaned_path = ''
         url = f"{cleaned_base}{cleaned_path}"
         prepared_body = self._prepare_body(body, target_model)
+        prepared_content = self._prepare_content(raw_body, target_model)
         multipart = self._split_multipart_body(prepared_body)
         prepared_headers = self._prepare_headers(headers, api_key, extra_headers)
         prepared_files = None
@@ -113,7 +118,9 @@ class OpenAIClient(ProviderClient):
         
         try:
             proxy_url = proxy_config.get("all://") if proxy_config else None
-            async with httpx.AsyncClient(timeout=self.timeout, proxy=proxy_url) as client:
+            async with shared_client(
+                proxy_url, self.timeout, upstream=cleaned_base
+            ) as client:
                 request_kwargs: dict[str, Any] = {
                     "method": method,
                     "url": url,
@@ -122,6 +129,8 @@ class OpenAIClient(ProviderClient):
                 if prepared_files is not None:
                     request_kwargs["data"] = prepared_data
                     request_kwargs["files"] = prepared_files
+                elif prepared_content is not None:
+                    request_kwargs["content"] = prepared_content
                 else:
                     request_kwargs["json"] = prepared_body
 
@@ -132,11 +141,7 @@ class OpenAIClient(ProviderClient):
                 if response_mode == "raw":
                     response_body: Any = response.content
                 else:
-                    response_body = response.text
-                    try:
-                        response_body = response.json()
-                    except json.JSONDecodeError:
-                        pass
+                    response_body = parse_json_body(response)
                 
                 timer.stop()
                 
@@ -148,6 +153,10 @@ class OpenAIClient(ProviderClient):
                     total_time_ms=timer.total_time_ms,
                 )
         
+        except UpstreamOverloadedError as e:
+            timer.stop()
+            return self._overloaded_response(e, timer)
+        
         except httpx.TimeoutException as e:
             timer.stop()
             return ProviderResponse(
@@ -204,7 +213,7 @@ class OpenAIClient(ProviderClient):
 
         try:
             proxy_url = proxy_config.get("all://") if proxy_config else None
-            async with httpx.AsyncClient(timeout=self.timeout, proxy=proxy_url) as client:
+            async with shared_client(proxy_url, self.timeout) as client:
                 response = await client.request(
                     method="GET",
                     url=url,
@@ -267,6 +276,7 @@ class OpenAIClient(ProviderClient):
         target_model: str,
         extra_headers: Optional[dict[str, str]] = None,
         proxy_config: Optional[dict[str, str]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> AsyncGenerator[tuple[bytes, ProviderResponse], None]:
         """
         Forward streaming request to OpenAI-compatible provider
@@ -280,6 +290,7 @@ class OpenAIClient(ProviderClient):
             body: Request body
             target_model: Target model name
             extra_headers: Extra headers
+            raw_body: Serialized form of body, sent with only the model patched
         
         Yields:
             tuple[bytes, ProviderResponse]: (Data chunk, Response info)
@@ -293,6 +304,7 @@ class OpenAIClient(ProviderClient):
             cleaned_path = ''
         url = f"{cleaned_base}{cleaned_path}"
         prepared_body = self._prepare_body(body, target_model)
+        prepared_content = self._prepare_content(raw_body, target_model)
         multipart = self._split_multipart_body(prepared_body)
         prepared_headers = self._prepare_headers(headers, api_key, extra_headers)
         prepared_files = None
@@ -333,7 +345,9 @@ class OpenAIClient(ProviderClient):
         
         try:
             proxy_url = proxy_config.get("all://") if proxy_config else None
-            async with httpx.AsyncClient(timeout=self.timeout, proxy=proxy_url) as client:
+            async with shared_client(
+                proxy_url, self.timeout, upstream=cleaned_base
+            ) as client:
                 stream_kwargs: dict[str, Any] = {
                     "method": method,
                     "url": url,
@@ -342,6 +356,8 @@ class OpenAIClient(ProviderClient):
                 if prepared_files is not None:
                     stream_kwargs["data"] = prepared_data
                     stream_kwargs["files"] = prepared_files
+                elif prepared_content is not None:
+                    stream_kwargs["content"] = prepared_content
                 else:
                     stream_kwargs["json"] = prepared_body
 
@@ -364,7 +380,7 @@ class OpenAIClient(ProviderClient):
                         yield body_bytes or b"", provider_response
                         return
                     
-                    async for chunk in response.aiter_bytes():
+                    async for chunk in iter_response_bytes(response):
                         if first_chunk:
                             timer.mark_first_byte()
                             provider_response.first_byte_delay_ms = (
@@ -377,6 +393,10 @@ class OpenAIClient(ProviderClient):
                     timer.stop()
                     provider_response.total_time_ms = timer.total_time_ms
         
+        except UpstreamOverloadedError as e:
+            timer.stop()
+            yield b"", self._overloaded_response(e, timer)
+        
         except httpx.TimeoutException as e:
             timer.stop()
             yield b"", ProviderResponse(
@@ -2,7 +2,7 @@
 数据访问层模块初始化
 """
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, DuplicateError
 from app.repositories.provider_repo import ProviderRepository
 from app.repositories.model_repo import ModelRepository
 from app.repositories.api_key_repo import ApiKeyRepository
@@ -10,6 +10,7 @@ from app.repositories.log_repo import LogRepository
 
 __all__ = [
     "BaseRepository",
+    "DuplicateError",
     "ProviderRepository",
     "ModelRepository",
     "ApiKeyRepository",
@@ -4,17 +4,15 @@ API Key Repository Interface
 Defines the data access interface for API Keys.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Protocol
 from datetime import datetime
 
 from app.domain.api_key import ApiKeyModel, ApiKeyCreate, ApiKeyUpdate
 
 
-class ApiKeyRepository(ABC):
+class ApiKeyRepository(Protocol):
     """API Key Repository Interface"""
     
-    @abstractmethod
     async def create(self, data: ApiKeyCreate, key_value: str) -> ApiKeyModel:
         """
         Create API Key
@@ -25,20 +23,20 @@ class ApiKeyRepository(ABC):
             
         Returns:
             ApiKeyModel: Created API Key model
+
+        Raises:
+            DuplicateError: Name already exists
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_id(self, id: int) -> Optional[ApiKeyModel]:
         """Get API Key by ID"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_by_key_value(self, key_value: str) -> Optional[ApiKeyModel]:
         """Get API Key by Key Value (for authentication)"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_all(
         self, 
         page: int = 1, 
@@ -56,19 +54,20 @@ class ApiKeyRepository(ABC):
         Returns:
             Tuple[List[ApiKeyModel], int]: (List, Total count)
         """
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, id: int, data: ApiKeyUpdate) -> Optional[ApiKeyModel]:
-        """Update API Key"""
-        pass
+        """Update API Key (raises DuplicateError when the name is taken)"""
+        ...
     
-    @abstractmethod
     async def update_last_used(self, id: int, last_used_at: datetime) -> None:
         """Update Last Used Time"""
-        pass
+        ...
+    
+    async def update_last_used_many(self, last_used: dict[int, datetime]) -> None:
+        """Update Last Used Time for several API Keys (ID -> time)"""
+        ...
     
-    @abstractmethod
     async def delete(self, id: int) -> bool:
         """Delete API Key"""
-        pass
\ No newline at end of file
+        ...
\ No newline at end of file
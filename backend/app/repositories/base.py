@@ -4,14 +4,17 @@ Base Repository Interface Module
 Defines the generic interface for data access, decoupling business logic from specific database implementations.
 """
 
-from abc import ABC
-from typing import Generic, TypeVar, Optional, List
+from typing import Protocol, TypeVar, Optional, List
 
 # Define generic type variable
 T = TypeVar("T")
 
 
-class BaseRepository(ABC, Generic[T]):
+class DuplicateError(Exception):
+    """Raised by a repository write that violates a unique constraint"""
+
+
+class BaseRepository(Protocol[T]):
     """
     Base Repository Interface
     
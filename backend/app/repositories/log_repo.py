@@ -4,8 +4,7 @@ Log Repository Interface
 Defines the data access interface for request logs.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import AsyncIterator, List, Tuple, Protocol
 
 from app.domain.log import (
     RequestLogModel,
@@ -18,10 +17,9 @@ from app.domain.log import (
 )
 
 
-class LogRepository(ABC):
+class LogRepository(Protocol):
     """Log Repository Interface"""
     
-    @abstractmethod
     async def create(self, data: RequestLogCreate) -> RequestLogModel:
         """
         Create Request Log
@@ -32,9 +30,20 @@ class LogRepository(ABC):
         Returns:
             RequestLogModel: Created log model
         """
-        pass
+        ...
+
+    async def create_many(self, items: List[RequestLogCreate]) -> int:
+        """
+        Create Request Logs in One Batch
+
+        Args:
+            items: Log creation data
+
+        Returns:
+            int: Number of created logs
+        """
+        ...
     
-    @abstractmethod
     async def get_by_id(self, id: int) -> RequestLogModel | None:
         """
         Get Log Details by ID
@@ -45,9 +54,8 @@ class LogRepository(ABC):
         Returns:
             RequestLogModel | None: Log model or None
         """
-        pass
+        ...
     
-    @abstractmethod
     async def query(self, query: RequestLogQuery) -> Tuple[List[RequestLogModel], int]:
         """
         Query Logs
@@ -58,9 +66,26 @@ class LogRepository(ABC):
         Returns:
             Tuple[List[RequestLogModel], int]: (Log list, Total count)
         """
-        pass
+        ...
+
+    def iter_query(
+        self, query: RequestLogQuery, paginate: bool = True
+    ) -> AsyncIterator[RequestLogModel]:
+        """
+        Stream Logs
+
+        Yields logs one by one instead of materializing the whole result.
+
+        Args:
+            query: Query conditions
+            paginate: Whether to apply the query's page/page_size (False streams
+                every matching log)
+
+        Returns:
+            AsyncIterator[RequestLogModel]: Matching logs in query order
+        """
+        ...
     
-    @abstractmethod
     async def cleanup_old_logs(self, days_to_keep: int) -> int:
         """
         Clean up old logs
@@ -71,21 +96,18 @@ class LogRepository(ABC):
         Returns:
             int: Number of deleted logs
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_cost_stats(self, query: LogCostStatsQuery) -> LogCostStatsResponse:
         """Get aggregated cost stats for logs"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_model_stats(self, requested_model: str | None = None) -> list[ModelStats]:
         """Get aggregated model stats for logs"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_model_provider_stats(
         self, requested_model: str | None = None
     ) -> list[ModelProviderStats]:
         """Get aggregated model-provider stats for logs"""
-        pass
+        ...
@@ -4,8 +4,7 @@ Model Repository Interface
 Defines the data access interface for Model Mappings and Model-Provider Mappings.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Protocol
 
 from app.domain.model import (
     ModelMapping,
@@ -18,22 +17,25 @@ from app.domain.model import (
 )
 
 
-class ModelRepository(ABC):
+class ModelRepository(Protocol):
     """Model Repository Interface"""
     
     # ============ Model Mapping ============
     
-    @abstractmethod
     async def create_mapping(self, data: ModelMappingCreate) -> ModelMapping:
-        """Create Model Mapping"""
-        pass
+        """Create Model Mapping (raises DuplicateError when the model exists)"""
+        ...
     
-    @abstractmethod
     async def get_mapping(self, requested_model: str) -> Optional[ModelMapping]:
         """Get Model Mapping"""
-        pass
+        ...
+    
+    async def mapping_and_provider_exist(
+        self, requested_model: str, provider_id: int
+    ) -> Tuple[bool, bool]:
+        """Check whether the model mapping and the provider exist (model, provider)"""
+        ...
     
-    @abstractmethod
     async def get_all_mappings(
         self,
         is_active: Optional[bool] = None,
@@ -44,33 +46,28 @@ class ModelRepository(ABC):
         strategy: Optional[str] = None
     ) -> Tuple[List[ModelMapping], int]:
         """Get Model Mapping List"""
-        pass
+        ...
     
-    @abstractmethod
     async def update_mapping(self, requested_model: str, data: ModelMappingUpdate) -> Optional[ModelMapping]:
         """Update Model Mapping"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete_mapping(self, requested_model: str) -> bool:
         """Delete Model Mapping (Cascades delete associated provider mappings)"""
-        pass
+        ...
     
     # ============ Model-Provider Mapping ============
     
-    @abstractmethod
     async def add_provider_mapping(
         self, data: ModelMappingProviderCreate
     ) -> ModelMappingProviderResponse:
         """Add Model-Provider Mapping"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_provider_mapping(self, id: int) -> Optional[ModelMappingProvider]:
         """Get Single Model-Provider Mapping"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_provider_mappings(
         self, 
         requested_model: str,
@@ -82,9 +79,8 @@ class ModelRepository(ABC):
         Returns:
             List containing provider details
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_all_provider_mappings(
         self,
         requested_model: Optional[str] = None,
@@ -92,19 +88,20 @@ class ModelRepository(ABC):
         is_active: Optional[bool] = None
     ) -> List[ModelMappingProviderResponse]:
         """Get all model-provider mappings (supports filtering)"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_provider_count(self, requested_model: str) -> int:
         """Get the count of providers associated with the model"""
-        pass
+        ...
+
+    async def get_provider_counts(self, requested_models: list[str]) -> dict[str, int]:
+        """Get provider counts for several models (models without providers are omitted)"""
+        ...
     
-    @abstractmethod
     async def update_provider_mapping(self, id: int, data: ModelMappingProviderUpdate) -> Optional[ModelMappingProvider]:
         """Update Model-Provider Mapping"""
-        pass
+        ...
     
-    @abstractmethod
     async def delete_provider_mapping(self, id: int) -> bool:
         """Delete Model-Provider Mapping"""
-        pass
+        ...
@@ -4,31 +4,30 @@ Provider Repository Interface
 Defines the data access interface for Providers.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Protocol
 
 from app.domain.provider import Provider, ProviderCreate, ProviderUpdate
 
 
-class ProviderRepository(ABC):
+class ProviderRepository(Protocol):
     """Provider Repository Interface"""
     
-    @abstractmethod
     async def create(self, data: ProviderCreate) -> Provider:
-        """Create Provider"""
-        pass
+        """Create Provider (raises DuplicateError when the name is taken)"""
+        ...
     
-    @abstractmethod
     async def get_by_id(self, id: int) -> Optional[Provider]:
         """Get Provider by ID"""
-        pass
+        ...
+    
+    async def get_by_ids(self, ids: List[int]) -> dict[int, Provider]:
+        """Get Providers by IDs in one query (missing IDs are omitted)"""
+        ...
     
-    @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Provider]:
         """Get Provider by Name"""
-        pass
+        ...
     
-    @abstractmethod
     async def get_all(
         self, 
         page: int = 1, 
@@ -38,19 +37,16 @@ class ProviderRepository(ABC):
         protocol: Optional[str] = None
     ) -> Tuple[List[Provider], int]:
         """Get Provider List (Pagination)"""
-        pass
+        ...
     
-    @abstractmethod
     async def update(self, id: int, data: ProviderUpdate) -> Optional[Provider]:
-        """Update Provider"""
-        pass
+        """Update Provider (raises DuplicateError when the name is taken)"""
+        ...
     
-    @abstractmethod
     async def delete(self, id: int) -> bool:
         """Delete Provider"""
-        pass
+        ...
 
-    @abstractmethod
     async def has_model_mappings(self, id: int) -> bool:
         """Check if provider has associated model mappings"""
-        pass
\ No newline at end of file
+        ...
\ No newline at end of file
@@ -7,16 +7,108 @@ Provides concrete database operation implementation for API Keys.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, bindparam, case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.time import ensure_utc, to_utc_naive
-from app.db.models import ApiKey as ApiKeyORM
+from app.common.ttl_cache import TTLCache
+from app.config import get_settings
+from app.db.models import ApiKey as ApiKeyORM, RequestLog as RequestLogORM
 from app.domain.api_key import ApiKeyModel, ApiKeyCreate, ApiKeyUpdate
-from app.repositories.api_key_repo import ApiKeyRepository
+from app.repositories.base import DuplicateError
 
 
-class SQLAlchemyApiKeyRepository(ApiKeyRepository):
+# Columns read into ApiKeyModel; plain rows skip ORM identity-map bookkeeping
+_API_KEY_COLUMNS = (
+    ApiKeyORM.id,
+    ApiKeyORM.key_name,
+    ApiKeyORM.key_value,
+    ApiKeyORM.is_active,
+    ApiKeyORM.created_at,
+    ApiKeyORM.last_used_at,
+)
+
+# Statement templates built once at import; values are supplied as bind
+# parameters per call, so requests skip rebuilding the expression tree
+_API_KEY_TABLE = ApiKeyORM.__table__
+_SELECT_BY_ID = select(*_API_KEY_COLUMNS).where(ApiKeyORM.id == bindparam("b_id"))
+# key_value is UNIQUE (index seek); LIMIT 1 lets planners stop at the match
+_SELECT_BY_KEY_VALUE = (
+    select(*_API_KEY_COLUMNS)
+    .where(ApiKeyORM.key_value == bindparam("b_key_value"))
+    .limit(1)
+)
+_SELECT_BY_NAME = select(*_API_KEY_COLUMNS).where(
+    ApiKeyORM.key_name == bindparam("b_key_name")
+)
+# The page carries the filtered total as a window count: one round trip
+_LIST_PAGE = (
+    select(ApiKeyORM, func.count().over().label("total"))
+    .order_by(ApiKeyORM.id.desc())
+    .offset(bindparam("b_offset"))
+    .limit(bindparam("b_limit"))
+)
+_LIST_PAGE_BY_ACTIVE = _LIST_PAGE.where(ApiKeyORM.is_active == bindparam("b_is_active"))
+_COUNT_ALL = select(func.count()).select_from(ApiKeyORM)
+_COUNT_BY_ACTIVE = _COUNT_ALL.where(ApiKeyORM.is_active == bindparam("b_is_active"))
+# Core statement: keys deleted in the meantime simply match no row
+_UPDATE_LAST_USED = (
+    update(_API_KEY_TABLE)
+    .where(_API_KEY_TABLE.c.id == bindparam("b_id"))
+    .values(last_used_at=bindparam("b_last_used_at"))
+)
+# API Keys per batched last-used UPDATE (two bind parameters per key, well
+# under database parameter limits)
+_LAST_USED_BATCH_SIZE = 500
+# Detach request logs in bulk (what the ORM delete did row by row),
+# so they survive with a NULL api_key_id
+_DETACH_REQUEST_LOGS = (
+    update(RequestLogORM)
+    .where(RequestLogORM.api_key_id == bindparam("b_id"))
+    .values(api_key_id=None)
+    .execution_options(synchronize_session=False)
+)
+_DELETE_BY_ID = (
+    delete(ApiKeyORM)
+    .where(ApiKeyORM.id == bindparam("b_id"))
+    .returning(ApiKeyORM.key_value)
+    .execution_options(synchronize_session=False)
+)
+
+_key_cache: Optional[TTLCache[str, ApiKeyModel]] = None
+
+
+def get_api_key_cache() -> Optional[TTLCache[str, ApiKeyModel]]:
+    """
+    Get the authentication lookup cache (key value -> API Key)
+
+    Returns:
+        Optional[TTLCache]: Cache instance, or None when caching is disabled
+    """
+    global _key_cache
+    settings = get_settings()
+    if settings.API_KEY_CACHE_TTL <= 0 or settings.API_KEY_CACHE_MAX_ENTRIES <= 0:
+        return None
+    if _key_cache is None:
+        _key_cache = TTLCache(
+            settings.API_KEY_CACHE_MAX_ENTRIES, settings.API_KEY_CACHE_TTL
+        )
+    return _key_cache
+
+
+def reset_api_key_cache() -> None:
+    """Drop all cached API Key lookups"""
+    global _key_cache
+    _key_cache = None
+
+
+def _invalidate_key_value(key_value: Optional[str]) -> None:
+    if key_value and _key_cache is not None:
+        _key_cache.pop(key_value)
+
+
+class SQLAlchemyApiKeyRepository:
     """
     API Key Repository SQLAlchemy Implementation
     
@@ -33,8 +125,8 @@ class SQLAlchemyApiKeyRepository(ApiKeyRepository):
         self.session = session
     
     def _to_domain(self, entity: ApiKeyORM) -> ApiKeyModel:
-        """Convert ORM entity to domain model"""
-        return ApiKeyModel(
+        """Convert ORM entity to domain model (database values are trusted)"""
+        return ApiKeyModel.model_construct(
             id=entity.id,
             key_name=entity.key_name,
             key_value=entity.key_value,
@@ -43,6 +135,17 @@ class SQLAlchemyApiKeyRepository(ApiKeyRepository):
             last_used_at=ensure_utc(entity.last_used_at),
         )
     
+    def _row_to_domain(self, row: Row) -> ApiKeyModel:
+        """Convert a selected column row to domain model (database values are trusted)"""
+        return ApiKeyModel.model_construct(
+            id=row.id,
+            key_name=row.key_name,
+            key_value=row.key_value,
+            is_active=row.is_active,
+            created_at=ensure_utc(row.created_at),
+            last_used_at=ensure_utc(row.last_used_at),
+        )
+    
     async def create(self, data: ApiKeyCreate, key_value: str) -> ApiKeyModel:
         """Create API Key"""
         entity = ApiKeyORM(
@@ -51,33 +154,52 @@ class SQLAlchemyApiKeyRepository(ApiKeyRepository):
             is_active=True,
         )
         self.session.add(entity)
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Unique constraint hit; leave the session usable for the caller
+            await self.session.rollback()
+            raise DuplicateError() from None
         await self.session.refresh(entity)
         return self._to_domain(entity)
     
     async def get_by_id(self, id: int) -> Optional[ApiKeyModel]:
         """Get API Key by ID"""
-        result = await self.session.execute(
-            select(ApiKeyORM).where(ApiKeyORM.id == id)
-        )
-        entity = result.scalar_one_or_none()
-        return self._to_domain(entity) if entity else None
+        result = await self.session.execute(_SELECT_BY_ID, {"b_id": id})
+        row = result.one_or_none()
+        return self._row_to_domain(row) if row else None
     
     async def get_by_key_value(self, key_value: str) -> Optional[ApiKeyModel]:
-        """Get API Key by key value (for authentication)"""
+        """
+        Get API Key by key value (for authentication)
+        
+        Found keys are served from the in-process cache until they expire or
+        are updated/deleted; last_used_at of a cached key may lag behind.
+        """
+        cache = get_api_key_cache()
+        if cache is not None:
+            cached = cache.get(key_value)
+            if cached is not None:
+                return cached
+        
         result = await self.session.execute(
-            select(ApiKeyORM).where(ApiKeyORM.key_value == key_value)
+            _SELECT_BY_KEY_VALUE, {"b_key_value": key_value}
         )
-        entity = result.scalar_one_or_none()
-        return self._to_domain(entity) if entity else None
+        row = result.one_or_none()
+        if not row:
+            return None
+        api_key = self._row_to_domain(row)
+        if cache is not None:
+            cache.set(key_value, api_key)
+        return api_key
     
     async def get_by_name(self, key_name: str) -> Optional[ApiKeyModel]:
         """Get API Key by name"""
         result = await self.session.execute(
-            select(ApiKeyORM).where(ApiKeyORM.key_name == key_name)
+            _SELECT_BY_NAME, {"b_key_name": key_name}
         )
-        entity = result.scalar_one_or_none()
-        return self._to_domain(entity) if entity else None
+        row = result.one_or_none()
+        return self._row_to_domain(row) if row else None
     
     async def get_all(
         self,
@@ -86,65 +208,89 @@ class SQLAlchemyApiKeyRepository(ApiKeyRepository):
         page_size: int = 20,
     ) -> tuple[list[ApiKeyModel], int]:
         """Get API Key list"""
-        query = select(ApiKeyORM)
-        count_query = select(func.count()).select_from(ApiKeyORM)
-        
-        if is_active is not None:
-            query = query.where(ApiKeyORM.is_active == is_active)
-            count_query = count_query.where(ApiKeyORM.is_active == is_active)
+        params: dict = {"b_offset": (page - 1) * page_size, "b_limit": page_size}
+        if is_active is None:
+            query, count_query = _LIST_PAGE, _COUNT_ALL
+        else:
+            query, count_query = _LIST_PAGE_BY_ACTIVE, _COUNT_BY_ACTIVE
+            params["b_is_active"] = is_active
         
-        # Get total count
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
+        rows = (await self.session.execute(query, params)).all()
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there is no row to carry the total
+            total = (await self.session.execute(count_query, params)).scalar() or 0
+        else:
+            total = 0
         
-        # Pagination
-        query = query.order_by(ApiKeyORM.id.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        
-        result = await self.session.execute(query)
-        entities = result.scalars().all()
-        
-        return [self._to_domain(e) for e in entities], total
+        return [self._to_domain(row[0]) for row in rows], total
     
     async def update(self, id: int, data: ApiKeyUpdate) -> Optional[ApiKeyModel]:
         """Update API Key"""
-        result = await self.session.execute(
-            select(ApiKeyORM).where(ApiKeyORM.id == id)
-        )
-        entity = result.scalar_one_or_none()
+        update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_by_id(id)
         
+        # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
+        try:
+            result = await self.session.execute(
+                update(ApiKeyORM)
+                .where(ApiKeyORM.id == id)
+                .values(**update_data)
+                .returning(ApiKeyORM)
+            )
+            entity = result.scalar_one_or_none()
+            await self.session.commit()
+        except IntegrityError:
+            # Unique constraint hit; leave the session usable for the caller
+            await self.session.rollback()
+            raise DuplicateError() from None
         if not entity:
             return None
-        
-        update_data = data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(entity, key, value)
-        
-        await self.session.commit()
-        await self.session.refresh(entity)
+        _invalidate_key_value(entity.key_value)
         return self._to_domain(entity)
     
     async def update_last_used(self, id: int, last_used_at: datetime) -> None:
         """Update API Key's last used time"""
-        result = await self.session.execute(
-            select(ApiKeyORM).where(ApiKeyORM.id == id)
+        await self.session.execute(
+            _UPDATE_LAST_USED,
+            {"b_id": id, "b_last_used_at": to_utc_naive(last_used_at)},
         )
-        entity = result.scalar_one_or_none()
+        await self.session.commit()
+    
+    async def update_last_used_many(self, last_used: dict[int, datetime]) -> None:
+        """
+        Update last used time for several API Keys
+
+        Each chunk of keys is one UPDATE ... SET last_used_at = CASE id ... END
+        WHERE id IN (...), rather than one UPDATE per key.
+        """
+        if not last_used:
+            return
         
-        if entity:
-            entity.last_used_at = to_utc_naive(last_used_at)
-            await self.session.commit()
+        items = list(last_used.items())
+        for start in range(0, len(items), _LAST_USED_BATCH_SIZE):
+            chunk = dict(items[start : start + _LAST_USED_BATCH_SIZE])
+            await self.session.execute(
+                update(_API_KEY_TABLE)
+                .where(_API_KEY_TABLE.c.id.in_(chunk))
+                .values(
+                    last_used_at=case(
+                        {id: to_utc_naive(used_at) for id, used_at in chunk.items()},
+                        value=_API_KEY_TABLE.c.id,
+                    )
+                )
+            )
+        await self.session.commit()
     
     async def delete(self, id: int) -> bool:
         """Delete API Key"""
-        result = await self.session.execute(
-            select(ApiKeyORM).where(ApiKeyORM.id == id)
-        )
-        entity = result.scalar_one_or_none()
-        
-        if not entity:
-            return False
-        
-        await self.session.delete(entity)
+        await self.session.execute(_DETACH_REQUEST_LOGS, {"b_id": id})
+        result = await self.session.execute(_DELETE_BY_ID, {"b_id": id})
+        key_value = result.scalar_one_or_none()
         await self.session.commit()
+        if key_value is None:
+            return False
+        _invalidate_key_value(key_value)
         return True
@@ -4,10 +4,11 @@ Log Repository SQLAlchemy Implementation
 Provides concrete database operation implementation for request logs.
 """
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import func, select, and_, or_, delete, case
+from sqlalchemy import func, select, and_, or_, delete, case, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.time import ensure_utc, to_utc_naive, utc_now
@@ -24,14 +25,20 @@ from app.domain.log import (
     ModelStats,
     ModelProviderStats,
 )
-from app.repositories.log_repo import LogRepository
+
+
+# Rows fetched per round trip when streaming log query results
+_STREAM_BATCH_SIZE = 1000
+# Rows deleted per statement by log cleanup, and the pause between statements
+_CLEANUP_BATCH_SIZE = 10000
+_CLEANUP_BATCH_PAUSE_SECONDS = 0.05
 
 
 def _pg_make_interval_minutes(minutes: int):
     return func.make_interval(0, 0, 0, 0, 0, minutes, 0)
 
 
-class SQLAlchemyLogRepository(LogRepository):
+class SQLAlchemyLogRepository:
     """
     Log Repository SQLAlchemy Implementation
     
@@ -48,9 +55,9 @@ class SQLAlchemyLogRepository(LogRepository):
         self.session = session
     
     def _to_domain(self, entity: RequestLogORM) -> RequestLogModel:
-        """Convert ORM entity to domain model"""
+        """Convert ORM entity to domain model (database values are trusted)"""
         request_time = ensure_utc(entity.request_time)
-        return RequestLogModel(
+        return RequestLogModel.model_construct(
             id=entity.id,
             request_time=request_time,
             api_key_id=entity.api_key_id,
@@ -84,44 +91,30 @@ class SQLAlchemyLogRepository(LogRepository):
             upstream_response_body=entity.upstream_response_body,
         )
     
+    def _to_row(self, data: RequestLogCreate) -> dict:
+        """Convert creation data to insert column values"""
+        row = data.model_dump()
+        row["request_time"] = to_utc_naive(data.request_time)
+        return row
+
     async def create(self, data: RequestLogCreate) -> RequestLogModel:
         """Create request log"""
-        entity = RequestLogORM(
-            request_time=to_utc_naive(data.request_time),
-            api_key_id=data.api_key_id,
-            api_key_name=data.api_key_name,
-            requested_model=data.requested_model,
-            target_model=data.target_model,
-            provider_id=data.provider_id,
-            provider_name=data.provider_name,
-            retry_count=data.retry_count,
-            matched_provider_count=data.matched_provider_count,
-            first_byte_delay_ms=data.first_byte_delay_ms,
-            total_time_ms=data.total_time_ms,
-            input_tokens=data.input_tokens,
-            output_tokens=data.output_tokens,
-            total_cost=data.total_cost,
-            input_cost=data.input_cost,
-            output_cost=data.output_cost,
-            price_source=data.price_source,
-            request_headers=data.request_headers,
-            response_headers=data.response_headers,
-            request_body=data.request_body,
-            response_status=data.response_status,
-            response_body=data.response_body,
-            usage_details=data.usage_details,
-            error_info=data.error_info,
-            trace_id=data.trace_id,
-            is_stream=data.is_stream,
-            request_protocol=data.request_protocol,
-            supplier_protocol=data.supplier_protocol,
-            converted_request_body=data.converted_request_body,
-            upstream_response_body=data.upstream_response_body,
+        result = await self.session.execute(
+            insert(RequestLogORM).values(**self._to_row(data)).returning(RequestLogORM)
         )
-        self.session.add(entity)
+        log = self._to_domain(result.scalar_one())
         await self.session.commit()
-        await self.session.refresh(entity)
-        return self._to_domain(entity)
+        return log
+
+    async def create_many(self, items: list[RequestLogCreate]) -> int:
+        """Create request logs in one executemany insert"""
+        if not items:
+            return 0
+        await self.session.execute(
+            insert(RequestLogORM), [self._to_row(data) for data in items]
+        )
+        await self.session.commit()
+        return len(items)
     
     async def get_by_id(self, id: int) -> Optional[RequestLogModel]:
         """Get log by ID"""
@@ -131,17 +124,8 @@ class SQLAlchemyLogRepository(LogRepository):
         entity = result.scalar_one_or_none()
         return self._to_domain(entity) if entity else None
     
-    async def query(self, query: RequestLogQuery) -> tuple[list[RequestLogModel], int]:
-        """
-        Query log list
-        
-        Supports multi-condition filtering, pagination, and sorting.
-        """
-        # Build base query
-        stmt = select(RequestLogORM)
-        count_stmt = select(func.count()).select_from(RequestLogORM)
-        
-        # Build filter conditions list
+    def _query_conditions(self, query: RequestLogQuery) -> list:
+        """Build filter conditions for a log query"""
         conditions = []
         
         # Time range filter
@@ -212,36 +196,82 @@ class SQLAlchemyLogRepository(LogRepository):
             conditions.append(RequestLogORM.total_time_ms >= query.total_time_min)
         if query.total_time_max is not None:
             conditions.append(RequestLogORM.total_time_ms <= query.total_time_max)
-        
-        # Apply filter conditions
+        return conditions
+
+    def _query_statement(self, query: RequestLogQuery, conditions: list, paginate: bool):
+        """Build the sorted (and optionally paginated) log select statement"""
+        stmt = select(RequestLogORM)
         if conditions:
             stmt = stmt.where(and_(*conditions))
-            count_stmt = count_stmt.where(and_(*conditions))
-        
-        # Get total count
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar() or 0
-        
+
         # Sorting
         sort_column = getattr(RequestLogORM, query.sort_by, RequestLogORM.request_time)
         if query.sort_order == "asc":
             stmt = stmt.order_by(sort_column.asc())
         else:
             stmt = stmt.order_by(sort_column.desc())
-        
+
         # Pagination
-        stmt = stmt.offset((query.page - 1) * query.page_size).limit(query.page_size)
+        if paginate:
+            stmt = stmt.offset((query.page - 1) * query.page_size).limit(query.page_size)
+        return stmt
+
+    async def query(self, query: RequestLogQuery) -> tuple[list[RequestLogModel], int]:
+        """
+        Query log list
         
-        # Execute query
-        result = await self.session.execute(stmt)
-        entities = result.scalars().all()
+        Supports multi-condition filtering, pagination, and sorting.
+        """
+        conditions = self._query_conditions(query)
+        # Page of logs with the filtered total as a window count (one round trip)
+        stmt = self._query_statement(query, conditions, paginate=True).add_columns(
+            func.count().over().label("total")
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            total = rows[0].total
+        elif query.page > 1:
+            # Past the last page there is no row to carry the total
+            count_stmt = select(func.count()).select_from(RequestLogORM)
+            if conditions:
+                count_stmt = count_stmt.where(and_(*conditions))
+            total = (await self.session.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
 
-        return [self._to_domain(e) for e in entities], total
+        return [self._to_domain(row[0]) for row in rows], total
+
+    async def iter_query(
+        self, query: RequestLogQuery, paginate: bool = True
+    ) -> AsyncIterator[RequestLogModel]:
+        """
+        Stream logs matching the query
+
+        Rows are fetched from a streaming result in batches of
+        _STREAM_BATCH_SIZE, so only one batch is held in memory at a time.
+        """
+        stmt = self._query_statement(query, self._query_conditions(query), paginate)
+        async for log in self._iter_statement(stmt):
+            yield log
+
+    async def _iter_statement(self, stmt) -> AsyncIterator[RequestLogModel]:
+        """Execute a log select as a streaming result and yield domain models"""
+        result = await self.session.stream(
+            stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        try:
+            async for entity in result.scalars():
+                yield self._to_domain(entity)
+        finally:
+            await result.close()
 
     async def cleanup_old_logs(self, days_to_keep: int) -> int:
         """
         Delete logs older than specified days
 
+        Deletes in batches of _CLEANUP_BATCH_SIZE rows, committing each batch,
+        so no single statement holds the write lock for long.
+
         Args:
             days_to_keep: Number of days to keep logs
 
@@ -251,10 +281,27 @@ class SQLAlchemyLogRepository(LogRepository):
         cutoff_time = to_utc_naive(utc_now() - timedelta(days=days_to_keep))
         if cutoff_time is None:
             return 0
-        stmt = delete(RequestLogORM).where(RequestLogORM.request_time < cutoff_time)
-        result = await self.session.execute(stmt)
-        await self.session.commit()
-        return result.rowcount
+        # DELETE ... LIMIT is not portable (SQLite lacks it); pick ids through a
+        # limited subquery on the request_time index instead
+        batch_ids = (
+            select(RequestLogORM.id)
+            .where(RequestLogORM.request_time < cutoff_time)
+            .limit(_CLEANUP_BATCH_SIZE)
+            .scalar_subquery()
+        )
+        stmt = delete(RequestLogORM).where(RequestLogORM.id.in_(batch_ids))
+
+        deleted = 0
+        while True:
+            result = await self.session.execute(
+                stmt.execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            deleted += result.rowcount
+            if result.rowcount < _CLEANUP_BATCH_SIZE:
+                return deleted
+            # Let queued log writes in between batches
+            await asyncio.sleep(_CLEANUP_BATCH_PAUSE_SECONDS)
 
     async def get_cost_stats(self, query: LogCostStatsQuery) -> LogCostStatsResponse:
         conditions = []
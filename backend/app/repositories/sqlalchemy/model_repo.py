@@ -6,10 +6,12 @@ Provides concrete database operation implementation for Model Mappings and Model
 
 from typing import Optional
 
-from sqlalchemy import func, select, delete, or_
+from sqlalchemy import func, select, delete, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.common.routing_cache import invalidate_routing_cache
 from app.common.time import ensure_utc, to_utc_naive, utc_now
 from app.db.models import (
     ModelMapping as ModelMappingORM,
@@ -25,10 +27,10 @@ from app.domain.model import (
     ModelMappingProviderUpdate,
     ModelMappingProviderResponse,
 )
-from app.repositories.model_repo import ModelRepository
+from app.repositories.base import DuplicateError
 
 
-class SQLAlchemyModelRepository(ModelRepository):
+class SQLAlchemyModelRepository:
     """
     Model Repository SQLAlchemy Implementation
     
@@ -103,7 +105,13 @@ class SQLAlchemyModelRepository(ModelRepository):
             output_price=data.output_price,
         )
         self.session.add(entity)
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Unique constraint hit; leave the session usable for the caller
+            await self.session.rollback()
+            raise DuplicateError() from None
+        invalidate_routing_cache()
         await self.session.refresh(entity)
         return self._mapping_to_domain(entity)
     
@@ -117,6 +125,23 @@ class SQLAlchemyModelRepository(ModelRepository):
         entity = result.scalar_one_or_none()
         return self._mapping_to_domain(entity) if entity else None
     
+    async def mapping_and_provider_exist(
+        self, requested_model: str, provider_id: int
+    ) -> tuple[bool, bool]:
+        """Check that a model mapping and a provider exist, in one round trip"""
+        result = await self.session.execute(
+            select(
+                select(ModelMappingORM.requested_model)
+                .where(ModelMappingORM.requested_model == requested_model)
+                .exists(),
+                select(ServiceProvider.id)
+                .where(ServiceProvider.id == provider_id)
+                .exists(),
+            )
+        )
+        model_exists, provider_exists = result.one()
+        return bool(model_exists), bool(provider_exists)
+    
     async def get_all_mappings(
         self,
         is_active: Optional[bool] = None,
@@ -150,42 +175,40 @@ class SQLAlchemyModelRepository(ModelRepository):
             query = query.where(ModelMappingORM.strategy == strategy)
             count_query = count_query.where(ModelMappingORM.strategy == strategy)
         
-        # Get total count
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Pagination
+        # Pagination, with the filtered total as a window count (one round trip)
+        query = query.add_columns(func.count().over().label("total"))
         query = query.order_by(ModelMappingORM.requested_model)
         query = query.offset((page - 1) * page_size).limit(page_size)
         
-        result = await self.session.execute(query)
-        entities = result.scalars().all()
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there is no row to carry the total
+            total = (await self.session.execute(count_query)).scalar() or 0
+        else:
+            total = 0
         
-        return [self._mapping_to_domain(e) for e in entities], total
+        return [self._mapping_to_domain(row[0]) for row in rows], total
     
     async def update_mapping(
         self, requested_model: str, data: ModelMappingUpdate
     ) -> Optional[ModelMapping]:
         """Update Model Mapping"""
+        update_data = data.model_dump(exclude_unset=True)
+        update_data["updated_at"] = to_utc_naive(utc_now())
+        
+        # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
         result = await self.session.execute(
-            select(ModelMappingORM).where(
-                ModelMappingORM.requested_model == requested_model
-            )
+            update(ModelMappingORM)
+            .where(ModelMappingORM.requested_model == requested_model)
+            .values(**update_data)
+            .returning(ModelMappingORM)
         )
         entity = result.scalar_one_or_none()
-        
-        if not entity:
-            return None
-        
-        update_data = data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(entity, key, value)
-        
-        entity.updated_at = to_utc_naive(utc_now())
-        
         await self.session.commit()
-        await self.session.refresh(entity)
-        return self._mapping_to_domain(entity)
+        invalidate_routing_cache()
+        return self._mapping_to_domain(entity) if entity else None
     
     async def delete_mapping(self, requested_model: str) -> bool:
         """Delete Model Mapping (Cascades delete associated provider mappings)"""
@@ -201,6 +224,7 @@ class SQLAlchemyModelRepository(ModelRepository):
         
         await self.session.delete(entity)
         await self.session.commit()
+        invalidate_routing_cache()
         return True
     
     # ============ Model-Provider Mapping Operations ============
@@ -229,6 +253,7 @@ class SQLAlchemyModelRepository(ModelRepository):
         )
         self.session.add(entity)
         await self.session.commit()
+        invalidate_routing_cache()
         await self.session.refresh(entity)
         
         # Get provider name
@@ -326,6 +351,7 @@ class SQLAlchemyModelRepository(ModelRepository):
         entity.updated_at = to_utc_naive(utc_now())
         
         await self.session.commit()
+        invalidate_routing_cache()
         await self.session.refresh(entity)
         
         provider_name = entity.provider.name if entity.provider else ""
@@ -344,6 +370,7 @@ class SQLAlchemyModelRepository(ModelRepository):
         
         await self.session.delete(entity)
         await self.session.commit()
+        invalidate_routing_cache()
         return True
     
     async def get_provider_count(self, requested_model: str) -> int:
@@ -354,3 +381,14 @@ class SQLAlchemyModelRepository(ModelRepository):
             .where(ModelMappingProviderORM.requested_model == requested_model)
         )
         return result.scalar() or 0
+
+    async def get_provider_counts(self, requested_models: list[str]) -> dict[str, int]:
+        """Get provider counts for several models in one grouped query"""
+        if not requested_models:
+            return {}
+        result = await self.session.execute(
+            select(ModelMappingProviderORM.requested_model, func.count())
+            .where(ModelMappingProviderORM.requested_model.in_(requested_models))
+            .group_by(ModelMappingProviderORM.requested_model)
+        )
+        return dict(result.tuples().all())
@@ -7,15 +7,17 @@ Provides concrete database operation implementation for Provider data.
 from typing import Optional
 
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.routing_cache import invalidate_routing_cache
 from app.common.time import ensure_utc, to_utc_naive, utc_now
 from app.db.models import ServiceProvider, ModelMappingProvider as ModelMappingProviderORM
 from app.domain.provider import Provider, ProviderCreate, ProviderUpdate
-from app.repositories.provider_repo import ProviderRepository
+from app.repositories.base import DuplicateError
 
 
-class SQLAlchemyProviderRepository(ProviderRepository):
+class SQLAlchemyProviderRepository:
     """
     Provider Repository SQLAlchemy Implementation
     
@@ -70,7 +72,12 @@ class SQLAlchemyProviderRepository(ProviderRepository):
             is_active=data.is_active,
         )
         self.session.add(entity)
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Unique constraint hit; leave the session usable for the caller
+            await self.session.rollback()
+            raise DuplicateError() from None
         await self.session.refresh(entity)
         return self._to_domain(entity)
     
@@ -82,6 +89,15 @@ class SQLAlchemyProviderRepository(ProviderRepository):
         entity = result.scalar_one_or_none()
         return self._to_domain(entity) if entity else None
     
+    async def get_by_ids(self, ids: list[int]) -> dict[int, Provider]:
+        """Get Providers by IDs in one query (missing IDs are omitted)"""
+        if not ids:
+            return {}
+        result = await self.session.execute(
+            select(ServiceProvider).where(ServiceProvider.id.in_(set(ids)))
+        )
+        return {entity.id: self._to_domain(entity) for entity in result.scalars()}
+    
     async def get_by_name(self, name: str) -> Optional[Provider]:
         """Get Provider by Name"""
         result = await self.session.execute(
@@ -145,7 +161,13 @@ class SQLAlchemyProviderRepository(ProviderRepository):
         
         entity.updated_at = to_utc_naive(utc_now())
         
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Unique constraint hit; leave the session usable for the caller
+            await self.session.rollback()
+            raise DuplicateError() from None
+        invalidate_routing_cache()
         await self.session.refresh(entity)
         return self._to_domain(entity)
     
@@ -161,6 +183,7 @@ class SQLAlchemyProviderRepository(ProviderRepository):
         
         await self.session.delete(entity)
         await self.session.commit()
+        invalidate_routing_cache()
         return True
     
     async def has_model_mappings(self, id: int) -> bool:
@@ -8,11 +8,35 @@ from typing import Optional
 
 from app.rules.context import RuleContext
 from app.rules.models import RuleSet, CandidateProvider
-from app.rules.evaluator import RuleEvaluator
+from app.rules.evaluator import RuleEvaluator, evaluate_ruleset
 from app.domain.model import ModelMapping, ModelMappingProviderResponse
 from app.domain.provider import Provider
 
 
+def compile_provider_rules(
+    provider_mappings: list[ModelMappingProviderResponse],
+) -> dict[int, Optional[RuleSet]]:
+    """
+    Compile each provider mapping's rules once, for reuse across evaluations
+
+    Args:
+        provider_mappings: List of model-provider mappings
+
+    Returns:
+        dict[int, Optional[RuleSet]]: Rule set by provider mapping ID (None = no rules)
+    """
+    return {pm.id: RuleSet.from_dict(pm.provider_rules) for pm in provider_mappings}
+
+
+def _provider_rule_set(
+    pm: ModelMappingProviderResponse,
+    rule_sets: Optional[dict[int, Optional[RuleSet]]],
+) -> Optional[RuleSet]:
+    if rule_sets is not None and pm.id in rule_sets:
+        return rule_sets[pm.id]
+    return RuleSet.from_dict(pm.provider_rules)
+
+
 class RuleEngine:
     """
     Rule Engine
@@ -38,6 +62,7 @@ class RuleEngine:
         model_mapping: ModelMapping,
         provider_mappings: list[ModelMappingProviderResponse],
         providers: dict[int, Provider],
+        rule_sets: Optional[dict[int, Optional[RuleSet]]] = None,
     ) -> list[CandidateProvider]:
         """
         Evaluate all rules, return list of candidate providers
@@ -47,6 +72,8 @@ class RuleEngine:
             model_mapping: Model mapping configuration
             provider_mappings: List of model-provider mappings
             providers: Provider dictionary (provider_id -> Provider)
+            rule_sets: Provider rules already compiled, by provider mapping ID;
+                mappings not in it are compiled from provider_rules
 
         Returns:
             list[CandidateProvider]: List of candidate providers (sorted by priority)
@@ -65,8 +92,8 @@ class RuleEngine:
                 continue
             
             # Check provider-level rules
-            provider_rules = RuleSet.from_dict(pm.provider_rules)
-            if self.evaluator.evaluate_ruleset(provider_rules, context):
+            provider_rules = _provider_rule_set(pm, rule_sets)
+            if evaluate_ruleset(provider_rules, context):
                 # Rules passed, add to candidate list
                 candidates.append(
                     CandidateProvider(
@@ -102,6 +129,7 @@ class RuleEngine:
         model_mapping: ModelMapping,
         provider_mappings: list[ModelMappingProviderResponse],
         providers: dict[int, Provider],
+        rule_sets: Optional[dict[int, Optional[RuleSet]]] = None,
     ) -> list[CandidateProvider]:
         """
         Synchronous version of rule evaluation (for testing or synchronous scenarios)
@@ -119,8 +147,8 @@ class RuleEngine:
             if not provider or not provider.is_active:
                 continue
             
-            provider_rules = RuleSet.from_dict(pm.provider_rules)
-            if self.evaluator.evaluate_ruleset(provider_rules, context):
+            provider_rules = _provider_rule_set(pm, rule_sets)
+            if evaluate_ruleset(provider_rules, context):
                 candidates.append(
                     CandidateProvider(
                         provider_id=provider.id,
@@ -4,8 +4,30 @@ Rule Model Definition Module
 Defines data structures used by the rule engine.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
+
+from app.rules.operators import OPERATORS, Operator, prepare_operand
+from app.rules.path_compiler import Accessor, build_accessor
+from app.rules.ruleset_compiler import Matcher, build_matcher
+
+# Relative evaluation cost per operator; rule sets evaluate cheap rules first so
+# AND/OR short-circuits before reaching string scans and regexes
+_OPERATOR_COST = {
+    "exists": 0,
+    "eq": 0,
+    "ne": 0,
+    "gt": 1,
+    "gte": 1,
+    "lt": 1,
+    "lte": 1,
+    "in": 1,
+    "not_in": 1,
+    "contains": 2,
+    "not_contains": 2,
+    "regex": 3,
+}
 
 
 @dataclass
@@ -17,13 +39,25 @@ class Rule:
     
     Attributes:
         field: Matching field path (e.g., "model", "headers.x-priority", "body.temperature")
-        operator: Operator (e.g., "eq", "gt", "contains")
+        operator: Operator (e.g., "eq", "gt", "contains"), normalized to lower case
         value: Expected value
+        accessor: Compiled reader for the field path (derived from field)
+        operand: Expected value prepared for the operator (derived from value)
+        evaluate: Operator implementation, None for unknown operators (derived)
     """
     
     field: str
     operator: str
     value: Any
+    accessor: Accessor = field(init=False, repr=False, compare=False)
+    operand: Any = field(init=False, repr=False, compare=False)
+    evaluate: Optional[Operator] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.operator = sys.intern(self.operator.lower())
+        self.accessor = build_accessor(self.field)
+        self.operand = prepare_operand(self.operator, self.value)
+        self.evaluate = OPERATORS.get(self.operator)
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Rule":
@@ -45,10 +79,30 @@ class RuleSet:
     Attributes:
         rules: List of rules
         logic: Logic operator, "AND" or "OR", defaults to "AND"
+        evaluation_order: Rules sorted cheapest operator first (derived from rules)
+        operands: Expected value of each rule, in evaluation order (derived)
+        matcher: Compiled function evaluating the whole set (derived)
     """
     
     rules: list[Rule] = field(default_factory=list)
     logic: str = "AND"  # "AND" or "OR"
+    evaluation_order: tuple[Rule, ...] = field(init=False, repr=False, compare=False)
+    operands: tuple[Any, ...] = field(init=False, repr=False, compare=False)
+    matcher: Matcher = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Rules have no side effects, so only the cost of evaluation depends on order
+        self.evaluation_order = tuple(
+            sorted(
+                self.rules,
+                key=lambda rule: _OPERATOR_COST.get(rule.operator, 0),
+            )
+        )
+        self.operands = tuple(rule.operand for rule in self.evaluation_order)
+        self.matcher = build_matcher(
+            self.logic,
+            tuple((rule.field, rule.operator) for rule in self.evaluation_order),
+        )
     
     @classmethod
     def from_dict(cls, data: Optional[dict[str, Any]]) -> Optional["RuleSet"]:
@@ -81,12 +135,13 @@ class RuleSet:
         return len(self.rules) == 0
 
 
-@dataclass
-class CandidateProvider:
+class CandidateProvider(NamedTuple):
     """
     Candidate Provider
 
     Candidate provider information output after rule engine matching.
+    Read-only once built; a tuple keeps per-candidate cost low as the rule
+    engine produces several per request.
 
     Attributes:
         provider_id: Provider ID
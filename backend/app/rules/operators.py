@@ -0,0 +1,163 @@
+"""
+Rule Operator Module
+
+Implements the rule operators as plain functions of (actual, expected), shared
+by single-rule evaluation and compiled rule sets.
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+Operator = Callable[[Any, Any], bool]
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> Optional[re.Pattern[str]]:
+    """Compile a rule regex once per distinct pattern; None if it is invalid"""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+# Equal / Not Equal: the C-level comparisons themselves, no Python frame per call.
+# The ordering operators below keep inline comparisons, which beat calling
+# operator.gt & co. from a shared None/TypeError-guarding wrapper.
+op_eq: Operator = operator.eq
+op_ne: Operator = operator.ne
+
+
+def op_gt(actual: Any, expected: Any) -> bool:
+    """Greater Than"""
+    if actual is None:
+        return False
+    try:
+        return actual > expected
+    except TypeError:
+        # Incomparable types (e.g. str vs int) do not match
+        return False
+
+
+def op_gte(actual: Any, expected: Any) -> bool:
+    """Greater Than or Equal"""
+    if actual is None:
+        return False
+    try:
+        return actual >= expected
+    except TypeError:
+        return False
+
+
+def op_lt(actual: Any, expected: Any) -> bool:
+    """Less Than"""
+    if actual is None:
+        return False
+    try:
+        return actual < expected
+    except TypeError:
+        return False
+
+
+def op_lte(actual: Any, expected: Any) -> bool:
+    """Less Than or Equal"""
+    if actual is None:
+        return False
+    try:
+        return actual <= expected
+    except TypeError:
+        return False
+
+
+def op_contains(actual: Any, expected: str) -> bool:
+    """Contains (string; expected already str, see prepare_operand)"""
+    if actual is None or not isinstance(actual, str):
+        return False
+    return expected in actual
+
+
+def op_not_contains(actual: Any, expected: str) -> bool:
+    """Not Contains (string; expected already str, see prepare_operand)"""
+    if actual is None or not isinstance(actual, str):
+        return True
+    return expected not in actual
+
+
+def op_regex(actual: Any, expected: Optional[re.Pattern[str]]) -> bool:
+    """Regular Expression Match (expected already compiled, see prepare_operand)"""
+    if actual is None or not isinstance(actual, str):
+        return False
+    return expected is not None and expected.search(actual) is not None
+
+
+def op_in(actual: Any, expected: Any) -> bool:
+    """In List"""
+    if isinstance(expected, frozenset):
+        try:
+            return actual in expected
+        except TypeError:
+            # Unhashable values (dict/list) never equal the hashable members
+            return False
+    if not isinstance(expected, (list, tuple)):
+        return False
+    return actual in expected
+
+
+def op_not_in(actual: Any, expected: Any) -> bool:
+    """Not In List"""
+    return not op_in(actual, expected)
+
+
+def op_exists(actual: Any, expected: Any) -> bool:
+    """Field Exists"""
+    exists = actual is not None
+    # When expected is True, check exists; when False, check not exists
+    if expected:
+        return exists
+    return not exists
+
+
+def prepare_operand(operator: str, value: Any) -> Any:
+    """
+    Convert a rule's expected value into the form its operator reads fastest
+
+    contains/not_contains values are converted to str and regex values are
+    compiled (None when invalid), so neither happens per evaluation. List
+    values of in/not_in become frozensets when every member is hashable,
+    turning membership into a hash lookup. Other values are returned as-is.
+
+    Args:
+        operator: Lower-cased operator
+        value: Expected value from the rule definition
+
+    Returns:
+        Any: Operand passed to the operator implementation
+    """
+    if operator in ("contains", "not_contains"):
+        return str(value)
+    if operator == "regex":
+        return _compile_regex(str(value))
+    if operator in ("in", "not_in") and isinstance(value, (list, tuple)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            return value
+    return value
+
+
+# Operator name -> implementation
+OPERATORS: dict[str, Operator] = {
+    "eq": op_eq,
+    "ne": op_ne,
+    "gt": op_gt,
+    "gte": op_gte,
+    "lt": op_lt,
+    "lte": op_lte,
+    "contains": op_contains,
+    "not_contains": op_not_contains,
+    "regex": op_regex,
+    "in": op_in,
+    "not_in": op_not_in,
+    "exists": op_exists,
+}
@@ -0,0 +1,124 @@
+"""
+Rule Field Path Compiler Module
+
+Turns rule field paths into specialized accessor functions, so evaluating a rule
+does no path parsing at all.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from app.rules.context import RuleContext
+
+# Compiled path step: (dict key, list index or None)
+PathStep = tuple[str, Optional[int]]
+Accessor = Callable[["RuleContext"], Any]
+
+# Context attribute holding the object each nested root walks into
+_NESTED_ROOTS = {"headers": "headers", "body": "request_body"}
+_TOKEN_USAGE_FIELDS = frozenset({"input_tokens", "output_tokens", "total_tokens"})
+# Only these names are visible to generated accessors
+_ACCESSOR_BUILTINS = {"isinstance": isinstance, "len": len, "dict": dict, "list": list}
+
+
+def _return_none(context: "RuleContext") -> None:
+    return None
+
+
+@lru_cache(maxsize=1024)
+def parse_path(field_path: str) -> tuple[str, Optional[tuple[PathStep, ...]]]:
+    """
+    Parse a field path into its root and access steps
+
+    "body.messages[0].role" -> ("body", (("messages", 0), ("role", None))).
+    Steps are None when an array index is not an integer (never matches).
+
+    Args:
+        field_path: Field path
+
+    Returns:
+        tuple: (lower-cased root, steps)
+    """
+    parts = field_path.split(".")
+    root = parts[0].lower()
+    if root == "token_usage":
+        # Only the first sub-field is used, taken verbatim
+        return root, ((parts[1], None),) if len(parts) > 1 else ()
+
+    steps: list[PathStep] = []
+    for part in parts[1:]:
+        # Handle array index, e.g., "messages[0]"
+        if "[" in part and part.endswith("]"):
+            bracket = part.index("[")
+            try:
+                index = int(part[bracket + 1:-1])
+            except ValueError:
+                return root, None
+            steps.append((part[:bracket], index))
+        else:
+            steps.append((part, None))
+    return root, tuple(steps)
+
+
+def _accessor_source(attribute: str, steps: tuple[PathStep, ...]) -> Optional[str]:
+    """Emit straight-line accessor source; None if the path can never match"""
+    lines = ["def accessor(c):", f"    v = c.{attribute}"]
+    for key, index in steps:
+        lines += [
+            f"    if not isinstance(v, dict) or {key!r} not in v:",
+            "        return None",
+            f"    v = v[{key!r}]",
+        ]
+        if index is not None:
+            if index < 0:
+                return None
+            lines += [
+                f"    if not isinstance(v, list) or len(v) <= {index}:",
+                "        return None",
+                f"    v = v[{index}]",
+            ]
+    lines.append("    return v")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1024)
+def build_accessor(field_path: str) -> Accessor:
+    """
+    Build an accessor function for a field path
+
+    Nested paths are compiled into a function with the keys and indexes
+    inlined, e.g. "body.messages[0].role" reads c.request_body["messages"][0]["role"]
+    behind the same type and bounds checks as a generic walk. Keys only reach
+    the generated source through repr().
+
+    Args:
+        field_path: Field path
+
+    Returns:
+        Accessor: Function taking a RuleContext and returning the value or None
+    """
+    if not field_path:
+        return _return_none
+
+    root, steps = parse_path(field_path)
+    if root == "model":
+        return lambda context: context.current_model
+    if root == "token_usage":
+        if not steps:
+            return lambda context: context.token_usage
+        field_name = steps[0][0]
+        if field_name not in _TOKEN_USAGE_FIELDS:
+            return _return_none
+        return lambda context: getattr(context.token_usage, field_name)
+
+    attribute = _NESTED_ROOTS.get(root)
+    if attribute is None or steps is None:
+        return _return_none
+    source = _accessor_source(attribute, steps)
+    if source is None:
+        return _return_none
+
+    namespace: dict[str, Any] = {"__builtins__": _ACCESSOR_BUILTINS}
+    exec(compile(source, f"<rule path {field_path!r}>", "exec"), namespace)
+    return namespace["accessor"]
@@ -0,0 +1,83 @@
+"""
+Rule Set Compiler Module
+
+Turns a rule set into one generated function, so evaluating it is a single call
+with no per-rule operator dispatch.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
+
+from app.rules.operators import OPERATORS
+from app.rules.path_compiler import build_accessor
+
+if TYPE_CHECKING:
+    from app.rules.context import RuleContext
+
+# Compiled rule set: (context, operand per rule in shape order) -> matched
+Matcher = Callable[["RuleContext", tuple[Any, ...]], bool]
+# Rule shape: (field path, lower-cased operator)
+RuleShape = tuple[str, str]
+
+
+def _match_all(context: "RuleContext", operands: tuple[Any, ...]) -> bool:
+    return True
+
+
+@lru_cache(maxsize=1024)
+def build_matcher(logic: str, shape: tuple[RuleShape, ...]) -> Matcher:
+    """
+    Build a matcher function for a rule set shape
+
+    Only fields and operators are compiled in; the expected values are passed
+    on each call, so rule sets differing only in values share one function.
+    E.g. AND over (("model", "eq"), ("body.stream", "exists")) becomes
+    "return op0(a0(c), v[0]) and op1(a1(c), v[1])" with the operator
+    implementations and field accessors bound as globals. A field used by
+    several rules is resolved once, by the first of them, and reused.
+
+    Args:
+        logic: "OR", anything else is AND
+        shape: Rules in evaluation order
+
+    Returns:
+        Matcher: Function taking a RuleContext and the operands, in shape order
+    """
+    if not shape:
+        return _match_all
+
+    namespace: dict[str, Any] = {"__builtins__": {}}
+    known = [
+        (i, field_path, OPERATORS.get(operator))
+        for i, (field_path, operator) in enumerate(shape)
+    ]
+    # Fields read by more than one rule are resolved once and reused
+    uses: dict[str, int] = {}
+    for _, field_path, implementation in known:
+        if implementation is not None:
+            uses[field_path] = uses.get(field_path, 0) + 1
+    bound: dict[str, str] = {}
+
+    terms = []
+    for i, field_path, implementation in known:
+        if implementation is None:
+            # Unknown operator, never matches
+            terms.append("False")
+            continue
+        namespace[f"op{i}"] = implementation
+        if field_path in bound:
+            actual = bound[field_path]
+        else:
+            namespace[f"a{i}"] = build_accessor(field_path)
+            actual = f"a{i}(c)"
+            if uses[field_path] > 1:
+                # A pure and/or chain evaluates terms in order, so every later
+                # term on this field runs after this binding
+                bound[field_path] = f"f{i}"
+                actual = f"(f{i} := {actual})"
+        terms.append(f"op{i}({actual}, v[{i}])")
+
+    joiner = " or " if logic == "OR" else " and "
+    source = f"def matcher(c, v):\n    return {joiner.join(terms)}"
+    exec(compile(source, f"<rule set {logic} x{len(shape)}>", "exec"), namespace)
+    return namespace["matcher"]
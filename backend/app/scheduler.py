@@ -1,24 +1,26 @@
 """
 Scheduled Task Module
 
-Uses APScheduler to manage scheduled tasks, such as log cleanup.
+Runs scheduled tasks, such as log cleanup, as asyncio tasks on the
+application's event loop.
 """
 
+import asyncio
 import logging
-from typing import Optional
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
 
 from app.config import get_settings
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal
 from app.repositories.sqlalchemy.log_repo import SQLAlchemyLogRepository
+from app.services.api_key_usage import flush_last_used
 from app.services.log_service import LogService
 
 logger = logging.getLogger(__name__)
 
-# Global Scheduler Instance
-_scheduler: Optional[AsyncIOScheduler] = None
+# Running scheduled task loops, and the event that tells them to stop
+_tasks: list[asyncio.Task] = []
+_stop: Optional[asyncio.Event] = None
 
 
 async def cleanup_logs_task():
@@ -33,77 +35,113 @@ async def cleanup_logs_task():
     )
 
     try:
-        # Get database session
-        async for db in get_db():
-            # Create service instance
-            log_repo = SQLAlchemyLogRepository(db)
-            log_service = LogService(log_repo)
-
-            # Execute cleanup
+        async with AsyncSessionLocal() as db:
+            log_service = LogService(SQLAlchemyLogRepository(db))
             deleted_count = await log_service.cleanup_old_logs(
                 settings.LOG_RETENTION_DAYS
             )
-            logger.info(f"Log cleanup task completed: {deleted_count} logs deleted")
-            break  # Only one iteration needed
+        logger.info(f"Log cleanup task completed: {deleted_count} logs deleted")
 
     except Exception as e:
         logger.error(f"Log cleanup task failed: {str(e)}", exc_info=True)
 
 
+def _seconds_until_hour(hour: int, now: datetime) -> float:
+    """Seconds from now until the next hour:00 (same timezone as now)"""
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+async def _run_job(name: str, job: Callable[[], Awaitable[object]]) -> None:
+    try:
+        await job()
+    except Exception:
+        logger.exception(f"Scheduled task failed: {name}")
+
+
+async def _wait_stopped(stop: asyncio.Event, delay: float) -> bool:
+    """Sleep for delay seconds; True if the scheduler was stopped meanwhile"""
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=delay)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def _run_daily(
+    stop: asyncio.Event, name: str, hour: int, job: Callable[[], Awaitable[object]]
+) -> None:
+    """Run job every day at hour:00 server local time until stopped"""
+    # Recomputed before every run, so daylight saving changes are picked up
+    while not await _wait_stopped(
+        stop, _seconds_until_hour(hour, datetime.now().astimezone())
+    ):
+        await _run_job(name, job)
+
+
+async def _run_every(
+    stop: asyncio.Event, name: str, seconds: float, job: Callable[[], Awaitable[object]]
+) -> None:
+    """Run job every given number of seconds until stopped"""
+    while not await _wait_stopped(stop, seconds):
+        await _run_job(name, job)
+
+
 def start_scheduler():
     """
     Start Scheduled Task Scheduler
 
-    Initializes the scheduler and adds all scheduled tasks.
+    Starts one task per scheduled job on the running event loop.
     """
-    global _scheduler
+    global _stop
 
-    if _scheduler is not None:
+    if _stop is not None:
         logger.warning("Scheduler already started")
         return
 
     settings = get_settings()
-
-    # Create scheduler
-    _scheduler = AsyncIOScheduler()
+    _stop = asyncio.Event()
 
     # Add log cleanup task (Executes daily at configured time)
-    _scheduler.add_job(
-        cleanup_logs_task,
-        trigger=CronTrigger(hour=settings.LOG_CLEANUP_HOUR, minute=0),
-        id="cleanup_old_logs",
-        name="Clean up old logs",
-        replace_existing=True,
+    _tasks.append(
+        asyncio.create_task(
+            _run_daily(_stop, "cleanup_old_logs", settings.LOG_CLEANUP_HOUR, cleanup_logs_task)
+        )
     )
 
-    # Start scheduler
-    _scheduler.start()
+    # Add API Key last-used flush task
+    if settings.API_KEY_LAST_USED_FLUSH_SECONDS > 0:
+        _tasks.append(
+            asyncio.create_task(
+                _run_every(
+                    _stop,
+                    "flush_api_key_last_used",
+                    settings.API_KEY_LAST_USED_FLUSH_SECONDS,
+                    flush_last_used,
+                )
+            )
+        )
+
     logger.info(
         f"Scheduler started: log cleanup scheduled daily at {settings.LOG_CLEANUP_HOUR}:00"
     )
 
 
-def shutdown_scheduler():
+async def shutdown_scheduler():
     """
     Shutdown Scheduled Task Scheduler
 
-    Gracefully stops all scheduled tasks.
+    Stops all scheduled tasks, letting a job that is already running finish.
     """
-    global _scheduler
+    global _stop
 
-    if _scheduler is None:
+    if _stop is None:
         return
 
-    _scheduler.shutdown(wait=True)
-    _scheduler = None
+    _stop.set()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+    _stop = None
     logger.info("Scheduler shutdown completed")
-
-
-def get_scheduler() -> Optional[AsyncIOScheduler]:
-    """
-    Get Scheduler Instance
-
-    Returns:
-        Optional[AsyncIOScheduler]: Scheduler instance or None
-    """
-    return _scheduler
\ No newline at end of file
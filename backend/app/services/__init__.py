@@ -2,16 +2,17 @@
 Service Layer Module Initialization
 """
 
-from app.services.proxy_service import ProxyService
+from app.services.proxy_service import LogInfo, ProxyService
 from app.services.provider_service import ProviderService
 from app.services.model_service import ModelService
 from app.services.api_key_service import ApiKeyService
 from app.services.log_service import LogService
 from app.services.retry_handler import RetryHandler
-from app.services.strategy import SelectionStrategy, RoundRobinStrategy, CostFirstStrategy, PriorityStrategy
+from app.services.strategy import SelectionStrategy, RoundRobinStrategy, CostFirstStrategy, PriorityStrategy, ModelAffinityStrategy
 
 __all__ = [
     "ProxyService",
+    "LogInfo",
     "ProviderService",
     "ModelService",
     "ApiKeyService",
@@ -21,4 +22,5 @@ __all__ = [
     "RoundRobinStrategy",
     "CostFirstStrategy",
     "PriorityStrategy",
+    "ModelAffinityStrategy",
 ]
@@ -11,6 +11,7 @@ from app.common.errors import ConflictError, NotFoundError, AuthenticationError
 from app.common.time import utc_now
 from app.common.sanitizer import sanitize_api_key_display
 from app.common.utils import generate_api_key
+from app.config import get_settings
 from app.domain.api_key import (
     ApiKeyModel,
     ApiKeyCreate,
@@ -18,7 +19,9 @@ from app.domain.api_key import (
     ApiKeyResponse,
     ApiKeyCreateResponse,
 )
+from app.repositories.base import DuplicateError
 from app.repositories.api_key_repo import ApiKeyRepository
+from app.services.api_key_usage import record_last_used
 
 
 class ApiKeyService:
@@ -38,6 +41,10 @@ class ApiKeyService:
         self.repo = repo
 
     async def _write_last_used(self, api_key_id: int, last_used_at: datetime) -> None:
+        if get_settings().API_KEY_LAST_USED_FLUSH_SECONDS > 0:
+            # Written by the scheduler's periodic flush
+            record_last_used(api_key_id, last_used_at)
+            return
         await self.repo.update_last_used(api_key_id, last_used_at)
     
     async def create(self, data: ApiKeyCreate) -> ApiKeyCreateResponse:
@@ -55,18 +62,17 @@ class ApiKeyService:
         Raises:
             ConflictError: Name already exists
         """
-        # Check if name already exists
-        existing = await self.repo.get_by_name(data.key_name)
-        if existing:
-            raise ConflictError(
-                message=f"API Key with name '{data.key_name}' already exists",
-                code="duplicate_name",
-            )
-        
         # Generate random key_value
         key_value = generate_api_key()
         
-        api_key = await self.repo.create(data, key_value)
+        # The unique name constraint rejects duplicates, no lookup beforehand
+        try:
+            api_key = await self.repo.create(data, key_value)
+        except DuplicateError:
+            raise ConflictError(
+                message=f"API Key with name '{data.key_name}' already exists",
+                code="duplicate_name",
+            ) from None
         
         # Return full key_value on creation
         return ApiKeyCreateResponse(
@@ -155,24 +161,21 @@ class ApiKeyService:
             NotFoundError: API Key not found
             ConflictError: Name already used by another Key
         """
-        existing = await self.repo.get_by_id(id)
-        if not existing:
+        # The update reports a missing Key and the unique name constraint a
+        # taken name, so neither needs a lookup beforehand
+        try:
+            api_key = await self.repo.update(id, data)
+        except DuplicateError:
+            raise ConflictError(
+                message=f"API Key with name '{data.key_name}' already exists",
+                code="duplicate_name",
+            ) from None
+        if not api_key:
             raise NotFoundError(
                 message=f"API Key with id {id} not found",
                 code="api_key_not_found",
             )
-        
-        # If updating name, check for conflict with other Keys
-        if data.key_name and data.key_name != existing.key_name:
-            name_conflict = await self.repo.get_by_name(data.key_name)
-            if name_conflict:
-                raise ConflictError(
-                    message=f"API Key with name '{data.key_name}' already exists",
-                    code="duplicate_name",
-                )
-        
-        api_key = await self.repo.update(id, data)
-        return self._to_response(api_key)  # type: ignore
+        return self._to_response(api_key)
     
     async def delete(self, id: int) -> None:
         """
@@ -184,14 +187,11 @@ class ApiKeyService:
         Raises:
             NotFoundError: API Key not found
         """
-        existing = await self.repo.get_by_id(id)
-        if not existing:
+        if not await self.repo.delete(id):
             raise NotFoundError(
                 message=f"API Key with id {id} not found",
                 code="api_key_not_found",
             )
-        
-        await self.repo.delete(id)
     
     async def authenticate(self, key_value: str) -> ApiKeyModel:
         """
@@ -212,8 +212,8 @@ class ApiKeyService:
                 code="invalid_api_key",
             )
         
-        # Remove Bearer prefix
-        if key_value.lower().startswith("bearer "):
+        # Remove Bearer prefix (lower-case only the prefix, not the whole key)
+        if key_value[:7].lower() == "bearer ":
             key_value = key_value[7:]
         
         api_key = await self.repo.get_by_key_value(key_value)
@@ -0,0 +1,63 @@
+"""
+API Key Usage Tracking Module
+
+Coalesces API Key last-used times in-process and writes them in periodic
+batches, keeping the database write off the authentication path.
+"""
+
+import logging
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import AsyncSessionLocal
+from app.repositories.sqlalchemy.api_key_repo import SQLAlchemyApiKeyRepository
+
+logger = logging.getLogger(__name__)
+
+# API Key ID -> latest last-used time not yet written
+_pending: dict[int, datetime] = {}
+
+
+def record_last_used(api_key_id: int, last_used_at: datetime) -> None:
+    """
+    Record a last-used time to be written by the next flush
+
+    Repeated uses of one key before the flush collapse into a single write.
+
+    Args:
+        api_key_id: API Key ID
+        last_used_at: Last used time
+    """
+    _pending[api_key_id] = last_used_at
+
+
+async def flush_last_used(
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> int:
+    """
+    Write all pending last-used times in one batch
+
+    On failure the batch is kept for the next flush, unless a newer time for
+    the same key was recorded meanwhile.
+
+    Args:
+        session_factory: Session factory to write with
+
+    Returns:
+        int: Number of API Keys written
+    """
+    global _pending
+    if not _pending:
+        return 0
+
+    batch, _pending = _pending, {}
+    try:
+        async with session_factory() as session:
+            await SQLAlchemyApiKeyRepository(session).update_last_used_many(batch)
+    except Exception:
+        logger.exception("Failed to write API Key last used times")
+        for api_key_id, last_used_at in batch.items():
+            _pending.setdefault(api_key_id, last_used_at)
+        return 0
+    return len(batch)
@@ -0,0 +1,116 @@
+"""
+Circuit Breaker Module
+
+Tracks consecutive upstream server errors per provider in-process, so requests
+skip a provider that keeps failing until its cooldown has passed.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from app.config import get_settings
+from app.providers.base import ProviderResponse
+from app.rules.models import CandidateProvider
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Per-provider Circuit Breaker
+
+    A provider's circuit opens after failure_threshold consecutive server errors
+    (status >= 500, including connection failures reported as 502) and stays
+    open for cooldown_seconds. After the cooldown requests reach the provider
+    again: a success closes the circuit, another server error reopens it at once.
+    Client errors (< 500) neither open nor close a circuit.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float):
+        """
+        Initialize Circuit Breaker
+
+        Args:
+            failure_threshold: Consecutive server errors that open a circuit
+            cooldown_seconds: How long an open circuit skips its provider
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        # Provider ID -> consecutive server errors
+        self._failures: dict[int, int] = {}
+        # Provider ID -> monotonic time at which an open circuit lets requests through
+        self._open_until: dict[int, float] = {}
+
+    def allow(self, provider_id: int) -> bool:
+        """Whether requests may be sent to the provider"""
+        open_until = self._open_until.get(provider_id)
+        return open_until is None or time.monotonic() >= open_until
+
+    def filter(self, candidates: list[CandidateProvider]) -> list[CandidateProvider]:
+        """
+        Drop candidates whose circuit is open
+
+        Args:
+            candidates: Candidate providers
+
+        Returns:
+            list[CandidateProvider]: Allowed candidates in their original order, or
+                all candidates when every circuit is open (trying a possibly dead
+                provider beats failing the request outright)
+        """
+        if not self._open_until:
+            return candidates
+        allowed = [c for c in candidates if self.allow(c.provider_id)]
+        if allowed:
+            return allowed
+        logger.warning(
+            "Circuit open for every candidate, trying them anyway: provider_ids=%s",
+            [c.provider_id for c in candidates],
+        )
+        return candidates
+
+    def record(self, provider_id: int, response: ProviderResponse) -> None:
+        """
+        Record the outcome of a request to a provider
+
+        Args:
+            provider_id: Provider ID
+            response: Provider response
+        """
+        if response.is_success:
+            self._failures.pop(provider_id, None)
+            self._open_until.pop(provider_id, None)
+        elif response.is_server_error:
+            failures = self._failures.get(provider_id, 0) + 1
+            self._failures[provider_id] = failures
+            if failures >= self.failure_threshold:
+                self._open_until[provider_id] = time.monotonic() + self.cooldown_seconds
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> Optional[CircuitBreaker]:
+    """
+    Get the process-wide circuit breaker
+
+    Returns:
+        Optional[CircuitBreaker]: Circuit breaker, or None when disabled
+    """
+    global _circuit_breaker
+    settings = get_settings()
+    if settings.CIRCUIT_BREAKER_THRESHOLD <= 0:
+        return None
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker(
+            settings.CIRCUIT_BREAKER_THRESHOLD,
+            settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        )
+    return _circuit_breaker
+
+
+def reset_circuit_breaker() -> None:
+    """Drop the circuit breaker and its state (for tests)"""
+    global _circuit_breaker
+    _circuit_breaker = None
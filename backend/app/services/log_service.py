@@ -5,7 +5,8 @@ Provides business logic processing for request logs.
 """
 
 import logging
-from typing import Optional
+from operator import attrgetter
+from typing import AsyncIterator, Optional
 
 from app.common.errors import NotFoundError
 from app.domain.log import (
@@ -22,6 +23,10 @@ from app.repositories.log_repo import LogRepository
 
 logger = logging.getLogger(__name__)
 
+# List view fields, read off a RequestLogModel in one C-level call
+_LIST_FIELDS = tuple(RequestLogResponse.model_fields)
+_get_list_fields = attrgetter(*_LIST_FIELDS)
+
 
 class LogService:
     """
@@ -85,35 +90,35 @@ class LogService:
             tuple[list[RequestLogResponse], int]: (Log list, Total count)
         """
         logs, total = await self.repo.query(query)
-        
-        # Convert to response model (list view does not include detailed request/response body)
-        responses = [
-            RequestLogResponse(
-                id=log.id,
-                request_time=log.request_time,
-                api_key_id=log.api_key_id,
-                api_key_name=log.api_key_name,
-                requested_model=log.requested_model,
-                target_model=log.target_model,
-                provider_id=log.provider_id,
-                provider_name=log.provider_name,
-                retry_count=log.retry_count,
-                first_byte_delay_ms=log.first_byte_delay_ms,
-                total_time_ms=log.total_time_ms,
-                input_tokens=log.input_tokens,
-                output_tokens=log.output_tokens,
-                total_cost=log.total_cost,
-                input_cost=log.input_cost,
-                output_cost=log.output_cost,
-                response_status=log.response_status,
-                trace_id=log.trace_id,
-                is_stream=log.is_stream,
-            )
-            for log in logs
-        ]
-
+        responses = [self._to_list_response(log) for log in logs]
         return responses, total
 
+    async def iter_query(
+        self, query: RequestLogQuery
+    ) -> AsyncIterator[RequestLogResponse]:
+        """
+        Stream All Logs Matching the Query (ignores pagination)
+
+        Args:
+            query: Query conditions
+
+        Yields:
+            RequestLogResponse: Log list item
+        """
+        async for log in self.repo.iter_query(query, paginate=False):
+            yield self._to_list_response(log)
+
+    @staticmethod
+    def _to_list_response(log: RequestLogModel) -> RequestLogResponse:
+        """
+        Convert to response model (list view does not include detailed request/response body)
+
+        The domain model was built from trusted database values, so validation is skipped.
+        """
+        return RequestLogResponse.model_construct(
+            **dict(zip(_LIST_FIELDS, _get_list_fields(log)))
+        )
+
     async def cleanup_old_logs(self, retention_days: int) -> int:
         """
         Clean up old logs older than specified days
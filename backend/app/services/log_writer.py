@@ -0,0 +1,114 @@
+"""
+Request Log Writer Module
+
+Buffers request logs in-process and inserts them in batches, so each proxied
+request does not pay for its own insert and commit.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.domain.log import RequestLogCreate
+from app.repositories.sqlalchemy.log_repo import SQLAlchemyLogRepository
+
+logger = logging.getLogger(__name__)
+
+# Logs waiting for the next batch insert
+_pending: list[RequestLogCreate] = []
+# Timer that starts the next flush once the batch window elapses
+_flush_timer: Optional[asyncio.TimerHandle] = None
+# Running flush tasks (referenced so they are not garbage collected)
+_flush_tasks: set[asyncio.Task] = set()
+
+
+def enqueue_log(data: RequestLogCreate) -> None:
+    """
+    Buffer a request log for the next batch insert
+
+    The batch is written LOG_WRITE_BATCH_MS after its first log, or as soon as
+    LOG_WRITE_BATCH_SIZE logs are waiting. Must be called from the event loop.
+
+    Args:
+        data: Log creation data
+    """
+    global _flush_timer
+    settings = get_settings()
+    _pending.append(data)
+    if len(_pending) >= settings.LOG_WRITE_BATCH_SIZE:
+        _start_flush()
+    elif _flush_timer is None:
+        _flush_timer = asyncio.get_running_loop().call_later(
+            settings.LOG_WRITE_BATCH_MS / 1000, _start_flush
+        )
+
+
+def _start_flush() -> None:
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    task = asyncio.get_running_loop().create_task(flush_logs())
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def flush_logs(
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> int:
+    """
+    Insert all buffered logs in one batch
+
+    A failed batch is logged and dropped rather than retried, so a database
+    outage cannot grow the buffer without bound.
+
+    Args:
+        session_factory: Session factory to write with
+
+    Returns:
+        int: Number of logs written
+    """
+    global _pending
+    if not _pending:
+        return 0
+
+    batch, _pending = _pending, []
+    try:
+        async with session_factory() as session:
+            return await SQLAlchemyLogRepository(session).create_many(batch)
+    except Exception:
+        logger.exception("Failed to write %d request logs", len(batch))
+        return 0
+
+
+async def drain_logs(
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> None:
+    """
+    Wait for running flushes and write whatever is still buffered
+
+    Called on shutdown so buffered logs are not lost.
+
+    Args:
+        session_factory: Session factory to write with
+    """
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _flush_tasks:
+        await asyncio.gather(*_flush_tasks, return_exceptions=True)
+    await flush_logs(session_factory)
+
+
+def reset_log_writer() -> None:
+    """Discard buffered logs and the pending flush timer (for tests)"""
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    _pending.clear()
@@ -19,13 +19,20 @@ from app.domain.model import (
     ModelMappingProviderUpdate,
     ModelMappingProviderResponse,
 )
+from app.repositories.base import DuplicateError
 from app.repositories.model_repo import ModelRepository
 from app.repositories.provider_repo import ProviderRepository
 from app.common.costs import calculate_cost_from_billing, resolve_billing
 from app.rules.context import RuleContext, TokenUsage
 from app.rules.engine import RuleEngine
 from app.services.retry_handler import RetryHandler
-from app.services.strategy import CostFirstStrategy, PriorityStrategy, RoundRobinStrategy, SelectionStrategy
+from app.services.strategy import (
+    CostFirstStrategy,
+    ModelAffinityStrategy,
+    PriorityStrategy,
+    RoundRobinStrategy,
+    SelectionStrategy,
+)
 
 
 class ModelService:
@@ -52,6 +59,7 @@ class ModelService:
         self._round_robin_strategy = RoundRobinStrategy()
         self._cost_first_strategy = CostFirstStrategy()
         self._priority_strategy = PriorityStrategy()
+        self._model_affinity_strategy = ModelAffinityStrategy()
     
     # ============ Model Mapping Operations ============
     
@@ -68,15 +76,14 @@ class ModelService:
         Raises:
             ConflictError: Model already exists
         """
-        # Check if model already exists
-        existing = await self.model_repo.get_mapping(data.requested_model)
-        if existing:
+        # The requested_model primary key rejects duplicates, no lookup beforehand
+        try:
+            mapping = await self.model_repo.create_mapping(data)
+        except DuplicateError:
             raise ConflictError(
                 message=f"Model '{data.requested_model}' already exists",
                 code="duplicate_model",
-            )
-        
-        mapping = await self.model_repo.create_mapping(data)
+            ) from None
         return await self._to_mapping_response(mapping)
     
     async def get_mapping(self, requested_model: str) -> ModelMappingResponse:
@@ -256,9 +263,16 @@ class ModelService:
             strategy=strategy
         )
         
-        responses = []
-        for mapping in mappings:
-            responses.append(await self._to_mapping_response(mapping))
+        # One grouped count query for the whole page instead of one per mapping
+        counts = await self.model_repo.get_provider_counts(
+            [mapping.requested_model for mapping in mappings]
+        )
+        responses = [
+            await self._to_mapping_response(
+                mapping, provider_count=counts.get(mapping.requested_model, 0)
+            )
+            for mapping in mappings
+        ]
         
         return responses, total
     
@@ -278,15 +292,13 @@ class ModelService:
         Raises:
             NotFoundError: Model not found
         """
-        existing = await self.model_repo.get_mapping(requested_model)
-        if not existing:
+        mapping = await self.model_repo.update_mapping(requested_model, data)
+        if not mapping:
             raise NotFoundError(
                 message=f"Model '{requested_model}' not found",
                 code="model_not_found",
             )
-        
-        mapping = await self.model_repo.update_mapping(requested_model, data)
-        return await self._to_mapping_response(mapping)  # type: ignore
+        return await self._to_mapping_response(mapping)
     
     async def delete_mapping(self, requested_model: str) -> None:
         """
@@ -298,14 +310,11 @@ class ModelService:
         Raises:
             NotFoundError: Model not found
         """
-        existing = await self.model_repo.get_mapping(requested_model)
-        if not existing:
+        if not await self.model_repo.delete_mapping(requested_model):
             raise NotFoundError(
                 message=f"Model '{requested_model}' not found",
                 code="model_not_found",
             )
-        
-        await self.model_repo.delete_mapping(requested_model)
 
     @staticmethod
     def _normalize_headers(
@@ -331,6 +340,8 @@ class ModelService:
             return self._cost_first_strategy
         if strategy_name == "priority":
             return self._priority_strategy
+        if strategy_name == "model_affinity":
+            return self._model_affinity_strategy
         return self._round_robin_strategy
     
     # ============ Model-Provider Mapping Operations ============
@@ -350,17 +361,16 @@ class ModelService:
         Raises:
             NotFoundError: Model or provider not found
         """
-        # Check if model exists
-        model = await self.model_repo.get_mapping(data.requested_model)
-        if not model:
+        # Check that model and provider exist (one query for both)
+        model_exists, provider_exists = await self.model_repo.mapping_and_provider_exist(
+            data.requested_model, data.provider_id
+        )
+        if not model_exists:
             raise NotFoundError(
                 message=f"Model '{data.requested_model}' not found",
                 code="model_not_found",
             )
-        
-        # Check if provider exists
-        provider = await self.provider_repo.get_by_id(data.provider_id)
-        if not provider:
+        if not provider_exists:
             raise NotFoundError(
                 message=f"Provider with id {data.provider_id} not found",
                 code="provider_not_found",
@@ -578,7 +588,10 @@ class ModelService:
         return {"success": success, "skipped": skipped, "errors": errors}
     
     async def _to_mapping_response(
-        self, mapping: ModelMapping, include_providers: bool = False
+        self,
+        mapping: ModelMapping,
+        include_providers: bool = False,
+        provider_count: Optional[int] = None,
     ) -> ModelMappingResponse:
         """
         Convert ModelMapping to Response Model
@@ -586,13 +599,15 @@ class ModelService:
         Args:
             mapping: Model mapping
             include_providers: Whether to include provider list
+            provider_count: Already known provider count (queried when None)
         
         Returns:
             ModelMappingResponse: Response model
         """
-        provider_count = await self.model_repo.get_provider_count(
-            mapping.requested_model
-        )
+        if provider_count is None:
+            provider_count = await self.model_repo.get_provider_count(
+                mapping.requested_model
+            )
         
         providers = None
         if include_providers:
@@ -13,6 +13,7 @@ from app.common.provider_protocols import resolve_implementation_protocol
 from app.common.sanitizer import sanitize_api_key_display, sanitize_proxy_url
 from app.domain.provider import Provider, ProviderCreate, ProviderUpdate, ProviderResponse
 from app.providers import get_provider_client
+from app.repositories.base import DuplicateError
 from app.repositories.provider_repo import ProviderRepository
 
 
@@ -45,15 +46,14 @@ class ProviderService:
         Raises:
             ConflictError: Name already exists
         """
-        # Check if name already exists
-        existing = await self.repo.get_by_name(data.name)
-        if existing:
+        # The unique name constraint rejects duplicates, no lookup beforehand
+        try:
+            provider = await self.repo.create(data)
+        except DuplicateError:
             raise ConflictError(
                 message=f"Provider with name '{data.name}' already exists",
                 code="duplicate_name",
-            )
-        
-        provider = await self.repo.create(data)
+            ) from None
         return self._to_response(provider)
     
     async def get_by_id(self, id: int) -> ProviderResponse:
@@ -122,25 +122,21 @@ class ProviderService:
             NotFoundError: Provider not found
             ConflictError: Name already used by another provider
         """
-        # Check if provider exists
-        existing = await self.repo.get_by_id(id)
-        if not existing:
+        # The update reports a missing provider and the unique name constraint
+        # a taken name, so neither needs a lookup beforehand
+        try:
+            provider = await self.repo.update(id, data)
+        except DuplicateError:
+            raise ConflictError(
+                message=f"Provider with name '{data.name}' already exists",
+                code="duplicate_name",
+            ) from None
+        if not provider:
             raise NotFoundError(
                 message=f"Provider with id {id} not found",
                 code="provider_not_found",
             )
-        
-        # If updating name, check for conflict with other providers
-        if data.name and data.name != existing.name:
-            name_conflict = await self.repo.get_by_name(data.name)
-            if name_conflict:
-                raise ConflictError(
-                    message=f"Provider with name '{data.name}' already exists",
-                    code="duplicate_name",
-                )
-        
-        provider = await self.repo.update(id, data)
-        return self._to_response(provider)  # type: ignore
+        return self._to_response(provider)
     
     async def delete(self, id: int) -> None:
         """
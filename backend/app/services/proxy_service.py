@@ -3,13 +3,16 @@
 Implements core business logic for request proxying."""
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
 
 import anyio
+import orjson
 
 from app.common.costs import calculate_cost_from_billing, resolve_billing
 from app.common.errors import NotFoundError, ServiceError
@@ -21,12 +24,15 @@ from app.common.protocol_conversion import (
 )
 from app.common.provider_protocols import resolve_implementation_protocol
 from app.common.proxy import build_proxy_config
+from app.common.response_cache import CachedResponse, ResponseCache
+from app.common.routing_cache import RoutingEntry, get_routing_cache
 from app.common.sanitizer import sanitize_headers
 from app.common.stream_usage import StreamUsageAccumulator
 from app.common.time import utc_now
 from app.common.token_counter import get_token_counter
 from app.common.usage_extractor import extract_usage_details
 from app.common.utils import generate_trace_id
+from app.config import get_settings
 from app.domain.log import RequestLogCreate
 from app.domain.model import ModelMapping, ModelMappingProviderResponse
 from app.domain.provider import Provider
@@ -35,9 +41,12 @@ from app.repositories.log_repo import LogRepository
 from app.repositories.model_repo import ModelRepository
 from app.repositories.provider_repo import ProviderRepository
 from app.rules import CandidateProvider, RuleContext, RuleEngine, TokenUsage
+from app.rules.engine import compile_provider_rules
+from app.services.log_writer import enqueue_log
 from app.services.retry_handler import AttemptRecord, RetryHandler
 from app.services.strategy import (
     CostFirstStrategy,
+    ModelAffinityStrategy,
     PriorityStrategy,
     RoundRobinStrategy,
     SelectionStrategy,
@@ -48,12 +57,74 @@ logger = logging.getLogger(__name__)
 MAX_LOG_TEXT_LENGTH = 10000
 
 
+@dataclass(slots=True)
+class LogInfo:
+    """
+    Request Routing Summary
+
+    Returned alongside the upstream response so callers can expose the trace ID
+    and the provider that finally served the request.
+    """
+
+    trace_id: str
+    retry_count: int = 0
+    target_model: Optional[str] = None
+    provider_name: Optional[str] = None
+    # Deferred usage accounting and log write (process_request(defer_log=True))
+    pending_log: Optional[Callable[[], Awaitable[None]]] = None
+
+
 def _truncate_log_text(text: str) -> str:
     if len(text) <= MAX_LOG_TEXT_LENGTH:
         return text
     return f"{text[:MAX_LOG_TEXT_LENGTH]}...[truncated]"
 
 
+def _passthrough_body(
+    raw_body: Optional[bytes],
+    body: dict[str, Any],
+    supplier_body: dict[str, Any],
+) -> Optional[bytes]:
+    """
+    Return the client's serialized body if it can be forwarded as-is
+
+    The raw bytes are only usable when protocol conversion changed nothing but
+    the model field; the provider then patches the model in the bytes instead of
+    re-serializing the whole body.
+    """
+    if raw_body is None or supplier_body.keys() != body.keys():
+        return None
+    for key, value in body.items():
+        if key != "model" and supplier_body[key] != value:
+            return None
+    return raw_body
+
+
+def _response_cache_key(
+    api_key_id: Optional[int], body: dict[str, Any], raw_body: Optional[bytes]
+) -> bytes:
+    """Response cache key: digest of the API Key and the request body as sent"""
+    if raw_body is None:
+        raw_body = orjson.dumps(body)
+    return hashlib.sha256(b"%s:%s" % (str(api_key_id).encode(), raw_body)).digest()
+
+
+def _decode_json_body(body: Any) -> Any:
+    """
+    Decode a raw JSON response body for inspection
+
+    Passthrough responses reach the client as the upstream bytes; accounting and
+    logging parse them once through this helper instead of once per consumer.
+    Non-JSON or binary bodies are returned unchanged.
+    """
+    if not isinstance(body, (bytes, bytearray)) or b"\x00" in body:
+        return body
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body
+
+
 def _smart_truncate(data: Any, max_list: int = 20, max_str: int = 1000) -> Any:
     """
     Recursively truncate data structures for logging.
@@ -102,6 +173,7 @@ class ProxyService:
         round_robin_strategy: Optional[SelectionStrategy] = None,
         cost_first_strategy: Optional[SelectionStrategy] = None,
         priority_strategy: Optional[SelectionStrategy] = None,
+        model_affinity_strategy: Optional[SelectionStrategy] = None,
     ):
         """
         Initialize Service
@@ -113,6 +185,7 @@ class ProxyService:
             round_robin_strategy: Optional Round Robin Strategy instance
             cost_first_strategy: Optional Cost First Strategy instance
             priority_strategy: Optional Priority Strategy instance
+            model_affinity_strategy: Optional Model Affinity Strategy instance
         """
         self.model_repo = model_repo
         self.provider_repo = provider_repo
@@ -122,8 +195,15 @@ class ProxyService:
         self._round_robin_strategy = round_robin_strategy or RoundRobinStrategy()
         self._cost_first_strategy = cost_first_strategy or CostFirstStrategy()
         self._priority_strategy = priority_strategy or PriorityStrategy()
+        self._model_affinity_strategy = (
+            model_affinity_strategy or ModelAffinityStrategy()
+        )
 
     async def _write_log(self, log_data: RequestLogCreate) -> None:
+        if get_settings().LOG_WRITE_BATCH_MS > 0:
+            # Inserted by the log writer's next batch
+            enqueue_log(log_data)
+            return
         await self.log_repo.create(log_data)
 
     def _get_strategy(self, strategy_name: str) -> SelectionStrategy:
@@ -131,7 +211,8 @@ class ProxyService:
         Get strategy instance based on strategy name
 
         Args:
-            strategy_name: Strategy name ("round_robin", "cost_first", or "priority")
+            strategy_name: Strategy name ("round_robin", "cost_first", "priority",
+                or "model_affinity")
 
         Returns:
             SelectionStrategy: Strategy instance
@@ -140,6 +221,8 @@ class ProxyService:
             return self._cost_first_strategy
         if strategy_name == "priority":
             return self._priority_strategy
+        if strategy_name == "model_affinity":
+            return self._model_affinity_strategy
         else:
             # Default to round_robin for unknown strategies
             return self._round_robin_strategy
@@ -153,21 +236,22 @@ class ProxyService:
         if isinstance(body, (bytes, bytearray)):
             if b"\x00" in body:
                 return f"[binary data: {len(body)} bytes]"
+            # Try to parse as JSON first (orjson validates UTF-8 itself)
             try:
-                decoded = body.decode("utf-8")
-                # Try to parse as JSON first
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
                 try:
-                    data = json.loads(decoded)
-                except json.JSONDecodeError:
-                    return _truncate_log_text(decoded)
-            except UnicodeDecodeError:
-                return f"[binary data: {len(body)} bytes]"
+                    return _truncate_log_text(body.decode("utf-8"))
+                except UnicodeDecodeError:
+                    return f"[binary data: {len(body)} bytes]"
 
         # If it's already a dict/list or successfully parsed
         if isinstance(data, (dict, list)):
             try:
                 truncated_data = _smart_truncate(data)
-                return json.dumps(truncated_data, ensure_ascii=False)
+                return orjson.dumps(
+                    truncated_data, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
             except Exception:
                 # Fallback
                 return _truncate_log_text(str(data))
@@ -196,6 +280,73 @@ class ProxyService:
         sanitized["_files"] = safe_files
         return sanitized
 
+    async def _load_routing(self, requested_model: str) -> RoutingEntry:
+        """
+        Load a model's mapping, active provider mappings and their providers
+
+        Served from the routing cache when enabled; model/provider writes
+        invalidate it.
+
+        Args:
+            requested_model: Requested model name
+
+        Returns:
+            RoutingEntry: Routing data (provider data empty when the model is
+                missing or disabled)
+        """
+        cache = get_routing_cache()
+        if cache is not None:
+            cached = cache.get(requested_model)
+            if cached is not None:
+                return cached
+
+        model_mapping = await self.model_repo.get_mapping(requested_model)
+        provider_mappings: list[ModelMappingProviderResponse] = []
+        providers: dict[int, Provider] = {}
+        if model_mapping and model_mapping.is_active:
+            provider_mappings = await self.model_repo.get_provider_mappings(
+                requested_model=requested_model,
+                is_active=True,
+            )
+            if provider_mappings:
+                providers = await self.provider_repo.get_by_ids(
+                    [pm.provider_id for pm in provider_mappings]
+                )
+
+        routing = RoutingEntry(
+            model_mapping,
+            provider_mappings,
+            providers,
+            compile_provider_rules(provider_mappings),
+        )
+        if cache is not None:
+            cache.set(requested_model, routing)
+        return routing
+
+    @staticmethod
+    def _require_active_model(
+        requested_model: str, model_mapping: Optional[ModelMapping]
+    ) -> ModelMapping:
+        """
+        Ensure the requested model is configured and enabled
+
+        Raises:
+            NotFoundError: Model not configured
+            ServiceError: Model disabled
+        """
+        if not model_mapping:
+            raise NotFoundError(
+                message=f"Model '{requested_model}' is not configured",
+                code="model_not_found",
+            )
+
+        if not model_mapping.is_active:
+            raise ServiceError(
+                message=f"Model '{requested_model}' is disabled",
+                code="model_disabled",
+            )
+        return model_mapping
+
     async def _resolve_candidates(
         self,
         requested_model: str,
@@ -216,23 +367,10 @@ class ProxyService:
             tuple: (model_mapping, candidates, input_tokens, protocol, provider_mapping_by_id)
         """
         request_protocol = (request_protocol or "openai").lower()
-        model_mapping = await self.model_repo.get_mapping(requested_model)
-        if not model_mapping:
-            raise NotFoundError(
-                message=f"Model '{requested_model}' is not configured",
-                code="model_not_found",
-            )
-
-        if not model_mapping.is_active:
-            raise ServiceError(
-                message=f"Model '{requested_model}' is disabled",
-                code="model_disabled",
-            )
-
-        provider_mappings = await self.model_repo.get_provider_mappings(
-            requested_model=requested_model,
-            is_active=True,
+        model_mapping, provider_mappings, providers, rule_sets = await self._load_routing(
+            requested_model
         )
+        model_mapping = self._require_active_model(requested_model, model_mapping)
 
         if not provider_mappings:
             raise ServiceError(
@@ -240,13 +378,6 @@ class ProxyService:
                 code="no_available_provider",
             )
 
-        provider_ids = [pm.provider_id for pm in provider_mappings]
-        providers: dict[int, Provider] = {}
-        for pid in provider_ids:
-            provider = await self.provider_repo.get_by_id(pid)
-            if provider:
-                providers[pid] = provider
-
         eligible_provider_mappings = [
             pm for pm in provider_mappings if providers.get(pm.provider_id) is not None
         ]
@@ -276,6 +407,7 @@ class ProxyService:
             model_mapping=model_mapping,
             provider_mappings=eligible_provider_mappings,
             providers=eligible_providers,
+            rule_sets=rule_sets,
         )
 
         if not candidates:
@@ -303,7 +435,11 @@ class ProxyService:
         body: dict[str, Any],
         *,
         force_parse_response: bool = False,
-    ) -> tuple[ProviderResponse, dict[str, Any]]:
+        hedge: bool = False,
+        raw_body: Optional[bytes] = None,
+        defer_log: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> tuple[ProviderResponse, LogInfo]:
         """
         Process Proxy Request
 
@@ -314,9 +450,17 @@ class ProxyService:
             method: HTTP method
             headers: Request headers
             body: Request body
+            hedge: Allow hedging a slow first attempt (idempotent routes only)
+            raw_body: Serialized request body, forwarded as-is (model patched)
+                when no protocol conversion is needed
+            defer_log: Skip usage accounting and the log write; the caller must
+                await log_info.pending_log (e.g. as a background task)
+            response_cache: Serve repeated requests (same API Key and body) from
+                this cache and store successful responses in it (idempotent
+                routes only)
 
         Returns:
-            tuple[ProviderResponse, dict]: (Provider response, Log info)
+            tuple[ProviderResponse, LogInfo]: (Provider response, Log info)
 
         Raises:
             NotFoundError: Model not configured
@@ -324,7 +468,10 @@ class ProxyService:
         """
         trace_id = generate_trace_id()
         request_time = utc_now()
-        sanitized_body = self._sanitize_request_body_for_log(body)
+        log_bodies = get_settings().LOG_BODIES
+        sanitized_body = (
+            self._sanitize_request_body_for_log(body) if log_bodies else None
+        )
 
         # 1. Extract requested_model
         requested_model = body.get("model")
@@ -334,6 +481,28 @@ class ProxyService:
                 code="missing_model",
             )
 
+        # A cache hit is answered and logged without resolving providers, but
+        # only while the model is still configured and enabled
+        cache_key: Optional[bytes] = None
+        if response_cache is not None:
+            cache_key = _response_cache_key(api_key_id, body, raw_body)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                routing = await self._load_routing(requested_model)
+                self._require_active_model(requested_model, routing.model_mapping)
+                return await self._replay_cached_response(
+                    cached,
+                    trace_id=trace_id,
+                    request_time=request_time,
+                    api_key_id=api_key_id,
+                    api_key_name=api_key_name,
+                    request_protocol=request_protocol,
+                    requested_model=requested_model,
+                    headers=headers,
+                    sanitized_body=sanitized_body,
+                    defer_log=defer_log,
+                )
+
         # 2. Get model mapping
         (
             model_mapping,
@@ -375,6 +544,8 @@ class ProxyService:
             "converted_request_body": None,
             "upstream_response_body": None,
         }
+        # Converted request per provider (hedged attempts run concurrently)
+        converted_request_bodies: dict[int, Any] = {}
 
         async def log_failed_attempt(attempt: AttemptRecord) -> None:
             nonlocal failed_attempt_logged
@@ -421,7 +592,9 @@ class ProxyService:
                 response_headers=sanitize_headers(attempt.response.headers),
                 request_body=sanitized_body,
                 response_status=attempt.response.status_code,
-                response_body=self._serialize_response_body(attempt.response.body),
+                response_body=self._serialize_response_body(attempt.response.body)
+                if log_bodies
+                else None,
                 error_info=attempt.response.error,
                 trace_id=trace_id,
                 is_stream=False,
@@ -431,11 +604,15 @@ class ProxyService:
                     attempt.provider.protocol
                 ),
                 converted_request_body=_smart_truncate(
-                    conversion_data.get("converted_request_body")
-                ),
+                    converted_request_bodies.get(attempt.provider.provider_id)
+                )
+                if log_bodies
+                else None,
                 upstream_response_body=self._serialize_response_body(
                     attempt.response.body
-                ),
+                )
+                if log_bodies
+                else None,
             )
             try:
                 await self._write_log(attempt_log)
@@ -464,6 +641,7 @@ class ProxyService:
                 # Track conversion data for logging
                 conversion_data["supplier_protocol"] = supplier_protocol
                 conversion_data["converted_request_body"] = supplier_body
+                converted_request_bodies[candidate.provider_id] = supplier_body
                 same_protocol = normalize_protocol(
                     request_protocol
                 ) == normalize_protocol(supplier_protocol)
@@ -484,6 +662,9 @@ class ProxyService:
                     else ("raw" if same_protocol else "parsed"),
                     extra_headers=candidate.extra_headers,
                     proxy_config=proxy_config,
+                    raw_body=_passthrough_body(raw_body, body, supplier_body)
+                    if same_protocol and supplier_path == path
+                    else None,
                 )
             except Exception as e:
                 error_msg = str(e)
@@ -504,8 +685,20 @@ class ProxyService:
             forward_fn=forward_fn,
             input_tokens=input_tokens,
             on_failure_attempt=log_failed_attempt,
+            hedge=hedge,
         )
 
+        if (
+            result.final_provider is not None
+            and result.final_provider.provider_id in converted_request_bodies
+        ):
+            conversion_data["supplier_protocol"] = resolve_implementation_protocol(
+                result.final_provider.protocol
+            )
+            conversion_data["converted_request_body"] = converted_request_bodies[
+                result.final_provider.provider_id
+            ]
+
         if result.response.body is not None and result.final_provider is not None:
             # Capture upstream response before protocol conversion
             conversion_data["upstream_response_body"] = result.response.body
@@ -542,149 +735,274 @@ class ProxyService:
                     total_time_ms=result.response.total_time_ms,
                 )
 
-        # 9. Calculate Output Token and usage details
-        output_tokens = 0
-        usage_details: Optional[dict[str, Any]] = None
-        if result.success and result.response.body:
+        if (
+            cache_key is not None
+            and result.response.is_success
+            and result.final_provider is not None
+        ):
+            response_cache.set(
+                cache_key,
+                CachedResponse(
+                    status_code=result.response.status_code,
+                    headers=result.response.headers,
+                    body=result.response.body,
+                    target_model=result.final_provider.target_model,
+                    provider_id=result.final_provider.provider_id,
+                    provider_name=result.final_provider.provider_name,
+                    supplier_protocol=conversion_data.get("supplier_protocol"),
+                ),
+            )
+
+        async def finalize_log() -> None:
+            """Account usage/cost and write the request log"""
+            nonlocal input_tokens
+
+            # Parse the (possibly raw) bodies once for accounting and logging; the
+            # client still receives result.response.body untouched
+            response_body = _decode_json_body(result.response.body)
             upstream_body = conversion_data.get("upstream_response_body")
-            details = None
-            try:
-                details = extract_usage_details(upstream_body) or extract_usage_details(
-                    result.response.body
-                )
-            except Exception:
-                details = None
+            if upstream_body is result.response.body:
+                upstream_body = response_body
+            else:
+                upstream_body = _decode_json_body(upstream_body)
 
-            if details:
-                usage_details = dict(details.__dict__)
-                if details.input_tokens:
-                    input_tokens = details.input_tokens
-                if details.output_tokens:
-                    output_tokens = details.output_tokens
+            # 9. Calculate Output Token and usage details
+            output_tokens = 0
+            usage_details: Optional[dict[str, Any]] = None
+            if result.success and result.response.body:
+                details = None
+                try:
+                    details = extract_usage_details(upstream_body)
+                    if details is None and response_body is not upstream_body:
+                        details = extract_usage_details(response_body)
+                except Exception:
+                    details = None
+
+                if details:
+                    usage_details = dict(details.__dict__)
+                    if details.input_tokens:
+                        input_tokens = details.input_tokens
+                    if details.output_tokens:
+                        output_tokens = details.output_tokens
+                    else:
+                        output_tokens = token_counter.count_output_body(
+                            response_body, requested_model
+                        )
+                        usage_details["output_tokens"] = output_tokens
+                        usage_details["source"] = "mixed"
+                    if not usage_details.get("input_tokens"):
+                        usage_details["input_tokens"] = input_tokens
+                        usage_details["source"] = "mixed"
+                    if not usage_details.get("total_tokens") and usage_details.get(
+                        "input_tokens"
+                    ):
+                        usage_details["total_tokens"] = usage_details["input_tokens"] + (
+                            usage_details.get("output_tokens") or 0
+                        )
                 else:
                     output_tokens = token_counter.count_output_body(
-                        result.response.body, requested_model
+                        response_body, requested_model
                     )
-                    usage_details["output_tokens"] = output_tokens
-                    usage_details["source"] = "mixed"
-                if not usage_details.get("input_tokens"):
-                    usage_details["input_tokens"] = input_tokens
-                    usage_details["source"] = "mixed"
-                if not usage_details.get("total_tokens") and usage_details.get(
-                    "input_tokens"
-                ):
-                    usage_details["total_tokens"] = usage_details["input_tokens"] + (
-                        usage_details.get("output_tokens") or 0
-                    )
-            else:
-                output_tokens = token_counter.count_output_body(
-                    result.response.body, requested_model
+                    usage_details = {
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens,
+                        "total_tokens": (input_tokens or 0) + (output_tokens or 0),
+                        "source": "estimated",
+                    }
+
+            # 10. Record log
+            final_provider_id = (
+                result.final_provider.provider_id if result.final_provider else None
+            )
+            provider_mapping = (
+                provider_mapping_by_id.get(final_provider_id)
+                if final_provider_id is not None
+                else None
+            )
+            billing = resolve_billing(
+                input_tokens=input_tokens,
+                model_input_price=model_mapping.input_price,
+                model_output_price=model_mapping.output_price,
+                provider_billing_mode=provider_mapping.billing_mode
+                if provider_mapping
+                else None,
+                provider_per_request_price=provider_mapping.per_request_price
+                if provider_mapping
+                else None,
+                provider_tiered_pricing=provider_mapping.tiered_pricing
+                if provider_mapping
+                else None,
+                provider_input_price=provider_mapping.input_price
+                if provider_mapping
+                else None,
+                provider_output_price=provider_mapping.output_price
+                if provider_mapping
+                else None,
+            )
+            cost = calculate_cost_from_billing(
+                billing=billing,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+            )
+            serialized_response_body = (
+                self._serialize_response_body(response_body) if log_bodies else None
+            )
+            log_data = RequestLogCreate(
+                request_time=request_time,
+                api_key_id=api_key_id,
+                api_key_name=api_key_name,
+                requested_model=requested_model,
+                target_model=result.final_provider.target_model
+                if result.final_provider
+                else None,
+                provider_id=result.final_provider.provider_id
+                if result.final_provider
+                else None,
+                provider_name=result.final_provider.provider_name
+                if result.final_provider
+                else None,
+                retry_count=result.retry_count,
+                matched_provider_count=len(candidates),
+                first_byte_delay_ms=result.response.first_byte_delay_ms,
+                total_time_ms=result.response.total_time_ms,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_cost=cost.total_cost,
+                input_cost=cost.input_cost,
+                output_cost=cost.output_cost,
+                price_source=billing.price_source,
+                request_headers=sanitize_headers(headers),
+                response_headers=sanitize_headers(result.response.headers),
+                request_body=sanitized_body,
+                response_status=result.response.status_code,
+                response_body=serialized_response_body,
+                usage_details=usage_details,
+                error_info=result.response.error,
+                trace_id=trace_id,
+                is_stream=False,
+                # Protocol conversion fields
+                request_protocol=conversion_data.get("request_protocol"),
+                supplier_protocol=conversion_data.get("supplier_protocol"),
+                converted_request_body=_smart_truncate(
+                    conversion_data.get("converted_request_body")
                 )
-                usage_details = {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": (input_tokens or 0) + (output_tokens or 0),
-                    "source": "estimated",
-                }
+                if log_bodies
+                else None,
+                upstream_response_body=serialized_response_body
+                if upstream_body is response_body or not log_bodies
+                else self._serialize_response_body(upstream_body),
+            )
 
-        # 10. Record log
-        final_provider_id = (
-            result.final_provider.provider_id if result.final_provider else None
-        )
-        provider_mapping = (
-            provider_mapping_by_id.get(final_provider_id)
-            if final_provider_id is not None
-            else None
-        )
-        billing = resolve_billing(
-            input_tokens=input_tokens,
-            model_input_price=model_mapping.input_price,
-            model_output_price=model_mapping.output_price,
-            provider_billing_mode=provider_mapping.billing_mode
-            if provider_mapping
-            else None,
-            provider_per_request_price=provider_mapping.per_request_price
-            if provider_mapping
-            else None,
-            provider_tiered_pricing=provider_mapping.tiered_pricing
-            if provider_mapping
-            else None,
-            provider_input_price=provider_mapping.input_price
-            if provider_mapping
-            else None,
-            provider_output_price=provider_mapping.output_price
-            if provider_mapping
-            else None,
-        )
-        cost = calculate_cost_from_billing(
-            billing=billing,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-        )
-        log_data = RequestLogCreate(
-            request_time=request_time,
-            api_key_id=api_key_id,
-            api_key_name=api_key_name,
-            requested_model=requested_model,
+            # DEBUG: Log request details
+            try:
+                logger.debug(f"Request Log: {log_data.model_dump_json()}")
+            except AttributeError:
+                # Fallback for Pydantic v1
+                logger.debug(f"Request Log: {log_data.json()}")
+
+            if result.success or not failed_attempt_logged:
+                await self._write_log(log_data)
+
+        log_info = LogInfo(
+            trace_id=trace_id,
+            retry_count=result.retry_count,
             target_model=result.final_provider.target_model
             if result.final_provider
             else None,
-            provider_id=result.final_provider.provider_id
-            if result.final_provider
-            else None,
             provider_name=result.final_provider.provider_name
             if result.final_provider
             else None,
-            retry_count=result.retry_count,
-            matched_provider_count=len(candidates),
-            first_byte_delay_ms=result.response.first_byte_delay_ms,
-            total_time_ms=result.response.total_time_ms,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            total_cost=cost.total_cost,
-            input_cost=cost.input_cost,
-            output_cost=cost.output_cost,
-            price_source=billing.price_source,
-            request_headers=sanitize_headers(headers),
-            response_headers=sanitize_headers(result.response.headers),
-            request_body=sanitized_body,
-            response_status=result.response.status_code,
-            response_body=self._serialize_response_body(result.response.body),
-            usage_details=usage_details,
-            error_info=result.response.error,
-            trace_id=trace_id,
-            is_stream=False,
-            # Protocol conversion fields
-            request_protocol=conversion_data.get("request_protocol"),
-            supplier_protocol=conversion_data.get("supplier_protocol"),
-            converted_request_body=_smart_truncate(
-                conversion_data.get("converted_request_body")
-            ),
-            upstream_response_body=self._serialize_response_body(
-                conversion_data.get("upstream_response_body")
-            ),
         )
+        if defer_log:
+            log_info.pending_log = finalize_log
+        else:
+            await finalize_log()
+        return result.response, log_info
 
-        # DEBUG: Log request details
-        try:
-            logger.debug(f"Request Log: {log_data.model_dump_json()}")
-        except AttributeError:
-            # Fallback for Pydantic v1
-            logger.debug(f"Request Log: {log_data.json()}")
-
-        if result.success or not failed_attempt_logged:
-            await self._write_log(log_data)
-
-        return result.response, {
-            "trace_id": trace_id,
-            "retry_count": result.retry_count,
-            "target_model": result.final_provider.target_model
-            if result.final_provider
-            else None,
-            "provider_name": result.final_provider.provider_name
-            if result.final_provider
-            else None,
-        }
+    async def _replay_cached_response(
+        self,
+        cached: CachedResponse,
+        *,
+        trace_id: str,
+        request_time: datetime,
+        api_key_id: Optional[int],
+        api_key_name: Optional[str],
+        request_protocol: str,
+        requested_model: str,
+        headers: dict[str, str],
+        sanitized_body: Optional[dict[str, Any]],
+        defer_log: bool,
+    ) -> tuple[ProviderResponse, LogInfo]:
+        """
+        Serve a cached response and record it like an upstream one
+
+        The request log carries the routing of the request that filled the cache
+        entry and the usage reported in the cached body, with usage_details
+        source "cache" and zero cost, since no provider was called.
+
+        Returns:
+            tuple[ProviderResponse, LogInfo]: (Cached response, Log info)
+        """
+        response = ProviderResponse(
+            status_code=cached.status_code,
+            headers=cached.headers,
+            body=cached.body,
+        )
+
+        async def finalize_log() -> None:
+            """Write the request log of the cache hit"""
+            response_body = _decode_json_body(cached.body)
+            try:
+                details = extract_usage_details(response_body)
+            except Exception:
+                details = None
+            usage_details: Optional[dict[str, Any]] = None
+            if details:
+                usage_details = dict(details.__dict__)
+                usage_details["source"] = "cache"
+            log_bodies = get_settings().LOG_BODIES
+            serialized_response_body = (
+                self._serialize_response_body(response_body) if log_bodies else None
+            )
+            await self._write_log(
+                RequestLogCreate(
+                    request_time=request_time,
+                    api_key_id=api_key_id,
+                    api_key_name=api_key_name,
+                    requested_model=requested_model,
+                    target_model=cached.target_model,
+                    provider_id=cached.provider_id,
+                    provider_name=cached.provider_name,
+                    retry_count=0,
+                    input_tokens=details.input_tokens if details else None,
+                    output_tokens=details.output_tokens if details else None,
+                    total_cost=0.0,
+                    input_cost=0.0,
+                    output_cost=0.0,
+                    request_headers=sanitize_headers(headers),
+                    response_headers=sanitize_headers(cached.headers),
+                    request_body=sanitized_body,
+                    response_status=cached.status_code,
+                    response_body=serialized_response_body,
+                    usage_details=usage_details,
+                    trace_id=trace_id,
+                    is_stream=False,
+                    request_protocol=request_protocol,
+                    supplier_protocol=cached.supplier_protocol,
+                    upstream_response_body=serialized_response_body,
+                )
+            )
+
+        log_info = LogInfo(
+            trace_id=trace_id,
+            target_model=cached.target_model,
+            provider_name=cached.provider_name,
+        )
+        if defer_log:
+            log_info.pending_log = finalize_log
+        else:
+            await finalize_log()
+        return response, log_info
 
     async def process_request_stream(
         self,
@@ -695,7 +1013,9 @@ class ProxyService:
         method: str,
         headers: dict[str, str],
         body: dict[str, Any],
-    ) -> tuple[ProviderResponse, AsyncGenerator[bytes, None], dict[str, Any]]:
+        *,
+        raw_body: Optional[bytes] = None,
+    ) -> tuple[ProviderResponse, AsyncGenerator[bytes, None], LogInfo]:
         """
         Process Streaming Proxy Request
 
@@ -706,6 +1026,8 @@ class ProxyService:
             method: HTTP method
             headers: Request headers
             body: Request body
+            raw_body: Serialized request body, forwarded as-is (model patched)
+                when no protocol conversion is needed
 
         Returns:
             tuple: (Initial response, Stream generator, Log info)
@@ -713,7 +1035,10 @@ class ProxyService:
         trace_id = generate_trace_id()
         request_time = utc_now()
         start_monotonic = time.monotonic()
-        sanitized_body = self._sanitize_request_body_for_log(body)
+        log_bodies = get_settings().LOG_BODIES
+        sanitized_body = (
+            self._sanitize_request_body_for_log(body) if log_bodies else None
+        )
 
         # 1-7. Same model resolution and rule matching logic
         requested_model = body.get("model")
@@ -805,6 +1130,11 @@ class ProxyService:
                 target_model=candidate.target_model,
                 extra_headers=candidate.extra_headers,
                 proxy_config=proxy_config,
+                raw_body=_passthrough_body(raw_body, body, supplier_body)
+                if normalize_protocol(request_protocol)
+                == normalize_protocol(supplier_protocol)
+                and supplier_path == path
+                else None,
             )
 
             async def wrapped() -> AsyncGenerator[tuple[bytes, ProviderResponse], None]:
@@ -820,6 +1150,12 @@ class ProxyService:
                     return
 
                 async def upstream_bytes() -> AsyncGenerator[bytes, None]:
+                    if not log_bodies:
+                        yield first_chunk
+                        async for chunk, _ in upstream_gen:
+                            yield chunk
+                        return
+
                     # Reset upstream chunks for the current attempt
                     stream_conversion_data["upstream_chunks"] = []
 
@@ -925,7 +1261,9 @@ class ProxyService:
                 response_headers=sanitize_headers(attempt.response.headers),
                 request_body=sanitized_body,
                 response_status=attempt.response.status_code,
-                response_body=self._serialize_response_body(attempt.response.body),
+                response_body=self._serialize_response_body(attempt.response.body)
+                if log_bodies
+                else None,
                 error_info=attempt.response.error,
                 trace_id=trace_id,
                 is_stream=True,
@@ -936,10 +1274,14 @@ class ProxyService:
                 ),
                 converted_request_body=_smart_truncate(
                     stream_conversion_data.get("converted_request_body")
-                ),
+                )
+                if log_bodies
+                else None,
                 upstream_response_body=self._serialize_response_body(
                     attempt.response.body
-                ),
+                )
+                if log_bodies
+                else None,
             )
             try:
                 with anyio.CancelScope(shield=True):
@@ -978,7 +1320,7 @@ class ProxyService:
             stream_error: Optional[str] = None
 
             def record_stream_chunk(chunk: Any) -> None:
-                if not chunk:
+                if not chunk or not log_bodies:
                     return
                 if isinstance(chunk, (bytes, bytearray)):
                     raw_stream_chunks.append(bytes(chunk))
@@ -1069,15 +1411,19 @@ class ProxyService:
                     if raw_stream_chunks
                     else ""
                 )
-                reconstructed_body = json.dumps(
-                    {
-                        "type": "stream_reconstruction",
-                        "protocol": protocol,
-                        "output_text": usage_result.output_text,
-                        "upstream_reported_output_tokens": usage_result.upstream_reported_output_tokens,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
+                reconstructed_body = (
+                    json.dumps(
+                        {
+                            "type": "stream_reconstruction",
+                            "protocol": protocol,
+                            "output_text": usage_result.output_text,
+                            "upstream_reported_output_tokens": usage_result.upstream_reported_output_tokens,
+                        },
+                        ensure_ascii=False,
+                        indent=2,
+                    )
+                    if log_bodies
+                    else ""
                 )
                 combined_body = raw_stream_text
                 log_data = RequestLogCreate(
@@ -1118,7 +1464,9 @@ class ProxyService:
                     supplier_protocol=stream_conversion_data.get("supplier_protocol"),
                     converted_request_body=_smart_truncate(
                         stream_conversion_data.get("converted_request_body")
-                    ),
+                    )
+                    if log_bodies
+                    else None,
                     # For stream, upstream_response_body is the raw stream captured from upstream
                     upstream_response_body=(
                         b"".join(stream_conversion_data["upstream_chunks"]).decode(
@@ -1147,12 +1495,12 @@ class ProxyService:
         return (
             initial_response,
             wrapped_generator(),
-            {
-                "trace_id": trace_id,
-                "retry_count": retry_count,
-                "target_model": final_provider.target_model if final_provider else None,
-                "provider_name": final_provider.provider_name
+            LogInfo(
+                trace_id=trace_id,
+                retry_count=retry_count,
+                target_model=final_provider.target_model if final_provider else None,
+                provider_name=final_provider.provider_name
                 if final_provider
                 else None,
-            },
+            ),
         )
@@ -6,6 +6,7 @@ Implements logic for request retry and provider failover.
 
 import asyncio
 import logging
+import random
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, Awaitable
@@ -14,11 +15,17 @@ from app.config import get_settings
 from app.common.time import utc_now
 from app.providers.base import ProviderResponse
 from app.rules.models import CandidateProvider
+from app.services.circuit_breaker import get_circuit_breaker
 from app.services.strategy import SelectionStrategy
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+class _ParallelAttemptSucceeded(Exception):
+    """Raised inside a parallel failover attempt to cancel its siblings"""
+
+
+@dataclass(slots=True)
 class AttemptRecord:
     """
     Attempt Record
@@ -32,7 +39,7 @@ class AttemptRecord:
     attempt_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryResult:
     """
     Retry Result Data Class
@@ -57,9 +64,20 @@ class RetryHandler:
     Retry and Failover Handler
     
     Implements the following retry logic:
-    - Status code >= 500: Retry on the same provider, max 3 times, 1000ms interval
+    - Status code >= 500: Retry on the same provider up to RETRY_MAX_ATTEMPTS times
+      (default 3), waiting RETRY_DELAY_MS * RETRY_BACKOFF_BASE**(n-1) before the
+      n-th retry plus up to RETRY_JITTER_MS of random jitter (defaults 1000ms,
+      2.0 and 250ms: about 1s, 2s, 4s)
     - Status code < 500: Switch directly to the next provider
     - All providers failed: Return the last failed response
+    - Hedging (opt-in, non-streaming): if the first attempt is slower than
+      HEDGE_DELAY_MS, race it against the next provider
+    - Parallel failover (FAILOVER_MODE="parallel", non-streaming, routes that
+      allow hedging, HEDGE_DELAY_MS > 0): providers are started in failover
+      order, staggered by HEDGE_DELAY_MS, each retried on server errors as
+      above, and the first success cancels the rest
+    - Providers whose circuit breaker is open (repeated server errors) are
+      skipped, unless every candidate's is
     """
     
     def __init__(self, strategy: SelectionStrategy):
@@ -73,8 +91,192 @@ class RetryHandler:
         self.strategy = strategy
         # Max retries on same provider
         self.max_retries = settings.RETRY_MAX_ATTEMPTS
-        # Retry interval (ms)
+        # Retry interval (ms), growing by the backoff base per retry, plus random jitter
         self.retry_delay_ms = settings.RETRY_DELAY_MS
+        self.retry_backoff_base = settings.RETRY_BACKOFF_BASE
+        self.retry_jitter_ms = settings.RETRY_JITTER_MS
+        # Delay before hedging a slow first attempt to the next provider (0 = disabled)
+        self.hedge_delay_ms = settings.HEDGE_DELAY_MS
+        # "sequential" or "parallel" failover for non-streaming requests
+        self.failover_mode = settings.FAILOVER_MODE
+        # Shared per-provider circuit breaker (None = disabled)
+        self.circuit_breaker = get_circuit_breaker()
+
+    def _retry_delay(self, retry: int) -> float:
+        """
+        Delay before the given retry on the same provider (1 = first retry)
+
+        Args:
+            retry: Retry number on the current provider
+
+        Returns:
+            float: Delay in seconds
+        """
+        delay_ms = self.retry_delay_ms * self.retry_backoff_base ** (retry - 1)
+        if self.retry_jitter_ms > 0:
+            delay_ms += random.uniform(0, self.retry_jitter_ms)
+        return delay_ms / 1000
+
+    def _record_outcome(self, provider: CandidateProvider, response: ProviderResponse) -> None:
+        """Feed an attempt's response to the circuit breaker"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(provider.provider_id, response)
+
+    async def _forward_hedged(
+        self,
+        primary: CandidateProvider,
+        backup: CandidateProvider,
+        forward_fn: Callable[[CandidateProvider], Any],
+    ) -> list[tuple[CandidateProvider, ProviderResponse, datetime]]:
+        """
+        Run the first attempt, hedging to a backup provider if it is slow
+
+        The backup request is only started when the primary has not completed
+        within hedge_delay_ms. Once both are running, the first successful
+        response wins and the other request is cancelled.
+
+        Returns:
+            list: Completed (provider, response, request_time) in completion order.
+                Contains only the primary when no hedge was started; otherwise ends
+                with the winning response, or holds both failures.
+        """
+        primary_time = utc_now()
+        primary_task = asyncio.ensure_future(forward_fn(primary))
+        done, _ = await asyncio.wait(
+            {primary_task}, timeout=self.hedge_delay_ms / 1000
+        )
+        if done:
+            return [(primary, primary_task.result(), primary_time)]
+
+        logger.info(
+            "Hedging slow provider: provider_id=%s, hedge_provider_id=%s, delay_ms=%s",
+            primary.provider_id,
+            backup.provider_id,
+            self.hedge_delay_ms,
+        )
+        backup_time = utc_now()
+        backup_task = asyncio.ensure_future(forward_fn(backup))
+        pending = {
+            primary_task: (primary, primary_time),
+            backup_task: (backup, backup_time),
+        }
+        outcomes: list[tuple[CandidateProvider, ProviderResponse, datetime]] = []
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    set(pending), return_when=asyncio.FIRST_COMPLETED
+                )
+                # Failures first, so a success completing in the same batch comes last
+                for task in sorted(done, key=lambda t: t.result().is_success):
+                    provider, request_time = pending.pop(task)
+                    outcomes.append((provider, task.result(), request_time))
+                if outcomes[-1][1].is_success:
+                    break
+        finally:
+            # Cancel the loser so its connection is released back to the pool
+            for task in pending:
+                task.cancel()
+        return outcomes
+
+    async def _execute_parallel(
+        self,
+        candidates: list[CandidateProvider],
+        requested_model: str,
+        forward_fn: Callable[[CandidateProvider], Any],
+        *,
+        input_tokens: Optional[int] = None,
+        on_failure_attempt: Callable[[AttemptRecord], Awaitable[None]] | None = None,
+    ) -> RetryResult:
+        """
+        Try all providers concurrently with staggered starts
+
+        Provider i starts once provider i-1 has failed or has been running for
+        hedge_delay_ms, whichever comes first. Server errors are retried on the
+        same provider up to max_retries times, as in sequential failover; a
+        provider counts as failed once its retries are used up or it returns
+        a client error. The first successful response cancels every attempt
+        still in flight.
+
+        Returns:
+            RetryResult: Retry result
+        """
+        ordered = await self.get_ordered_candidates(
+            candidates, requested_model, input_tokens=input_tokens
+        )
+        stagger = self.hedge_delay_ms / 1000
+        failed = [asyncio.Event() for _ in ordered]
+        attempts: list[AttemptRecord] = []
+        winner: Optional[AttemptRecord] = None
+
+        async def attempt(index: int, provider: CandidateProvider) -> None:
+            nonlocal winner
+            if index:
+                try:
+                    await asyncio.wait_for(failed[index - 1].wait(), stagger)
+                except TimeoutError:
+                    pass
+            max_attempts = max(self.max_retries, 1)
+            for retry in range(max_attempts):
+                if retry:
+                    await asyncio.sleep(self._retry_delay(retry))
+                request_time = utc_now()
+                response = await forward_fn(provider)
+                self._record_outcome(provider, response)
+                record = AttemptRecord(
+                    provider=provider,
+                    response=response,
+                    request_time=request_time,
+                    attempt_index=len(attempts),
+                )
+                attempts.append(record)
+                if response.is_success:
+                    winner = record
+                    raise _ParallelAttemptSucceeded()
+                logger.warning(
+                    "Provider request failed (parallel): provider_id=%s, provider_name=%s, "
+                    "status_code=%s, error=%s, retry_attempt=%s/%s",
+                    provider.provider_id,
+                    provider.provider_name,
+                    response.status_code,
+                    response.error,
+                    retry + 1,
+                    max_attempts,
+                )
+                # Status code < 500: no retry on the same provider
+                if not response.is_server_error:
+                    break
+            failed[index].set()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for index, provider in enumerate(ordered):
+                    tg.create_task(attempt(index, provider))
+        except* _ParallelAttemptSucceeded:
+            pass
+
+        # Failure callbacks run after the group so a winning attempt cannot cancel them
+        if on_failure_attempt is not None:
+            for record in attempts:
+                if record is winner:
+                    continue
+                try:
+                    await on_failure_attempt(record)
+                except Exception:
+                    logger.exception(
+                        "on_failure_attempt callback failed: provider_id=%s attempt_index=%s",
+                        record.provider.provider_id,
+                        record.attempt_index,
+                    )
+
+        failures = len(attempts) - (1 if winner is not None else 0)
+        final = winner or attempts[-1]
+        return RetryResult(
+            response=final.response,
+            retry_count=failures,
+            final_provider=final.provider,
+            success=winner is not None,
+            attempts=attempts,
+        )
 
     async def get_ordered_candidates(
         self,
@@ -122,6 +324,7 @@ class RetryHandler:
         *,
         input_tokens: Optional[int] = None,
         on_failure_attempt: Callable[[AttemptRecord], Awaitable[None]] | None = None,
+        hedge: bool = False,
     ) -> RetryResult:
         """
         Execute Request with Retry
@@ -131,6 +334,9 @@ class RetryHandler:
             requested_model: Requested model name
             forward_fn: Forwarding function, accepts CandidateProvider and returns ProviderResponse
             input_tokens: Number of input tokens (for cost-based selection)
+            hedge: Hedge a slow first attempt to the next provider (see HEDGE_DELAY_MS),
+                or race all providers when FAILOVER_MODE is "parallel". Only safe for
+                idempotent requests, since several providers may be billed.
 
         Returns:
             RetryResult: Retry result
@@ -146,7 +352,25 @@ class RetryHandler:
                 success=False,
                 attempts=[],
             )
+        if self.circuit_breaker is not None:
+            candidates = self.circuit_breaker.filter(candidates)
         
+        # Parallel failover fans one request out to several providers, so like
+        # hedging it is limited to routes that opted in, and needs a stagger
+        if (
+            hedge
+            and self.failover_mode == "parallel"
+            and self.hedge_delay_ms > 0
+            and len(candidates) > 1
+        ):
+            return await self._execute_parallel(
+                candidates,
+                requested_model,
+                forward_fn,
+                input_tokens=input_tokens,
+                on_failure_attempt=on_failure_attempt,
+            )
+
         # Track tried providers
         tried_providers: set[int] = set()
         total_retry_count = 0
@@ -157,7 +381,59 @@ class RetryHandler:
         
         # Select the first provider
         current_provider = await self.strategy.select(candidates, requested_model, input_tokens)
-        
+
+        # Response of the first attempt when it already ran as part of hedging
+        prefetched: Optional[tuple[ProviderResponse, datetime]] = None
+        if hedge and self.hedge_delay_ms > 0 and current_provider is not None:
+            backup = await self._get_next_untried_provider(
+                candidates,
+                {current_provider.provider_id},
+                requested_model,
+                current_provider,
+                input_tokens,
+            )
+            if backup is not None:
+                outcomes = await self._forward_hedged(current_provider, backup, forward_fn)
+                if len(outcomes) == 1 and outcomes[0][0] is current_provider:
+                    # Primary finished before the hedge fired: continue normally
+                    prefetched = (outcomes[0][1], outcomes[0][2])
+                else:
+                    for provider, response, request_time in outcomes:
+                        self._record_outcome(provider, response)
+                        tried_providers.add(provider.provider_id)
+                        last_provider = provider
+                        last_response = response
+                        attempt_record = AttemptRecord(
+                            provider=provider,
+                            response=response,
+                            request_time=request_time,
+                            attempt_index=attempt_index,
+                        )
+                        attempts.append(attempt_record)
+                        attempt_index += 1
+                        if response.is_success:
+                            return RetryResult(
+                                response=response,
+                                retry_count=total_retry_count,
+                                final_provider=provider,
+                                success=True,
+                                attempts=attempts,
+                            )
+                        total_retry_count += 1
+                        if on_failure_attempt is not None:
+                            try:
+                                await on_failure_attempt(attempt_record)
+                            except Exception:
+                                logger.exception(
+                                    "on_failure_attempt callback failed: provider_id=%s attempt_index=%s",
+                                    provider.provider_id,
+                                    attempt_record.attempt_index,
+                                )
+                    # Both hedged attempts failed: fail over to the remaining providers
+                    current_provider = await self._get_next_untried_provider(
+                        candidates, tried_providers, requested_model, backup, input_tokens
+                    )
+
         while current_provider is not None:
             # Record current provider as tried
             tried_providers.add(current_provider.provider_id)
@@ -168,8 +444,13 @@ class RetryHandler:
             
             while same_provider_retries < self.max_retries:
                 # Execute request
-                attempt_time = utc_now()
-                response = await forward_fn(current_provider)
+                if prefetched is not None:
+                    response, attempt_time = prefetched
+                    prefetched = None
+                else:
+                    attempt_time = utc_now()
+                    response = await forward_fn(current_provider)
+                self._record_outcome(current_provider, response)
                 last_response = response
                 attempt_record = AttemptRecord(
                     provider=current_provider,
@@ -220,7 +501,7 @@ class RetryHandler:
 
                     if same_provider_retries < self.max_retries:
                         # Wait before retry
-                        await asyncio.sleep(self.retry_delay_ms / 1000)
+                        await asyncio.sleep(self._retry_delay(same_provider_retries))
                         continue
                     else:
                         # Max retries reached, switch provider
@@ -291,6 +572,8 @@ class RetryHandler:
                 error="No available providers",
             ), None, 0
             return
+        if self.circuit_breaker is not None:
+            candidates = self.circuit_breaker.filter(candidates)
             
         tried_providers: set[int] = set()
         total_retry_count = 0
@@ -314,6 +597,7 @@ class RetryHandler:
                     generator = forward_stream_fn(current_provider)
                     # Get first chunk
                     chunk, response = await anext(generator)
+                    self._record_outcome(current_provider, response)
                     last_response = response
                     last_chunk = chunk
                     attempt_record = AttemptRecord(
@@ -359,7 +643,7 @@ class RetryHandler:
                         same_provider_retries += 1
                         total_retry_count += 1
                         if same_provider_retries < self.max_retries:
-                            await asyncio.sleep(self.retry_delay_ms / 1000)
+                            await asyncio.sleep(self._retry_delay(same_provider_retries))
                             continue
                         else:
                             logger.warning(
@@ -390,6 +674,7 @@ class RetryHandler:
                         attempt_index=attempt_index,
                     )
                     attempt_index += 1
+                    self._record_outcome(current_provider, attempt_record.response)
                     if on_failure_attempt is not None:
                         try:
                             await on_failure_attempt(attempt_record)
@@ -412,7 +697,7 @@ class RetryHandler:
                     same_provider_retries += 1
                     total_retry_count += 1
                     if same_provider_retries < self.max_retries:
-                        await asyncio.sleep(self.retry_delay_ms / 1000)
+                        await asyncio.sleep(self._retry_delay(same_provider_retries))
                         continue
                     else:
                         logger.warning(
@@ -457,8 +742,8 @@ class RetryHandler:
         Returns:
             Optional[CandidateProvider]: Next provider
         """
-        candidate_provider_ids = {c.provider_id for c in candidates}
-        if candidate_provider_ids and candidate_provider_ids.issubset(tried_providers):
+        # Stops at the first untried candidate, usually the first or second one
+        if all(c.provider_id in tried_providers for c in candidates):
             return None
 
         # Use the strategy to get the next provider
@@ -468,7 +753,7 @@ class RetryHandler:
 
         # Keep trying until we find an untried provider or run out of options.
         # Some strategies can cycle indefinitely; cap iterations to avoid infinite loops.
-        for _ in range(max(1, len(candidate_provider_ids))):
+        for _ in range(len(candidates)):
             if next_provider is None:
                 return None
             if next_provider.provider_id not in tried_providers:
@@ -6,15 +6,56 @@ Provides implementation for provider selection strategies.
 
 from abc import ABC, abstractmethod
 from typing import Optional
-import asyncio
 import logging
 
 from app.rules.models import CandidateProvider
 from app.common.costs import resolve_billing, calculate_cost_from_billing
+from app.common.http_client import get_upstream_load
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def _smooth_weighted_index(
+    candidates: list[CandidateProvider],
+    current_weights: dict[int, int],
+) -> int:
+    """
+    Pick a candidate by smooth weighted round robin (as in Nginx)
+
+    Every pick adds each candidate's weight to its current weight, selects the
+    highest (the first on ties) and subtracts the total weight from it, so
+    weights 3:1 are served A, A, B, A rather than in a burst of A, A, A, B.
+    When the weights do not add up to a positive total, all count as 1
+    (plain round robin).
+
+    Args:
+        candidates: Non-empty list of candidate providers
+        current_weights: Current weight by provider ID, updated in place
+
+    Returns:
+        int: Index of the selected candidate
+    """
+    total_weight = sum(c.weight for c in candidates)
+    use_simple_rr = total_weight <= 0
+    if use_simple_rr:
+        total_weight = len(candidates)
+
+    best_index = 0
+    best_weight = 0
+    for i, candidate in enumerate(candidates):
+        weight = current_weights.get(candidate.provider_id, 0) + (
+            1 if use_simple_rr else candidate.weight
+        )
+        current_weights[candidate.provider_id] = weight
+        if i == 0 or weight > best_weight:
+            best_index = i
+            best_weight = weight
+
+    current_weights[candidates[best_index].provider_id] = best_weight - total_weight
+    return best_index
+
+
 class SelectionStrategy(ABC):
     """
     Provider Selection Strategy Abstract Base Class
@@ -69,23 +110,16 @@ class RoundRobinStrategy(SelectionStrategy):
     """
     Round Robin Strategy
     
-    Selects providers in a round-robin fashion to ensure even distribution of requests.
-    Uses atomic counters for concurrency safety.
+    Selects providers by smooth weighted round robin to ensure even distribution
+    of requests. Current weights are read and advanced with no await in between,
+    so concurrent requests on the event loop never interleave there and no lock
+    is needed.
     """
     
     def __init__(self):
         """Initialize Strategy"""
-        # Maintain independent counters for each model
-        self._counters: dict[str, int] = {}
-        # Lock to protect counters
-        self._lock: Optional[asyncio.Lock] = None
-
-    @property
-    def lock(self) -> asyncio.Lock:
-        """Get lock (lazy loading)"""
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        return self._lock
+        # Maintain independent current weights (provider ID -> weight) for each model
+        self._current_weights: dict[str, dict[int, int]] = {}
     
     async def select(
         self,
@@ -106,42 +140,9 @@ class RoundRobinStrategy(SelectionStrategy):
         """
         if not candidates:
             return None
-        
-        # Calculate total weight
-        total_weight = sum(c.weight for c in candidates)
-        if total_weight <= 0:
-            # Fallback to simple round robin if weights are invalid
-            total_weight = len(candidates)
-            use_simple_rr = True
-        else:
-            use_simple_rr = False
-
-        async with self.lock:
-            # Get current count
-            counter = self._counters.get(requested_model, 0)
-            
-            if use_simple_rr:
-                index = counter % len(candidates)
-                selected = candidates[index]
-            else:
-                # Weighted selection
-                current_val = counter % total_weight
-                selected = None
-                cumulative_weight = 0
-                for candidate in candidates:
-                    cumulative_weight += candidate.weight
-                    if current_val < cumulative_weight:
-                        selected = candidate
-                        break
-                
-                # Should not happen if logic is correct
-                if selected is None:
-                    selected = candidates[0]
-
-            # Update count
-            self._counters[requested_model] = counter + 1
-        
-        return selected
+
+        current_weights = self._current_weights.setdefault(requested_model, {})
+        return candidates[_smooth_weighted_index(candidates, current_weights)]
     
     async def get_next(
         self,
@@ -184,15 +185,15 @@ class RoundRobinStrategy(SelectionStrategy):
     
     def reset(self, requested_model: Optional[str] = None) -> None:
         """
-        Reset counters (for testing)
+        Reset current weights (for testing)
 
         Args:
             requested_model: Specific model name, resets all if None
         """
         if requested_model:
-            self._counters.pop(requested_model, None)
+            self._current_weights.pop(requested_model, None)
         else:
-            self._counters.clear()
+            self._current_weights.clear()
 
 
 class PriorityStrategy(SelectionStrategy):
@@ -205,16 +206,9 @@ class PriorityStrategy(SelectionStrategy):
 
     def __init__(self):
         """Initialize Strategy"""
-        self._counters: dict[tuple[str, int], int] = {}
+        # Current weights advance without an await in between, see RoundRobinStrategy
+        self._current_weights: dict[tuple[str, int], dict[int, int]] = {}
         self._last_selected_index: dict[tuple[str, int], int] = {}
-        self._lock: Optional[asyncio.Lock] = None
-
-    @property
-    def lock(self) -> asyncio.Lock:
-        """Get lock (lazy loading)"""
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        return self._lock
 
     def _group_candidates(
         self,
@@ -234,39 +228,9 @@ class PriorityStrategy(SelectionStrategy):
         priority: int,
     ) -> CandidateProvider:
         key = (requested_model, priority)
-        
-        # Calculate total weight
-        total_weight = sum(c.weight for c in group)
-        if total_weight <= 0:
-            total_weight = len(group)
-            use_simple_rr = True
-        else:
-            use_simple_rr = False
-            
-        async with self.lock:
-            counter = self._counters.get(key, 0)
-            
-            if use_simple_rr:
-                index = counter % len(group)
-                selected = group[index]
-            else:
-                current_val = counter % total_weight
-                selected = None
-                cumulative_weight = 0
-                for i, candidate in enumerate(group):
-                    cumulative_weight += candidate.weight
-                    if current_val < cumulative_weight:
-                        selected = candidate
-                        index = i
-                        break
-                
-                if selected is None:
-                    selected = group[0]
-                    index = 0
-
-            self._counters[key] = counter + 1
-            self._last_selected_index[key] = index
-        return selected
+        index = _smooth_weighted_index(group, self._current_weights.setdefault(key, {}))
+        self._last_selected_index[key] = index
+        return group[index]
 
     async def select(
         self,
@@ -348,18 +312,18 @@ class PriorityStrategy(SelectionStrategy):
 
     def reset(self, requested_model: Optional[str] = None) -> None:
         """
-        Reset counters (for testing)
+        Reset current weights (for testing)
 
         Args:
             requested_model: Specific model name, resets all if None
         """
         if requested_model:
-            keys = [key for key in self._counters if key[0] == requested_model]
+            keys = [key for key in self._current_weights if key[0] == requested_model]
             for key in keys:
-                self._counters.pop(key, None)
+                self._current_weights.pop(key, None)
                 self._last_selected_index.pop(key, None)
         else:
-            self._counters.clear()
+            self._current_weights.clear()
             self._last_selected_index.clear()
 
 
@@ -568,3 +532,109 @@ class CostFirstStrategy(SelectionStrategy):
         )
 
         return next_candidate
+
+
+class ModelAffinityStrategy(SelectionStrategy):
+    """
+    Model Affinity Strategy
+
+    Prefers providers whose backend last served the requested target model, so
+    self-hosted backends (Ollama, vLLM, ...) don't swap models in and out of memory
+    on interleaved traffic. Ties and misses are broken by current upstream load
+    (in-flight plus queued requests), then priority.
+    An affinity hit is ignored once its upstream queue exceeds AFFINITY_MAX_QUEUED,
+    so requests are not starved behind a busy backend.
+    """
+
+    def __init__(self, max_queued: Optional[int] = None):
+        """
+        Initialize Strategy
+
+        Args:
+            max_queued: Queue length above which affinity is ignored,
+                defaults to configuration
+        """
+        self._max_queued = max_queued
+        # Last target model dispatched to each provider
+        self._last_model: dict[int, str] = {}
+
+    @property
+    def max_queued(self) -> int:
+        """Get affinity queue threshold"""
+        if self._max_queued is None:
+            self._max_queued = get_settings().AFFINITY_MAX_QUEUED
+        return self._max_queued
+
+    def _score(self, candidate: CandidateProvider) -> tuple[bool, int, int, int]:
+        """Sort key: affinity hit first, then least loaded, then priority"""
+        active, waiting = get_upstream_load(candidate.base_url)
+        hit = (
+            self._last_model.get(candidate.provider_id) == candidate.target_model
+            and waiting <= self.max_queued
+        )
+        return (not hit, active + waiting, candidate.priority, candidate.provider_id)
+
+    def _rank(self, candidates: list[CandidateProvider]) -> list[CandidateProvider]:
+        return sorted(candidates, key=self._score)
+
+    def _record(self, candidate: CandidateProvider) -> CandidateProvider:
+        self._last_model[candidate.provider_id] = candidate.target_model
+        return candidate
+
+    async def select(
+        self,
+        candidates: list[CandidateProvider],
+        requested_model: str,
+        input_tokens: Optional[int] = None,
+    ) -> Optional[CandidateProvider]:
+        """
+        Select the provider already serving the target model, or the least loaded one
+
+        Args:
+            candidates: List of candidate providers
+            requested_model: Requested model name
+            input_tokens: Number of input tokens (unused in affinity strategy)
+
+        Returns:
+            Optional[CandidateProvider]: Selected provider
+        """
+        if not candidates:
+            return None
+        return self._record(min(candidates, key=self._score))
+
+    async def get_next(
+        self,
+        candidates: list[CandidateProvider],
+        requested_model: str,
+        current: CandidateProvider,
+        input_tokens: Optional[int] = None,
+    ) -> Optional[CandidateProvider]:
+        """
+        Get next provider in affinity/load order (used for failover)
+
+        Args:
+            candidates: List of candidate providers
+            requested_model: Requested model name
+            current: Current provider
+            input_tokens: Number of input tokens (unused in affinity strategy)
+
+        Returns:
+            Optional[CandidateProvider]: Next provider, or None if no provider available
+        """
+        if not candidates or len(candidates) <= 1:
+            return None
+
+        # Walk one ranking of all candidates without recording the pick, so
+        # repeated calls from the failover loop visit every provider in turn
+        ranked = self._rank(candidates)
+        current_index = next(
+            (i for i, c in enumerate(ranked) if c.provider_id == current.provider_id),
+            -1,
+        )
+        if current_index == -1:
+            return None
+        return ranked[(current_index + 1) % len(ranked)]
+
+    def reset(self) -> None:
+        """Forget recorded models (for testing)"""
+        self._last_model.clear()
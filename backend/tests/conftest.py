@@ -8,19 +8,67 @@ from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from app.common.http_client import reset_shared_clients
+from app.common.routing_cache import reset_routing_cache
 from app.db.models import Base
+from app.db.session import json_deserializer, json_serializer
+from app.repositories.sqlalchemy.api_key_repo import reset_api_key_cache
+from app.services.circuit_breaker import reset_circuit_breaker
+from app.services.log_writer import reset_log_writer
 
 
 # Use in-memory database for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_http_clients():
+    """Give each test a fresh upstream client pool (clients are bound to the test's loop)"""
+    reset_shared_clients()
+    yield
+    reset_shared_clients()
+
+
+@pytest.fixture(autouse=True)
+def _reset_api_key_cache():
+    """Keep cached API Key lookups from leaking between per-test databases"""
+    reset_api_key_cache()
+    yield
+    reset_api_key_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_routing_cache():
+    """Keep cached model routing from leaking between per-test databases"""
+    reset_routing_cache()
+    yield
+    reset_routing_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breaker():
+    """Keep provider failures recorded by one test from skipping providers in the next"""
+    reset_circuit_breaker()
+    yield
+    reset_circuit_breaker()
+
+
+@pytest.fixture(autouse=True)
+def _reset_log_writer():
+    """Keep buffered request logs from being flushed into the application database"""
+    reset_log_writer()
+    yield
+    reset_log_writer()
+
+
 @pytest_asyncio.fixture
 async def async_engine():
     """Create async database engine for testing"""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
     
     # Create all tables
@@ -29,10 +77,7 @@ async def async_engine():
     
     yield engine
     
-    # Clean up
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+    # The in-memory database is discarded with its connection, no drop_all needed
     await engine.dispose()
 
 
@@ -20,6 +20,7 @@ from app.common.time import utc_now
 from app.domain.api_key import ApiKeyModel
 from app.main import app
 from app.providers.base import ProviderResponse
+from app.services.proxy_service import LogInfo
 
 
 def _make_api_key() -> ApiKeyModel:
@@ -49,7 +50,7 @@ class MockProxyService:
             status_code=self.status_code,
             body=self.response_body,
             headers=self.headers,
-        ), {}
+        ), LogInfo(trace_id="")
 
     async def process_request_stream(self, **kwargs):
         self.calls.append(kwargs)
@@ -61,7 +62,7 @@ class MockProxyService:
         return ProviderResponse(
             status_code=self.status_code,
             headers={"Content-Type": "text/event-stream", **self.headers},
-        ), gen(), {}
+        ), gen(), LogInfo(trace_id="")
 
 
 class TestAnthropicMessages:
@@ -690,6 +691,32 @@ class TestAnthropicErrorHandling:
 
         app.dependency_overrides = {}
 
+    @pytest.mark.asyncio
+    async def test_malformed_json_body(self):
+        """Test a malformed request body is rejected with a structured 400 error."""
+        service = MockProxyService()
+        app.dependency_overrides[get_proxy_service] = lambda: service
+        app.dependency_overrides[get_current_api_key] = _make_api_key
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            for content in (b'{"model": "claude-3-5-sonnet-20241022",', b"[]"):
+                response = await client.post(
+                    "/v1/messages",
+                    content=content,
+                    headers={
+                        "x-api-key": "sk-ant-test",
+                        "content-type": "application/json",
+                    },
+                )
+
+                assert response.status_code == 400
+                assert response.json()["error"]["code"] == "invalid_json"
+
+        assert service.calls == []
+
+        app.dependency_overrides = {}
+
     @pytest.mark.asyncio
     async def test_rate_limit_error(self):
         """Test handling of rate limit errors."""
@@ -0,0 +1,165 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.deps import get_current_api_key, get_db, get_proxy_service
+from app.common.response_cache import ResponseCache
+from app.common.routing_cache import RoutingEntry
+from app.common.time import utc_now
+from app.config import get_settings
+from app.domain.api_key import ApiKeyModel
+from app.domain.model import ModelMapping
+from app.main import app
+from app.providers.base import ProviderResponse
+from app.rules.models import CandidateProvider
+from app.services.proxy_service import ProxyService
+
+_EMBEDDING_BODY = b'{"data":[{"embedding":[0.1]}],"usage":{"prompt_tokens":3,"total_tokens":3}}'
+
+
+@pytest.fixture(autouse=True)
+def direct_log_writes(monkeypatch):
+    monkeypatch.setenv("LOG_WRITE_BATCH_MS", "0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def _proxy_service(status_code=200):
+    now = utc_now()
+    model_mapping = ModelMapping(
+        requested_model="emb",
+        strategy="round_robin",
+        matching_rules=None,
+        capabilities=None,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    candidate = CandidateProvider(
+        provider_id=1,
+        provider_name="p-openai",
+        base_url="https://example.com",
+        protocol="openai",
+        api_key="sk-test",
+        target_model="text-embedding-3-small",
+        priority=0,
+        weight=1,
+    )
+    service = ProxyService(
+        model_repo=AsyncMock(),
+        provider_repo=AsyncMock(),
+        log_repo=AsyncMock(),
+    )
+    service._load_routing = AsyncMock(  # type: ignore[method-assign]
+        return_value=RoutingEntry(model_mapping, [], {}, {})
+    )
+    service._resolve_candidates = AsyncMock(  # type: ignore[method-assign]
+        return_value=(model_mapping, [candidate], 0, "openai", {})
+    )
+    client = AsyncMock()
+    client.forward = AsyncMock(
+        return_value=ProviderResponse(
+            status_code=status_code,
+            headers={"content-type": "application/json", "x-request-id": "req-1"},
+            body=_EMBEDDING_BODY,
+        )
+    )
+    return service, client
+
+
+def _override(db_session, service):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_proxy_service] = lambda: service
+    app.dependency_overrides[get_current_api_key] = lambda: ApiKeyModel(
+        id=1,
+        key_name="test-key",
+        key_value="sk-test...",
+        is_active=True,
+        created_at=utc_now(),
+        last_used_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_embeddings_cache_serves_and_logs_repeated_requests(db_session):
+    service, client = _proxy_service()
+    _override(db_session, service)
+    cache = ResponseCache(max_entries=8, ttl_seconds=60)
+
+    transport = ASGITransport(app=app)
+    with patch("app.api.proxy.openai.get_embeddings_cache", return_value=cache), patch(
+        "app.services.proxy_service.get_provider_client", return_value=client
+    ):
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            payload = {"model": "emb", "input": "hello"}
+            first = await ac.post("/v1/embeddings", json=payload)
+            second = await ac.post("/v1/embeddings", json=payload)
+            other = await ac.post("/v1/embeddings", json={"model": "emb", "input": "bye"})
+
+    assert client.forward.await_count == 2
+    assert first.content == second.content == _EMBEDDING_BODY
+    assert other.status_code == 200
+    # The hit returns the upstream headers with its own trace ID
+    assert second.headers["content-type"] == "application/json"
+    assert second.headers["x-request-id"] == "req-1"
+    assert second.headers["x-trace-id"] not in ("", first.headers["x-trace-id"])
+
+    logs = [call.args[0] for call in service.log_repo.create.await_args_list]
+    assert len(logs) == 3
+    hit = next(log for log in logs if log.trace_id == second.headers["x-trace-id"])
+    assert hit.provider_name == "p-openai"
+    assert hit.target_model == "text-embedding-3-small"
+    assert hit.input_tokens == 3
+    assert hit.total_cost == 0
+    assert hit.usage_details["source"] == "cache"
+
+    app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_embeddings_cache_skips_failed_responses(db_session):
+    service, client = _proxy_service(status_code=400)
+    _override(db_session, service)
+    cache = ResponseCache(max_entries=8, ttl_seconds=60)
+
+    transport = ASGITransport(app=app)
+    with patch("app.api.proxy.openai.get_embeddings_cache", return_value=cache), patch(
+        "app.services.proxy_service.get_provider_client", return_value=client
+    ):
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            await ac.post("/v1/embeddings", json={"model": "emb", "input": "x"})
+            await ac.post("/v1/embeddings", json={"model": "emb", "input": "x"})
+
+    assert client.forward.await_count == 2
+    assert len(cache) == 0
+
+    app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_embeddings_cache_not_served_for_disabled_model(db_session):
+    service, client = _proxy_service()
+    _override(db_session, service)
+    cache = ResponseCache(max_entries=8, ttl_seconds=60)
+
+    transport = ASGITransport(app=app)
+    with patch("app.api.proxy.openai.get_embeddings_cache", return_value=cache), patch(
+        "app.services.proxy_service.get_provider_client", return_value=client
+    ):
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            payload = {"model": "emb", "input": "hello"}
+            first = await ac.post("/v1/embeddings", json=payload)
+            routing = service._load_routing.return_value
+            service._load_routing.return_value = routing._replace(
+                model_mapping=routing.model_mapping.model_copy(update={"is_active": False})
+            )
+            second = await ac.post("/v1/embeddings", json=payload)
+
+    assert first.status_code == 200
+    assert second.status_code == 503
+    assert second.json()["error"]["code"] == "model_disabled"
+    assert client.forward.await_count == 1
+
+    app.dependency_overrides = {}
@@ -5,6 +5,7 @@ from app.api.deps import get_current_api_key, get_proxy_service
 from app.domain.api_key import ApiKeyModel
 from app.main import app
 from app.providers.base import ProviderResponse
+from app.services.proxy_service import LogInfo
 from app.common.time import utc_now
 
 
@@ -14,7 +15,7 @@ class _DummyProxyService:
 
     async def process_request(self, **kwargs):
         self.calls.append(kwargs)
-        return ProviderResponse(status_code=200, body={"ok": True, "path": kwargs.get("path")}), {}
+        return ProviderResponse(status_code=200, body={"ok": True, "path": kwargs.get("path")}), LogInfo(trace_id="")
 
     async def process_request_stream(self, **kwargs):
         raise AssertionError("streaming not expected in these tests")
@@ -23,6 +23,7 @@ from app.common.time import utc_now
 from app.domain.api_key import ApiKeyModel
 from app.main import app
 from app.providers.base import ProviderResponse
+from app.services.proxy_service import LogInfo
 
 
 def _make_api_key() -> ApiKeyModel:
@@ -52,7 +53,7 @@ class MockProxyService:
             status_code=self.status_code,
             body=self.response_body,
             headers=self.headers,
-        ), {}
+        ), LogInfo(trace_id="")
 
     async def process_request_stream(self, **kwargs):
         self.calls.append(kwargs)
@@ -67,7 +68,7 @@ class MockProxyService:
                 headers={"Content-Type": "text/event-stream", **self.headers},
             ),
             gen(),
-            {},
+            LogInfo(trace_id=""),
         )
 
 
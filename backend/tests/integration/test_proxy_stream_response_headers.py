@@ -6,6 +6,7 @@ from app.common.time import utc_now
 from app.domain.api_key import ApiKeyModel
 from app.main import app
 from app.providers.base import ProviderResponse
+from app.services.proxy_service import LogInfo
 
 
 class _DummyProxyService:
@@ -23,7 +24,7 @@ class _DummyProxyService:
             },
             body=None,
         )
-        return initial, gen(), {}
+        return initial, gen(), LogInfo(trace_id="")
 
 
 @pytest.mark.asyncio
@@ -51,3 +52,73 @@ async def test_streaming_proxy_does_not_forward_content_length_header(db_session
 
     app.dependency_overrides = {}
 
+
+class _TracedProxyService(_DummyProxyService):
+    async def process_request_stream(self, *args, **kwargs):
+        initial, gen, _ = await super().process_request_stream(*args, **kwargs)
+        return initial, gen, LogInfo(trace_id="trace-123")
+
+
+@pytest.mark.asyncio
+async def test_streaming_proxy_disables_buffering_and_exposes_trace_id(db_session):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_proxy_service] = lambda: _TracedProxyService()
+
+    mock_api_key = ApiKeyModel(
+        id=1,
+        key_name="test-key",
+        key_value="sk-test...",
+        is_active=True,
+        created_at=utc_now(),
+        last_used_at=None,
+    )
+    app.dependency_overrides[get_current_api_key] = lambda: mock_api_key
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/v1/messages", json={"model": "claude-test", "stream": True})
+
+    assert resp.status_code == 200
+    assert resp.headers["x-accel-buffering"] == "no"
+    assert resp.headers["x-trace-id"] == "trace-123"
+    assert resp.text == "data: hello\n\n"
+
+    app.dependency_overrides = {}
+
+
+class _BufferedProxyService:
+    async def process_request(self, *args, **kwargs):
+        response = ProviderResponse(
+            status_code=200,
+            headers={"Content-Type": "application/json", "Content-Length": "999"},
+            body={"id": "chatcmpl-1"},
+        )
+        return response, LogInfo(trace_id="trace-456")
+
+
+@pytest.mark.asyncio
+async def test_buffered_proxy_response_exposes_trace_id(db_session):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_proxy_service] = lambda: _BufferedProxyService()
+
+    mock_api_key = ApiKeyModel(
+        id=1,
+        key_name="test-key",
+        key_value="sk-test...",
+        is_active=True,
+        created_at=utc_now(),
+        last_used_at=None,
+    )
+    app.dependency_overrides[get_current_api_key] = lambda: mock_api_key
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/v1/chat/completions", json={"model": "gpt-test"})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"id": "chatcmpl-1"}
+    assert resp.headers["x-trace-id"] == "trace-456"
+    assert resp.headers.get_list("content-type") == ["application/json"]
+    assert resp.headers["content-length"] == str(len(resp.content))
+
+    app.dependency_overrides = {}
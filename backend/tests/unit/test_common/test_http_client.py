@@ -0,0 +1,92 @@
+"""
+Shared HTTP Client Pool Unit Tests
+"""
+
+import asyncio
+import gzip
+
+import httpx
+import pytest
+
+from app.common.errors import UpstreamOverloadedError
+from app.common.http_client import (
+    UpstreamBulkhead,
+    close_shared_clients,
+    get_shared_client,
+    iter_response_bytes,
+    shared_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_across_calls():
+    first = await get_shared_client(None, 30)
+    async with shared_client(None, 30) as second:
+        assert second is first
+    assert not first.is_closed
+
+    await close_shared_clients()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_keyed_by_proxy():
+    direct = await get_shared_client(None, 30)
+    proxied = await get_shared_client("http://proxy.example.com:8080", 30)
+
+    assert direct is not proxied
+
+    await close_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_rejects_when_queue_is_full():
+    bulkhead = UpstreamBulkhead(max_concurrency=1, max_queued=1)
+    release = asyncio.Event()
+
+    async def hold_slot():
+        async with bulkhead.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold_slot())
+    waiter = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+
+    with pytest.raises(UpstreamOverloadedError):
+        async with bulkhead.slot():
+            pass
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+    # Slots are released once the in-flight requests finish
+    async with bulkhead.slot():
+        pass
+
+
+async def _collect(response: httpx.Response) -> bytes:
+    return b"".join([chunk async for chunk in iter_response_bytes(response)])
+
+
+@pytest.mark.asyncio
+async def test_iter_response_bytes_passes_identity_sse_through():
+    body = b'data: {"id": "1"}\n\n'
+    response = httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream; charset=utf-8"},
+        stream=httpx.ByteStream(body),
+    )
+
+    assert await _collect(response) == body
+
+
+@pytest.mark.asyncio
+async def test_iter_response_bytes_still_decodes_compressed_sse():
+    body = b'data: {"id": "1"}\n\n'
+    response = httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream", "content-encoding": "gzip"},
+        stream=httpx.ByteStream(gzip.compress(body)),
+    )
+
+    assert await _collect(response) == body
@@ -6,7 +6,9 @@ from app.common.protocol_conversion import (
     convert_request_for_supplier,
     convert_response_for_user,
     convert_stream_for_user,
+    normalize_protocol,
 )
+from app.common.errors import ServiceError
 from app.common.stream_usage import SSEDecoder
 
 
@@ -777,3 +779,199 @@ def test_convert_request_strips_stream_options_same_protocol_openai():
     assert "stream_options" not in out_body
     assert "include_usage" not in out_body
     assert out_body["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_convert_stream_anthropic_to_openai_frames_share_id_and_escape_text():
+    upstream_events = [
+        {
+            "type": "message_start",
+            "message": {"id": "msg_1", "usage": {"input_tokens": 3}},
+        },
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": '你好 "quoted"\n'},
+        },
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": "!"},
+        },
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "max_tokens"},
+            "usage": {"input_tokens": 3, "output_tokens": 2},
+        },
+    ]
+    upstream = _agen([f"data: {json.dumps(e)}\n\n".encode() for e in upstream_events])
+
+    decoder = SSEDecoder()
+    payloads = []
+    async for c in convert_stream_for_user(
+        request_protocol="openai",
+        supplier_protocol="anthropic",
+        upstream=upstream,
+        model='model "x"',
+    ):
+        payloads.extend(decoder.feed(c))
+
+    chunks = [json.loads(p) for p in payloads if p.strip() != "[DONE]"]
+    assert {c["id"] for c in chunks} == {"msg_1"}
+    assert {c["model"] for c in chunks} == {'model "x"'}
+    assert chunks[0]["choices"][0]["delta"] == {
+        "role": "assistant",
+        "content": '你好 "quoted"\n',
+    }
+    assert chunks[1]["choices"][0]["delta"] == {"content": "!"}
+    assert chunks[2]["choices"][0]["finish_reason"] == "length"
+    assert chunks[3]["choices"] == []
+    assert chunks[3]["usage"]["completion_tokens"] == 2
+
+
+@pytest.mark.asyncio
+async def test_convert_stream_openai_to_anthropic_tool_call_deltas():
+    upstream_chunks = [
+        {
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {"name": "get_weather", "arguments": ""},
+                            }
+                        ]
+                    },
+                }
+            ]
+        },
+        {
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '{"city":"北京"}'}}
+                        ]
+                    },
+                }
+            ]
+        },
+        {"choices": [{"index": 0, "delta": {}, "finish_reason": "tool_calls"}]},
+    ]
+    upstream = _agen(
+        [f"data: {json.dumps(c)}\n\n".encode() for c in upstream_chunks]
+        + [b"data: [DONE]\n\n"]
+    )
+
+    decoder = SSEDecoder()
+    events = []
+    async for c in convert_stream_for_user(
+        request_protocol="anthropic",
+        supplier_protocol="openai",
+        upstream=upstream,
+        model="claude-3-5-sonnet",
+    ):
+        events.extend(json.loads(p) for p in decoder.feed(c))
+
+    start = next(e for e in events if e["type"] == "content_block_start")
+    assert start["content_block"]["name"] == "get_weather"
+    deltas = [e for e in events if e["type"] == "content_block_delta"]
+    assert deltas == [
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "input_json_delta", "partial_json": '{"city":"北京"}'},
+        }
+    ]
+    message_delta = next(e for e in events if e["type"] == "message_delta")
+    assert message_delta["delta"]["stop_reason"] == "tool_use"
+
+
+@pytest.mark.asyncio
+async def test_convert_stream_coalesces_frames_per_upstream_chunk():
+    upstream_chunks = [
+        {"choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}]},
+        {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+    ]
+    upstream = _agen(
+        [f"data: {json.dumps(c)}\n\n".encode() for c in upstream_chunks]
+        + [b"data: [DONE]\n\n"]
+    )
+
+    writes = []
+    async for c in convert_stream_for_user(
+        request_protocol="anthropic",
+        supplier_protocol="openai",
+        upstream=upstream,
+        model="claude-3-5-sonnet",
+    ):
+        writes.append(c)
+
+    # message_start + content_block_start + delta, then block stop + delta + stop
+    assert len(writes) == 2
+    decoder = SSEDecoder()
+    assert [json.loads(p)["type"] for p in decoder.feed(writes[0])] == [
+        "message_start",
+        "content_block_start",
+        "content_block_delta",
+    ]
+    assert [json.loads(p)["type"] for p in decoder.feed(writes[1])] == [
+        "content_block_stop",
+        "message_delta",
+        "message_stop",
+    ]
+
+
+@pytest.mark.parametrize("supplier_protocol", ["openai", "anthropic"])
+def test_convert_request_for_supplier_leaves_caller_body_untouched(supplier_protocol):
+    body = {
+        "model": "any",
+        "stream": True,
+        "stream_options": {"include_usage": True},
+        "messages": [{"role": "user", "content": "Hi"}],
+        "functions": [{"name": "f", "parameters": {"type": "object"}}],
+        "function_call": "auto",
+    }
+    snapshot = json.loads(json.dumps(body))
+
+    convert_request_for_supplier(
+        request_protocol="openai",
+        supplier_protocol=supplier_protocol,
+        path="/v1/chat/completions",
+        body=body,
+        target_model="target",
+    )
+
+    assert body == snapshot
+
+
+def test_normalize_protocol_caches_results_but_not_errors():
+    normalize_protocol.cache_clear()
+
+    assert normalize_protocol("openai") == "openai"
+    assert normalize_protocol("openai") == "openai"
+    assert normalize_protocol.cache_info().hits == 1
+
+    for _ in range(2):
+        with pytest.raises(ServiceError):
+            normalize_protocol("not-a-protocol")
+
+
+def test_precomputed_anthropic_frames_match_encoded_events():
+    from app.common.protocol.converters import (
+        _MESSAGE_STOP_FRAME,
+        _encode_anthropic_block_stop,
+        _encode_sse_json,
+    )
+
+    assert _MESSAGE_STOP_FRAME == _encode_sse_json(
+        {"type": "message_stop"}, event="message_stop"
+    )
+    assert _encode_anthropic_block_stop(12) == _encode_sse_json(
+        {"type": "content_block_stop", "index": 12}, event="content_block_stop"
+    )
@@ -45,6 +45,7 @@ class TestProtocolEnum:
         assert Protocol.from_string("openai_responses") == Protocol.OPENAI_RESPONSES
         assert Protocol.from_string("anthropic") == Protocol.ANTHROPIC
         assert Protocol.from_string("anthropic_messages") == Protocol.ANTHROPIC
+        assert Protocol.from_string(" Anthropic_Messages ") == Protocol.ANTHROPIC
 
     def test_protocol_from_string_invalid(self):
         with pytest.raises(ValueError):
@@ -0,0 +1,48 @@
+"""
+Proxy Header Utilities Unit Tests
+"""
+
+from app.common.proxy_headers import (
+    build_raw_response_headers,
+    decode_request_headers,
+)
+
+
+def test_decode_request_headers_keeps_every_header():
+    raw = [
+        (b"host", b"gateway.local"),
+        (b"content-length", b"42"),
+        (b"authorization", b"Bearer lgw-secret"),
+        (b"anthropic-version", b"2023-06-01"),
+        (b"user-agent", b"client/1.0"),
+    ]
+
+    result = decode_request_headers(raw)
+
+    assert result == {
+        "host": "gateway.local",
+        "content-length": "42",
+        "authorization": "Bearer lgw-secret",
+        "anthropic-version": "2023-06-01",
+        "user-agent": "client/1.0",
+    }
+
+
+def test_decode_request_headers_keeps_first_duplicate():
+    raw = [(b"x-custom", b"first"), (b"x-custom", b"second")]
+
+    assert decode_request_headers(raw) == {"x-custom": "first"}
+
+
+def test_build_raw_response_headers_encodes_sanitized_headers_and_trace_id():
+    headers = {
+        "Content-Type": "application/json",
+        "Content-Length": "10",
+        "Transfer-Encoding": "chunked",
+        "X-Request-Id": "req-1",
+    }
+
+    result = build_raw_response_headers(headers, "trace-1", skip=frozenset({b"content-type"}))
+
+    assert result == [(b"x-request-id", b"req-1"), (b"x-trace-id", b"trace-1")]
+
@@ -0,0 +1,29 @@
+"""
+Response Cache Unit Tests
+"""
+
+from unittest.mock import patch
+
+from app.common.response_cache import ResponseCache
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set(b"a", b"1")
+    cache.set(b"b", b"2")
+    assert cache.get(b"a") == b"1"
+
+    cache.set(b"c", b"3")
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == b"1"
+    assert cache.get(b"c") == b"3"
+
+
+def test_response_cache_expires_entries():
+    cache = ResponseCache(max_entries=2, ttl_seconds=10)
+    with patch("app.common.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set(b"a", b"1")
+    with patch("app.common.ttl_cache.time.monotonic", return_value=111.0):
+        assert cache.get(b"a") is None
+    assert len(cache) == 0
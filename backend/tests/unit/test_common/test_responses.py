@@ -0,0 +1,20 @@
+"""
+Response Classes Unit Tests
+"""
+
+import json
+
+from app.common.responses import ORJSONResponse
+
+
+def test_orjson_response_renders_compact_utf8():
+    resp = ORJSONResponse(content={"text": "你好", 1: True})
+
+    assert resp.body == '{"text":"你好","1":true}'.encode("utf-8")
+    assert resp.media_type == "application/json"
+
+
+def test_orjson_response_falls_back_for_big_integers():
+    resp = ORJSONResponse(content={"n": 2**70})
+
+    assert json.loads(resp.body) == {"n": 2**70}
@@ -31,6 +31,11 @@ class TestSanitizeAuthorization:
         result = sanitize_authorization("short")
         assert result == "***"
     
+    def test_bearer_prefix_is_case_insensitive(self):
+        """Test lower-case bearer prefix is normalized"""
+        assert sanitize_authorization("bearer sk-1234567890abcdef") == "Bearer sk-1***...***ef"
+        assert sanitize_authorization("BEARER short") == "Bearer ***"
+    
     def test_empty_value(self):
         """Test empty value"""
         assert sanitize_authorization("") == ""
@@ -78,6 +83,15 @@ class TestSanitizeHeaders:
         """Test empty headers"""
         assert sanitize_headers({}) == {}
         assert sanitize_headers(None) == {}
+    
+    def test_mixed_case_header_names(self):
+        """Test sensitive header names are matched case-insensitively"""
+        headers = {"API-Key": "sk-1234567890abcdef", "X-Custom": "value"}
+        
+        result = sanitize_headers(headers)
+        
+        assert result == {"API-Key": "sk-1***...***ef", "X-Custom": "value"}
+        assert headers["API-Key"] == "sk-1234567890abcdef"
 
 
 class TestSanitizeApiKeyDisplay:
@@ -87,4 +101,4 @@ class TestSanitizeApiKeyDisplay:
         """Test API Key sanitization"""
         result = sanitize_api_key_display("lgw-abcdefghijklmnopqrstuvwxyz")
         assert result.startswith("lgw-")
-        assert "***" in result
\ No newline at end of file
+        assert "***" in result
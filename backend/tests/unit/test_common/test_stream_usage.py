@@ -2,7 +2,7 @@
 Streaming Usage Parsing Unit Tests
 """
 
-from app.common.stream_usage import StreamUsageAccumulator
+from app.common.stream_usage import SSEDecoder, StreamUsageAccumulator
 from app.common.token_counter import get_token_counter
 
 
@@ -79,3 +79,28 @@ def test_openai_stream_includes_legacy_function_call_in_output_text():
     result = acc.finalize()
     assert "get_weather" in result.output_text
     assert "arguments" in result.output_text
+
+
+def test_sse_decoder_handles_multibyte_text_split_across_chunks():
+    frame = 'data: {"text":"你好"}\n\n'.encode("utf-8")
+    split_at = frame.index("你".encode("utf-8")) + 1
+    decoder = SSEDecoder()
+
+    assert decoder.feed(frame[:split_at]) == []
+    assert decoder.feed(frame[split_at:]) == ['{"text":"你好"}']
+
+
+def test_sse_decoder_joins_multiline_data_and_ignores_other_fields():
+    decoder = SSEDecoder()
+
+    payloads = decoder.feed(b"event: ping\r\ndata: a\r\ndata:b\r\n\r\nevent: only\n\n")
+
+    assert payloads == ["a\nb"]
+
+
+def test_sse_decoder_feed_bytes_returns_undecoded_payloads():
+    decoder = SSEDecoder()
+
+    payloads = decoder.feed_bytes('data: {"text":"é"}\n\ndata: [DONE]\n\n'.encode("utf-8"))
+
+    assert payloads == ['{"text":"é"}'.encode("utf-8"), b"[DONE]"]
@@ -0,0 +1,28 @@
+"""
+Timer Unit Tests
+"""
+
+from app.common import timer as timer_module
+from app.common.timer import Timer
+
+
+def test_timer_reports_whole_milliseconds(monkeypatch):
+    readings = iter([1_000_000_000, 1_012_999_999, 1_250_000_000])
+    monkeypatch.setattr(timer_module.time, "perf_counter_ns", lambda: next(readings))
+
+    timer = Timer().start()
+    timer.mark_first_byte()
+    timer.stop()
+
+    assert timer.first_byte_delay_ms == 12
+    assert timer.total_time_ms == 250
+
+
+def test_timer_stop_without_first_byte_uses_end_time(monkeypatch):
+    readings = iter([0, 3_000_000])
+    monkeypatch.setattr(timer_module.time, "perf_counter_ns", lambda: next(readings))
+
+    timer = Timer().start().stop()
+
+    assert timer.first_byte_delay_ms == timer.total_time_ms == 3
+    assert Timer().total_time_ms is None
@@ -1,6 +1,10 @@
 
 import pytest
-from app.common.token_counter import OpenAITokenCounter
+from app.common.token_counter import (
+    OpenAITokenCounter,
+    _resolve_encoding_name,
+    get_token_counter,
+)
 
 def test_count_input_string():
     counter = OpenAITokenCounter()
@@ -69,3 +73,73 @@ def test_count_request_tools_increases_tokens():
     base = counter.count_request(body)
     with_tools = counter.count_request(body_with_tools)
     assert with_tools > base
+
+
+def test_get_token_counter_returns_shared_instances():
+    assert get_token_counter("openai") is get_token_counter("openai_responses")
+    assert get_token_counter("anthropic") is get_token_counter("Anthropic")
+    assert get_token_counter("openai") is not get_token_counter("anthropic")
+
+
+class _WordEncoding:
+    def __init__(self):
+        self.batch_calls = 0
+
+    def encode(self, text):
+        return text.split()
+
+    def encode_batch(self, texts, num_threads=8):
+        self.batch_calls += 1
+        return [self.encode(text) for text in texts]
+
+
+def test_count_messages_batches_long_conversations(monkeypatch):
+    counter = OpenAITokenCounter()
+    encoding = _WordEncoding()
+    monkeypatch.setattr(counter, "_get_encoding", lambda model: encoding)
+    messages = [
+        {"role": "user", "content": [{"type": "text", "text": f"hello there {i}"}]}
+        for i in range(counter.BATCH_ENCODE_MIN_TEXTS)
+    ]
+
+    total = counter.count_messages(messages)
+
+    # 4 overhead + role (1) + text (3) per message, plus 3 for priming
+    assert total == len(messages) * 8 + 3
+    assert encoding.batch_calls == 1
+
+
+def test_count_messages_encodes_short_conversations_inline(monkeypatch):
+    counter = OpenAITokenCounter()
+    encoding = _WordEncoding()
+    monkeypatch.setattr(counter, "_get_encoding", lambda model: encoding)
+
+    total = counter.count_messages([{"role": "user", "content": "a b", "name": "n"}])
+
+    assert total == 4 + 1 + 2 + 1 - 1 + 3
+    assert encoding.batch_calls == 0
+
+
+@pytest.mark.parametrize(
+    ("model", "encoding_name"),
+    [
+        ("gpt-4", "cl100k_base"),
+        ("gpt-4-32k-0613", "cl100k_base"),
+        ("text-davinci-003", "p50k_base"),
+        ("claude-3-5-sonnet", "cl100k_base"),
+        ("", "cl100k_base"),
+    ],
+)
+def test_resolve_encoding_name(model, encoding_name):
+    assert _resolve_encoding_name(model) == encoding_name
+
+
+def test_anthropic_count_messages_estimates_over_combined_length():
+    counter = get_token_counter("anthropic")
+    messages = [
+        {"role": "user", "content": "abcdef"},
+        {"role": "assistant", "content": [{"type": "text", "text": "ghijkl"}]},
+    ]
+
+    # (4 + 6 + 9 + 6) // 4 characters, plus 4 overhead per message
+    assert counter.count_messages(messages) == 6 + 8
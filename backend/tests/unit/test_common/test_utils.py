@@ -2,12 +2,16 @@
 Utility Functions Unit Tests
 """
 
+import json
+import uuid
+
 import pytest
 from app.common.utils import (
     generate_api_key,
     generate_trace_id,
     extract_model_from_body,
     replace_model_in_body,
+    rewrite_model_field,
     mask_string,
     try_parse_json_object,
 )
@@ -41,6 +45,10 @@ class TestGenerateTraceId:
         trace_id = generate_trace_id()
         assert len(trace_id) == 36  # UUID format
         assert "-" in trace_id
+        parsed = uuid.UUID(trace_id)
+        assert str(parsed) == trace_id
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
     
     def test_generate_unique_trace_ids(self):
         """Test uniqueness of generated trace IDs"""
@@ -101,6 +109,27 @@ class TestReplaceModelInBody:
         assert result["tools"] == [{"type": "function"}]
 
 
+class TestRewriteModelField:
+    """Rewrite Model in Serialized Body Tests"""
+
+    def test_patches_top_level_model_bytes(self):
+        """Test only the model value is replaced, the rest is byte-identical"""
+        raw = b'{"model" : "gpt-4", "messages": [{"role": "user", "content": "Hi"}]}'
+        result = rewrite_model_field(raw, 'gpt-"4o"')
+
+        assert result == (
+            b'{"model":"gpt-\\"4o\\"", "messages": [{"role": "user", "content": "Hi"}]}'
+        )
+        assert json.loads(result)["model"] == 'gpt-"4o"'
+
+    def test_falls_back_when_model_key_is_ambiguous(self):
+        """Test nested model keys fall back to re-serialization"""
+        raw = b'{"metadata": {"model": "nested"}, "model": "gpt-4"}'
+        result = json.loads(rewrite_model_field(raw, "target-model"))
+
+        assert result == {"metadata": {"model": "nested"}, "model": "target-model"}
+
+
 class TestMaskString:
     """String Masking Tests"""
     
@@ -595,7 +595,7 @@ class TestAnthropicClientStreaming:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "text/event-stream"}
-            mock_response.aiter_bytes.return_value = mock_aiter_bytes()
+            mock_response.aiter_raw.return_value = mock_aiter_bytes()
 
             # Setup async context manager
             mock_stream_ctx = MagicMock()
@@ -642,7 +642,7 @@ class TestAnthropicClientStreaming:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "text/event-stream"}
-            mock_response.aiter_bytes.return_value = mock_aiter_bytes()
+            mock_response.aiter_raw.return_value = mock_aiter_bytes()
 
             # Setup async context manager
             mock_stream_ctx = MagicMock()
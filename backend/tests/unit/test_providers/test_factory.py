@@ -0,0 +1,22 @@
+"""
+Provider Client Factory Unit Tests
+"""
+
+import pytest
+
+from app.providers.anthropic_client import AnthropicClient
+from app.providers.factory import get_provider_client
+from app.providers.openai_client import OpenAIClient
+
+
+def test_get_provider_client_returns_cached_instance_per_protocol():
+    client = get_provider_client("openai")
+    assert isinstance(client, OpenAIClient)
+    assert get_provider_client("OpenAI") is client
+    assert get_provider_client("openai_responses") is client
+    assert isinstance(get_provider_client("anthropic"), AnthropicClient)
+
+
+def test_get_provider_client_rejects_unknown_protocol():
+    with pytest.raises(ValueError):
+        get_provider_client("gemini")
@@ -1,7 +1,8 @@
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.providers.openai_client import OpenAIClient
-from app.providers.base import ProviderResponse
+from app.providers.base import ProviderResponse, parse_json_body
 
 @pytest.mark.asyncio
 async def test_openai_client_forward_url_construction():
@@ -104,4 +105,68 @@ async def test_openai_client_forward_raw_passthrough_body_bytes():
 
         assert isinstance(resp, ProviderResponse)
         assert resp.status_code == 200
-        assert resp.body == b'{"id":"raw"}'
\ No newline at end of file
+        assert resp.body == b'{"id":"raw"}'
+@pytest.mark.asyncio
+async def test_openai_client_forward_sends_patched_raw_body():
+    client = OpenAIClient()
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = AsyncMock()
+        mock_client.request.return_value = MagicMock(
+            status_code=200,
+            headers={},
+            text='{"id": "test"}',
+            json=lambda: {"id": "test"}
+        )
+        mock_client_cls.return_value.__aenter__.return_value = mock_client
+
+        await client.forward(
+            base_url="https://api.openai.com",
+            api_key="sk-test",
+            path="/v1/chat/completions",
+            method="POST",
+            headers={},
+            body={"model": "alias", "messages": []},
+            target_model="gpt-4o",
+            raw_body=b'{"model": "alias", "messages": []}',
+        )
+
+        call_args = mock_client.request.call_args
+        assert call_args.kwargs["content"] == b'{"model":"gpt-4o", "messages": []}'
+        assert "json" not in call_args.kwargs
+
+
+@pytest.mark.parametrize(
+    ("content", "headers", "expected"),
+    [
+        (b'{"id": "chatcmpl-1"}', {}, {"id": "chatcmpl-1"}),
+        (
+            '{"text": "hé"}'.encode("utf-16"),
+            {"content-type": "application/json; charset=utf-16"},
+            {"text": "hé"},
+        ),
+        (b"<html>bad gateway</html>", {}, "<html>bad gateway</html>"),
+    ],
+)
+def test_parse_json_body(content, headers, expected):
+    response = httpx.Response(200, headers=headers, content=content)
+
+    assert parse_json_body(response) == expected
+
+
+def test_prepare_headers_strips_credentials_and_hop_by_hop_headers():
+    client = OpenAIClient()
+    headers = {
+        "authorization": "Bearer lgw-secret",
+        "x-api-key": "lgw-secret",
+        "host": "gateway.local",
+        "content-length": "42",
+        "connection": "keep-alive",
+        "transfer-encoding": "chunked",
+        "x-custom": "kept",
+    }
+
+    assert client._prepare_headers(headers, "sk-upstream") == {
+        "x-custom": "kept",
+        "Authorization": "Bearer sk-upstream",
+    }
@@ -612,7 +612,7 @@ class TestOpenAIClientStreaming:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "text/event-stream"}
-            mock_response.aiter_bytes.return_value = mock_aiter_bytes()
+            mock_response.aiter_raw.return_value = mock_aiter_bytes()
 
             # Setup async context manager
             mock_stream_ctx = MagicMock()
@@ -0,0 +1,148 @@
+"""
+Test API Key repository writes and authentication lookup cache.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models import RequestLog
+from app.domain.api_key import ApiKeyCreate, ApiKeyUpdate
+from app.domain.log import RequestLogCreate
+from app.repositories.sqlalchemy import api_key_repo
+from app.repositories.sqlalchemy.api_key_repo import SQLAlchemyApiKeyRepository
+from app.repositories.sqlalchemy.log_repo import SQLAlchemyLogRepository
+
+
+@pytest.mark.asyncio
+async def test_update_returns_updated_model(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+
+    updated = await repo.update(created.id, ApiKeyUpdate(is_active=False))
+
+    assert updated is not None
+    assert updated.is_active is False
+    assert updated.key_name == "k1"
+    assert await repo.update(created.id + 100, ApiKeyUpdate(is_active=False)) is None
+
+
+@pytest.mark.asyncio
+async def test_update_last_used_persists_timestamp(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+    used_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    await repo.update_last_used(created.id, used_at)
+    db_session.expire_all()
+
+    fetched = await repo.get_by_id(created.id)
+    assert fetched is not None
+    assert fetched.last_used_at == used_at
+
+
+@pytest.mark.asyncio
+async def test_update_last_used_many_sets_each_key(db_session, monkeypatch):
+    monkeypatch.setattr(api_key_repo, "_LAST_USED_BATCH_SIZE", 2)
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = [
+        await repo.create(ApiKeyCreate(key_name=f"k{i}"), f"lgw-value-{i}")
+        for i in range(3)
+    ]
+    used_at = {
+        api_key.id: datetime(2024, 1, 2, 3, 4, i, tzinfo=timezone.utc)
+        for i, api_key in enumerate(created)
+    }
+
+    # A key deleted before the flush is skipped
+    missing_id = created[-1].id + 100
+    await repo.update_last_used_many({**used_at, missing_id: datetime.now(timezone.utc)})
+    db_session.expire_all()
+
+    for api_key in created:
+        fetched = await repo.get_by_id(api_key.id)
+        assert fetched.last_used_at == used_at[api_key.id]
+
+
+@pytest.mark.asyncio
+async def test_delete_detaches_request_logs(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+    log = await SQLAlchemyLogRepository(db_session).create(
+        RequestLogCreate(
+            request_time=datetime.now(timezone.utc),
+            api_key_id=created.id,
+            api_key_name="k1",
+            requested_model="gpt-4",
+            retry_count=0,
+            matched_provider_count=1,
+            response_status=200,
+            trace_id="trace-delete",
+            is_stream=False,
+        )
+    )
+
+    assert await repo.delete(created.id) is True
+    assert await repo.delete(created.id) is False
+    assert await repo.get_by_id(created.id) is None
+
+    api_key_id = await db_session.scalar(
+        select(RequestLog.api_key_id).where(RequestLog.id == log.id)
+    )
+    assert api_key_id is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_key_value_is_cached_until_update_or_delete(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+
+    first = await repo.get_by_key_value("lgw-value-1")
+    with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+        assert await repo.get_by_key_value("lgw-value-1") is first
+        execute.assert_not_called()
+
+    await repo.update(created.id, ApiKeyUpdate(is_active=False))
+    refreshed = await repo.get_by_key_value("lgw-value-1")
+    assert refreshed is not None
+    assert refreshed.is_active is False
+
+    await repo.delete(created.id)
+    assert await repo.get_by_key_value("lgw-value-1") is None
+
+
+@pytest.mark.asyncio
+async def test_column_reads_match_created_model(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+
+    by_id = await repo.get_by_id(created.id)
+    by_name = await repo.get_by_name("k1")
+    by_value = await repo.get_by_key_value("lgw-value-1")
+
+    assert by_id == by_name == by_value == created
+    assert by_id.created_at.tzinfo == timezone.utc
+
+
+@pytest.mark.asyncio
+async def test_get_all_filters_and_pages(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    created = [
+        await repo.create(ApiKeyCreate(key_name=f"k{i}"), f"lgw-value-{i}")
+        for i in range(3)
+    ]
+    await repo.update(created[0].id, ApiKeyUpdate(is_active=False))
+
+    items, total = await repo.get_all(page=1, page_size=2)
+    assert total == 3
+    assert [item.key_name for item in items] == ["k2", "k1"]
+
+    items, total = await repo.get_all(is_active=False)
+    assert total == 1
+    assert [item.key_name for item in items] == ["k0"]
+
+    items, total = await repo.get_all(page=5, page_size=2)
+    assert items == []
+    assert total == 3
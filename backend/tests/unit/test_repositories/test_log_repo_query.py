@@ -0,0 +1,55 @@
+"""
+Test log repository query and streaming.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.log import RequestLogCreate, RequestLogQuery
+from app.repositories.sqlalchemy.log_repo import SQLAlchemyLogRepository
+
+
+async def _create_logs(repo: SQLAlchemyLogRepository, count: int) -> None:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        await repo.create(
+            RequestLogCreate(
+                request_time=base + timedelta(minutes=i),
+                api_key_id=1,
+                api_key_name="test-key",
+                requested_model="gpt-4" if i % 2 == 0 else "claude-3",
+                retry_count=0,
+                matched_provider_count=1,
+                response_status=200,
+                trace_id=f"trace-{i}",
+                is_stream=False,
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_iter_query_streams_all_matches_in_order(db_session):
+    repo = SQLAlchemyLogRepository(db_session)
+    await _create_logs(repo, 5)
+
+    query = RequestLogQuery(requested_model="gpt", sort_order="asc", page_size=1)
+    streamed = [log async for log in repo.iter_query(query, paginate=False)]
+
+    assert [log.trace_id for log in streamed] == ["trace-0", "trace-2", "trace-4"]
+    assert all(log.request_time.tzinfo == timezone.utc for log in streamed)
+
+
+@pytest.mark.asyncio
+async def test_query_returns_page_and_total(db_session):
+    repo = SQLAlchemyLogRepository(db_session)
+    await _create_logs(repo, 5)
+
+    items, total = await repo.query(RequestLogQuery(page=2, page_size=2))
+
+    assert total == 5
+    assert [log.trace_id for log in items] == ["trace-2", "trace-1"]
+
+    items, total = await repo.query(RequestLogQuery(page=9, page_size=2))
+    assert items == []
+    assert total == 5
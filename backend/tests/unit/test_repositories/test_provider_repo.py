@@ -0,0 +1,50 @@
+"""
+Test provider repository lookups.
+"""
+
+import pytest
+
+from app.domain.provider import ProviderCreate, ProviderUpdate
+from app.repositories.base import DuplicateError
+from app.repositories.sqlalchemy.provider_repo import SQLAlchemyProviderRepository
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_returns_found_providers_by_id(db_session):
+    repo = SQLAlchemyProviderRepository(db_session)
+    created = [
+        await repo.create(
+            ProviderCreate(
+                name=f"p{i}",
+                base_url="https://example.com",
+                protocol="openai",
+                api_type="chat",
+            )
+        )
+        for i in range(2)
+    ]
+
+    found = await repo.get_by_ids([created[1].id, created[0].id, created[1].id, 999])
+
+    assert found == {provider.id: provider for provider in created}
+    assert await repo.get_by_ids([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_taken_name_raises_duplicate_error(db_session):
+    repo = SQLAlchemyProviderRepository(db_session)
+    first, second = [
+        await repo.create(
+            ProviderCreate(name=name, base_url="https://example.com", protocol="openai")
+        )
+        for name in ("p1", "p2")
+    ]
+
+    with pytest.raises(DuplicateError):
+        await repo.create(
+            ProviderCreate(name="p1", base_url="https://example.com", protocol="openai")
+        )
+    with pytest.raises(DuplicateError):
+        await repo.update(first.id, ProviderUpdate(name="p2"))
+
+    assert (await repo.get_by_id(second.id)).name == "p2"
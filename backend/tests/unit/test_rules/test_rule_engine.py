@@ -3,7 +3,13 @@ Rule Engine Unit Tests
 """
 
 import pytest
+from unittest.mock import patch
+
 from app.rules import RuleContext, TokenUsage, Rule, RuleSet, RuleEvaluator, RuleEngine
+from app.rules.engine import compile_provider_rules
+from app.rules.operators import OPERATORS, op_regex
+from app.rules.path_compiler import build_accessor
+from app.rules.ruleset_compiler import build_matcher
 from app.domain.model import ModelMapping, ModelMappingProviderResponse
 from app.domain.provider import Provider
 from app.common.time import utc_now
@@ -71,6 +77,47 @@ class TestRuleContext:
         assert context.get_value("headers.not-exist") is None
         assert context.get_value("body.not-exist") is None
         assert context.get_value("unknown.field") is None
+    
+    def test_get_value_index_edge_cases(self):
+        """Test out-of-range, negative and malformed array indexes"""
+        context = RuleContext(
+            current_model="gpt-4",
+            request_body={"messages": [{"role": "user"}], "meta": {"tags": "a"}},
+        )
+        assert context.get_value("BODY.messages[0].role") == "user"
+        assert context.get_value("body.messages[1].role") is None
+        assert context.get_value("body.messages[-1].role") is None
+        assert context.get_value("body.messages[x].role") is None
+        assert context.get_value("body.meta.tags[0]") is None
+        assert context.get_value("body.meta") == {"tags": "a"}
+
+
+class TestPathCompiler:
+    """Rule Field Path Compiler Tests"""
+    
+    def test_accessor_is_cached_and_attached_to_rule(self):
+        """Test accessors are built once per path and held by rules"""
+        rule = Rule(field="body.messages[0].role", operator="eq", value="user")
+        assert rule.accessor is build_accessor("body.messages[0].role")
+    
+    def test_accessor_rejects_non_container_values(self):
+        """Test generated accessors keep dict/list type checks"""
+        accessor = build_accessor("body.messages[0].role")
+        
+        def read(messages):
+            return accessor(RuleContext(current_model="m", request_body={"messages": messages}))
+        
+        assert read("abc") is None
+        assert read({0: {"role": "x"}}) is None
+        assert read([{"role": "x"}]) == "x"
+    
+    def test_accessor_keys_are_not_evaluated(self):
+        """Test path keys reach generated code only as string literals"""
+        accessor = build_accessor("body.x') or __import__('os') or ('")
+        context = RuleContext(
+            current_model="m", request_body={"x') or __import__('os') or ('": 1}
+        )
+        assert accessor(context) == 1
 
 
 class TestRuleEvaluator:
@@ -107,6 +154,38 @@ class TestRuleEvaluator:
         rule = Rule(field="body.temperature", operator="gt", value=0.7)
         assert self.evaluator.evaluate_rule(rule, self.context) is False
     
+    def test_comparison_with_incomparable_types_does_not_match(self):
+        """Test ordering operators return False for mismatched types"""
+        for operator in ("gt", "gte", "lt", "lte"):
+            rule = Rule(field="model", operator=operator, value=5)
+            assert self.evaluator.evaluate_rule(rule, self.context) is False
+    
+    def test_string_operands_prepared_once(self):
+        """Test contains/regex operands are stringified and compiled at construction"""
+        rule = Rule(field="model", operator="contains", value=4)
+        assert rule.operand == "4"
+        assert self.evaluator.evaluate_rule(rule, self.context) is True
+        
+        rule = Rule(field="model", operator="regex", value="^gpt")
+        assert rule.operand.pattern == "^gpt"
+        assert self.evaluator.evaluate_rule(rule, self.context) is True
+    
+    def test_regex_operator_invalid_pattern(self):
+        """Test invalid regex patterns never match"""
+        rule = Rule(field="model", operator="regex", value="gpt-[")
+        assert self.evaluator.evaluate_rule(rule, self.context) is False
+    
+    def test_operator_is_case_insensitive(self):
+        """Test operators are normalized to lower case at construction"""
+        rule = Rule(field="model", operator="EQ", value="gpt-4")
+        assert rule.operator == "eq"
+        assert self.evaluator.evaluate_rule(rule, self.context) is True
+    
+    def test_unknown_operator_does_not_match(self):
+        """Test unknown operators never match"""
+        rule = Rule(field="model", operator="startswith", value="gpt")
+        assert self.evaluator.evaluate_rule(rule, self.context) is False
+    
     def test_gte_operator(self):
         """Test greater than or equal operator"""
         rule = Rule(field="body.temperature", operator="gte", value=0.7)
@@ -135,6 +214,20 @@ class TestRuleEvaluator:
         rule = Rule(field="model", operator="in", value=["claude-3"])
         assert self.evaluator.evaluate_rule(rule, self.context) is False
     
+    def test_in_operator_uses_set_for_hashable_values(self):
+        """Test in/not_in match the same with set and list operands"""
+        rule = Rule(field="model", operator="in", value=["gpt-4", "gpt-3.5"])
+        assert rule.operand == frozenset({"gpt-4", "gpt-3.5"})
+        
+        rule = Rule(field="body", operator="in", value=["gpt-4"])
+        assert self.evaluator.evaluate_rule(rule, self.context) is False
+        rule = Rule(field="body", operator="not_in", value=["gpt-4"])
+        assert self.evaluator.evaluate_rule(rule, self.context) is True
+        
+        rule = Rule(field="model", operator="in", value=[["gpt-4"], "gpt-4"])
+        assert isinstance(rule.operand, list)
+        assert self.evaluator.evaluate_rule(rule, self.context) is True
+    
     def test_exists_operator(self):
         """Test exists operator"""
         rule = Rule(field="headers.x-priority", operator="exists", value=True)
@@ -168,6 +261,80 @@ class TestRuleEvaluator:
         )
         assert self.evaluator.evaluate_ruleset(ruleset, self.context) is False
     
+    def test_evaluate_ruleset_short_circuits_cheapest_first(self):
+        """Test rule sets evaluate cheap operators first and stop at the deciding rule"""
+        regex_calls = []
+        
+        def tracking_regex(actual, expected):
+            regex_calls.append(actual)
+            return op_regex(actual, expected)
+        
+        build_matcher.cache_clear()
+        try:
+            with patch.dict(OPERATORS, {"regex": tracking_regex}):
+                regex_rule = Rule(field="model", operator="regex", value="gpt")
+                eq_rule = Rule(field="model", operator="eq", value="claude")
+                ruleset = RuleSet(rules=[regex_rule, eq_rule], logic="AND")
+        finally:
+            build_matcher.cache_clear()
+        
+        assert ruleset.evaluation_order == (eq_rule, regex_rule)
+        assert self.evaluator.evaluate_ruleset(ruleset, self.context) is False
+        assert regex_calls == []
+        
+        eq_rule = Rule(field="model", operator="eq", value="gpt-4")
+        matching = RuleSet(rules=[regex_rule, eq_rule], logic="AND")
+        assert self.evaluator.evaluate_ruleset(matching, self.context) is True
+    
+    def test_compiled_ruleset_shared_across_values(self):
+        """Test rule sets differing only in values share one compiled matcher"""
+        first = RuleSet(rules=[Rule(field="model", operator="eq", value="gpt-4")])
+        second = RuleSet(rules=[Rule(field="model", operator="eq", value="gpt-3.5")])
+        assert first.matcher is second.matcher
+        assert self.evaluator.evaluate_ruleset(first, self.context) is True
+        assert self.evaluator.evaluate_ruleset(second, self.context) is False
+    
+    def test_compiled_ruleset_resolves_repeated_field_once(self):
+        """Test a field read by several rules is resolved once per evaluation"""
+        reads = []
+        
+        class CountingBody(dict):
+            def __getitem__(self, key):
+                reads.append(key)
+                return super().__getitem__(key)
+        
+        context = RuleContext(current_model="gpt-4", request_body=CountingBody(temperature=0.7))
+        in_range = RuleSet(
+            rules=[
+                Rule(field="body.temperature", operator="gte", value=0.5),
+                Rule(field="body.temperature", operator="lte", value=1.0),
+            ],
+            logic="AND",
+        )
+        assert self.evaluator.evaluate_ruleset(in_range, context) is True
+        assert reads == ["temperature"]
+        
+        reads.clear()
+        out_of_range = RuleSet(
+            rules=[
+                Rule(field="body.temperature", operator="startswith", value="0"),
+                Rule(field="body.temperature", operator="gt", value=1.0),
+                Rule(field="body.temperature", operator="lt", value=0.0),
+            ],
+            logic="OR",
+        )
+        assert self.evaluator.evaluate_ruleset(out_of_range, context) is False
+        assert reads == ["temperature"]
+    
+    def test_evaluate_ruleset_unknown_operator(self):
+        """Test unknown operators fail AND sets but not OR sets"""
+        rules = [
+            Rule(field="model", operator="startswith", value="gpt"),
+            Rule(field="model", operator="eq", value="gpt-4"),
+        ]
+        assert self.evaluator.evaluate_ruleset(RuleSet(rules=rules, logic="AND"), self.context) is False
+        assert self.evaluator.evaluate_ruleset(RuleSet(rules=rules, logic="OR"), self.context) is True
+    
     def test_evaluate_ruleset_or(self):
         """Test rule set OR logic"""
         ruleset = RuleSet(
@@ -651,3 +818,27 @@ class TestRuleEngine:
         # Only OpenAI should be returned
         assert len(candidates) == 1
         assert candidates[0].provider_name == "OpenAI"
+
+    def test_evaluate_uses_precompiled_rule_sets(self):
+        """Test that precompiled rule sets are used instead of recompiling provider_rules"""
+        context = RuleContext(current_model="gpt-4")
+        self.provider_mappings[0].provider_rules = {
+            "rules": [{"field": "model", "operator": "eq", "value": "gpt-4"}]
+        }
+        rule_sets = compile_provider_rules(self.provider_mappings)
+        assert rule_sets[self.provider_mappings[1].id] is None
+
+        # Later edits to the mapping do not affect the compiled rules
+        self.provider_mappings[0].provider_rules = {
+            "rules": [{"field": "model", "operator": "eq", "value": "other"}]
+        }
+        with patch.object(RuleSet, "from_dict", side_effect=AssertionError("recompiled")):
+            candidates = self.engine.evaluate_sync(
+                context=context,
+                model_mapping=self.model_mapping,
+                provider_mappings=self.provider_mappings,
+                providers=self.providers,
+                rule_sets=rule_sets,
+            )
+
+        assert [c.provider_name for c in candidates] == ["OpenAI", "Azure"]
@@ -0,0 +1,55 @@
+"""
+Test scheduled task loops.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app import scheduler
+
+
+def test_seconds_until_hour_rolls_over_to_next_day():
+    now = datetime(2024, 1, 1, 3, 30, tzinfo=timezone.utc)
+
+    assert scheduler._seconds_until_hour(4, now) == 30 * 60
+    assert scheduler._seconds_until_hour(3, now) == 23.5 * 3600
+    assert scheduler._seconds_until_hour(3, now.replace(minute=0)) == 24 * 3600
+
+
+@pytest.mark.asyncio
+async def test_run_every_runs_until_stopped_and_survives_failures():
+    stop = asyncio.Event()
+    calls = 0
+
+    async def job():
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            stop.set()
+        raise RuntimeError("boom")
+
+    await asyncio.wait_for(scheduler._run_every(stop, "job", 0.001, job), timeout=1)
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_run_daily_schedules_in_server_local_time(monkeypatch):
+    stop = asyncio.Event()
+    seen: list[datetime] = []
+
+    def seconds_until_hour(hour, now):
+        seen.append(now)
+        stop.set()
+        return 60
+
+    monkeypatch.setattr(scheduler, "_seconds_until_hour", seconds_until_hour)
+
+    async def job():
+        pass
+
+    await asyncio.wait_for(scheduler._run_daily(stop, "job", 4, job), timeout=1)
+
+    assert seen[0].utcoffset() == datetime.now().astimezone().utcoffset()
@@ -5,15 +5,26 @@ ApiKeyService.authenticate unit tests
 from datetime import timezone
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.common.time import utc_now
+from app.config import get_settings
 from app.domain.api_key import ApiKeyCreate
 from app.repositories.sqlalchemy.api_key_repo import SQLAlchemyApiKeyRepository
+from app.services import api_key_usage
 from app.services.api_key_service import ApiKeyService
 
 
+@pytest.fixture
+def direct_last_used_writes(monkeypatch):
+    monkeypatch.setenv("API_KEY_LAST_USED_FLUSH_SECONDS", "0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.mark.asyncio
-async def test_authenticate_updates_last_used_at(db_session):
+async def test_authenticate_updates_last_used_at(db_session, direct_last_used_writes):
     repo = SQLAlchemyApiKeyRepository(db_session)
     service = ApiKeyService(repo)
 
@@ -29,3 +40,40 @@ async def test_authenticate_updates_last_used_at(db_session):
     assert updated.last_used_at is not None
     assert updated.last_used_at.tzinfo == timezone.utc
     assert before <= updated.last_used_at <= after
+
+
+@pytest.mark.asyncio
+async def test_authenticate_batches_last_used_until_flush(db_session, async_engine, monkeypatch):
+    monkeypatch.setattr(api_key_usage, "_pending", {})
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    service = ApiKeyService(repo)
+    created = await repo.create(ApiKeyCreate(key_name="test-key"), key_value="sk-test")
+
+    await service.authenticate("Bearer sk-test")
+    await service.authenticate("Bearer sk-test")
+    # A key deleted before the flush must not fail the batch
+    api_key_usage.record_last_used(created.id + 100, utc_now())
+
+    assert (await repo.get_by_id(created.id)).last_used_at is None
+    assert len(api_key_usage._pending) == 2
+
+    session_factory = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    assert await api_key_usage.flush_last_used(session_factory) == 2
+    assert api_key_usage._pending == {}
+
+    db_session.expire_all()
+    assert (await repo.get_by_id(created.id)).last_used_at is not None
+
+
+@pytest.mark.asyncio
+async def test_authenticate_strips_bearer_prefix_case_insensitively(
+    db_session, direct_last_used_writes
+):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    service = ApiKeyService(repo)
+    created = await repo.create(ApiKeyCreate(key_name="test-key"), key_value="sk-test")
+
+    for header in ("BEARER sk-test", "bearer sk-test", "sk-test"):
+        assert (await service.authenticate(header)).id == created.id
@@ -0,0 +1,51 @@
+"""
+ApiKeyService create/update/delete unit tests
+"""
+
+import pytest
+
+from app.common.errors import ConflictError, NotFoundError
+from app.domain.api_key import ApiKeyCreate, ApiKeyUpdate
+from app.repositories.sqlalchemy.api_key_repo import SQLAlchemyApiKeyRepository
+from app.services.api_key_service import ApiKeyService
+
+
+@pytest.mark.asyncio
+async def test_update_checks_name_conflict_against_other_keys(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    service = ApiKeyService(repo)
+    first = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+    await repo.create(ApiKeyCreate(key_name="k2"), "lgw-value-2")
+
+    # Keeping its own name is not a conflict
+    updated = await service.update(first.id, ApiKeyUpdate(key_name="k1", is_active=False))
+    assert updated.is_active is False
+
+    with pytest.raises(ConflictError):
+        await service.update(first.id, ApiKeyUpdate(key_name="k2"))
+
+
+@pytest.mark.asyncio
+async def test_create_rejects_taken_name(db_session):
+    service = ApiKeyService(SQLAlchemyApiKeyRepository(db_session))
+    await service.create(ApiKeyCreate(key_name="k1"))
+
+    with pytest.raises(ConflictError):
+        await service.create(ApiKeyCreate(key_name="k1"))
+
+    # The failed insert leaves the session usable
+    created = await service.create(ApiKeyCreate(key_name="k2"))
+    assert created.key_name == "k2"
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_report_missing_key(db_session):
+    repo = SQLAlchemyApiKeyRepository(db_session)
+    service = ApiKeyService(repo)
+    created = await repo.create(ApiKeyCreate(key_name="k1"), "lgw-value-1")
+
+    await service.delete(created.id)
+    with pytest.raises(NotFoundError):
+        await service.update(created.id, ApiKeyUpdate(is_active=False))
+    with pytest.raises(NotFoundError):
+        await service.delete(created.id)
@@ -0,0 +1,94 @@
+"""
+Circuit Breaker Unit Tests
+"""
+
+import pytest
+
+from app.config import get_settings
+from app.providers.base import ProviderResponse
+from app.rules.models import CandidateProvider
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.services.retry_handler import RetryHandler
+from app.services.strategy import PriorityStrategy
+
+
+def _candidate(provider_id: int) -> CandidateProvider:
+    return CandidateProvider(
+        provider_id=provider_id,
+        provider_name=f"Provider{provider_id}",
+        base_url=f"https://api{provider_id}.com",
+        protocol="openai",
+        api_key=f"key{provider_id}",
+        target_model="model",
+        priority=provider_id,
+    )
+
+
+def test_opens_after_consecutive_server_errors_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30)
+    first, second = _candidate(1), _candidate(2)
+
+    breaker.record(1, ProviderResponse(status_code=500))
+    breaker.record(1, ProviderResponse(status_code=400))  # client errors do not count
+    assert breaker.filter([first, second]) == [first, second]
+
+    breaker.record(1, ProviderResponse(status_code=502))
+    assert breaker.filter([first, second]) == [second]
+    # With every circuit open the candidates are used anyway
+    assert breaker.filter([first]) == [first]
+
+    # After the cooldown one more failure reopens it at once, a success closes it
+    now[0] += 30
+    assert breaker.allow(1)
+    breaker.record(1, ProviderResponse(status_code=503))
+    assert not breaker.allow(1)
+    now[0] += 30
+    breaker.record(1, ProviderResponse(status_code=200))
+    breaker.record(1, ProviderResponse(status_code=500))
+    assert breaker.allow(1)
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("CIRCUIT_BREAKER_THRESHOLD", raising=False)
+    get_settings.cache_clear()
+    try:
+        assert get_circuit_breaker() is None
+        assert RetryHandler(PriorityStrategy()).circuit_breaker is None
+
+        monkeypatch.setenv("CIRCUIT_BREAKER_THRESHOLD", "5")
+        get_settings.cache_clear()
+        breaker = get_circuit_breaker()
+        assert breaker is not None
+        assert breaker.failure_threshold == 5
+    finally:
+        get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_retry_handler_skips_provider_with_open_circuit():
+    handler = RetryHandler(PriorityStrategy())
+    handler.max_retries = 2
+    handler.retry_delay_ms = 0
+    handler.retry_jitter_ms = 0
+    handler.circuit_breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+    candidates = [_candidate(1), _candidate(2)]
+    calls: list[int] = []
+
+    async def forward_fn(candidate):
+        calls.append(candidate.provider_id)
+        if candidate.provider_id == 1:
+            return ProviderResponse(status_code=500)
+        return ProviderResponse(status_code=200)
+
+    first = await handler.execute_with_retry(candidates, "test", forward_fn)
+    assert first.success is True
+    assert calls == [1, 1, 2]
+
+    calls.clear()
+    second = await handler.execute_with_retry(candidates, "test", forward_fn)
+    assert second.success is True
+    assert second.retry_count == 0
+    assert calls == [2]
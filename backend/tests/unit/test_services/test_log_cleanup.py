@@ -4,8 +4,14 @@ Test Log Cleanup Functionality
 
 import pytest
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy import func, select
+
+from app.db.models import RequestLog
 
 from app.domain.log import RequestLogCreate
+from app.repositories.sqlalchemy import log_repo as log_repo_module
 from app.repositories.sqlalchemy.log_repo import SQLAlchemyLogRepository
 from app.services.log_service import LogService
 
@@ -163,4 +169,34 @@ async def test_cleanup_old_logs_service(db_session):
     deleted_count = await service.cleanup_old_logs(7)
 
     # Verify only old log deleted
-    assert deleted_count == 1
\ No newline at end of file
+    assert deleted_count == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_older_than_days_in_batches(db_session):
+    """Test cleanup keeps deleting batches until no old logs remain"""
+    repo = SQLAlchemyLogRepository(db_session)
+
+    old_time = datetime.now(timezone.utc) - timedelta(days=10)
+    recent_time = datetime.now(timezone.utc) - timedelta(days=3)
+    for i, request_time in enumerate([old_time] * 5 + [recent_time]):
+        await repo.create(
+            RequestLogCreate(
+                request_time=request_time,
+                requested_model="gpt-4",
+                retry_count=0,
+                matched_provider_count=1,
+                response_status=200,
+                trace_id=f"trace-{i}",
+                is_stream=False,
+            )
+        )
+
+    with patch.object(log_repo_module, "_CLEANUP_BATCH_SIZE", 2), patch.object(
+        log_repo_module, "_CLEANUP_BATCH_PAUSE_SECONDS", 0
+    ):
+        deleted_count = await repo.cleanup_old_logs(7)
+
+    assert deleted_count == 5
+    remaining = await db_session.scalar(select(func.count()).select_from(RequestLog))
+    assert remaining == 1
@@ -0,0 +1,71 @@
+"""
+Test batched request log writes.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.db.models import RequestLog
+from app.domain.log import RequestLogCreate
+from app.services import log_writer
+
+
+def _log(trace_id: str) -> RequestLogCreate:
+    return RequestLogCreate(
+        request_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        requested_model="gpt-4",
+        retry_count=0,
+        matched_provider_count=1,
+        response_status=200,
+        trace_id=trace_id,
+        is_stream=False,
+    )
+
+
+@pytest.fixture
+def batch_settings(monkeypatch):
+    monkeypatch.setenv("LOG_WRITE_BATCH_MS", "20")
+    monkeypatch.setenv("LOG_WRITE_BATCH_SIZE", "3")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_flush_logs_inserts_buffered_batch(async_engine, batch_settings):
+    session_factory = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    log_writer.enqueue_log(_log("trace-1"))
+    log_writer.enqueue_log(_log("trace-2"))
+
+    assert await log_writer.flush_logs(session_factory) == 2
+    assert await log_writer.flush_logs(session_factory) == 0
+
+    async with session_factory() as session:
+        traces = (await session.scalars(select(RequestLog.trace_id))).all()
+        assert sorted(traces) == ["trace-1", "trace-2"]
+        assert await session.scalar(select(func.count()).select_from(RequestLog)) == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_flushes_on_batch_size_or_window(batch_settings):
+    # Stand-in for the real flush: take the batch without writing it
+    flush = AsyncMock(side_effect=lambda: log_writer._pending.clear())
+    with patch.object(log_writer, "flush_logs", flush):
+        for i in range(3):
+            log_writer.enqueue_log(_log(f"trace-{i}"))
+        await asyncio.sleep(0)
+        assert flush.await_count == 1
+
+        log_writer.enqueue_log(_log("trace-late"))
+        await asyncio.sleep(0)
+        assert flush.await_count == 1
+        await asyncio.sleep(0.05)
+        assert flush.await_count == 2
@@ -2,8 +2,15 @@
 ModelService provider mapping unit tests
 """
 
+from unittest.mock import patch
+
 import pytest
-from app.domain.model import ModelMappingCreate, ModelMappingProviderCreate
+from app.common.errors import NotFoundError
+from app.domain.model import (
+    ModelMappingCreate,
+    ModelMappingProviderCreate,
+    ModelMappingUpdate,
+)
 from app.domain.provider import ProviderCreate
 from app.repositories.sqlalchemy.model_repo import SQLAlchemyModelRepository
 from app.repositories.sqlalchemy.provider_repo import SQLAlchemyProviderRepository
@@ -51,3 +58,94 @@ async def test_create_provider_mapping_allows_duplicates(db_session):
     assert created_second.requested_model == "gpt-4o-mini"
     assert created_second.provider_id == provider.id
     assert created_second.provider_name == "p1"
+
+
+@pytest.mark.asyncio
+async def test_get_all_mappings_counts_providers_in_one_query(db_session):
+    model_repo = SQLAlchemyModelRepository(db_session)
+    provider_repo = SQLAlchemyProviderRepository(db_session)
+    service = ModelService(model_repo, provider_repo)
+
+    provider = await provider_repo.create(
+        ProviderCreate(
+            name="p1",
+            base_url="https://example.com",
+            protocol="openai",
+            api_type="chat",
+        )
+    )
+    for name, provider_count in (("model-a", 2), ("model-b", 0), ("model-c", 1)):
+        await model_repo.create_mapping(ModelMappingCreate(requested_model=name))
+        for _ in range(provider_count):
+            await model_repo.add_provider_mapping(
+                ModelMappingProviderCreate(
+                    requested_model=name,
+                    provider_id=provider.id,
+                    target_model_name=name,
+                    input_price=0.0,
+                    output_price=0.0,
+                )
+            )
+
+    with patch.object(
+        model_repo, "get_provider_count", side_effect=AssertionError
+    ):
+        items, total = await service.get_all_mappings()
+
+    assert total == 3
+    assert {item.requested_model: item.provider_count for item in items} == {
+        "model-a": 2,
+        "model-b": 0,
+        "model-c": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_mapping_report_missing_model(db_session):
+    model_repo = SQLAlchemyModelRepository(db_session)
+    service = ModelService(model_repo, SQLAlchemyProviderRepository(db_session))
+    created = await model_repo.create_mapping(ModelMappingCreate(requested_model="gpt-4o"))
+
+    updated = await service.update_mapping("gpt-4o", ModelMappingUpdate(is_active=False))
+    assert updated.is_active is False
+    assert updated.strategy == created.strategy
+    assert updated.updated_at >= created.updated_at
+
+    await service.delete_mapping("gpt-4o")
+    with pytest.raises(NotFoundError):
+        await service.update_mapping("gpt-4o", ModelMappingUpdate(is_active=True))
+    with pytest.raises(NotFoundError):
+        await service.delete_mapping("gpt-4o")
+
+
+@pytest.mark.asyncio
+async def test_create_provider_mapping_requires_model_and_provider(db_session):
+    model_repo = SQLAlchemyModelRepository(db_session)
+    provider_repo = SQLAlchemyProviderRepository(db_session)
+    service = ModelService(model_repo, provider_repo)
+    provider = await provider_repo.create(
+        ProviderCreate(
+            name="p1",
+            base_url="https://example.com",
+            protocol="openai",
+            api_type="chat",
+        )
+    )
+
+    def mapping(requested_model: str, provider_id: int) -> ModelMappingProviderCreate:
+        return ModelMappingProviderCreate(
+            requested_model=requested_model,
+            provider_id=provider_id,
+            target_model_name=requested_model,
+            input_price=0.0,
+            output_price=0.0,
+        )
+
+    with pytest.raises(NotFoundError) as exc_info:
+        await service.create_provider_mapping(mapping("missing", provider.id))
+    assert exc_info.value.code == "model_not_found"
+
+    await model_repo.create_mapping(ModelMappingCreate(requested_model="gpt-4o"))
+    with pytest.raises(NotFoundError) as exc_info:
+        await service.create_provider_mapping(mapping("gpt-4o", provider.id + 100))
+    assert exc_info.value.code == "provider_not_found"
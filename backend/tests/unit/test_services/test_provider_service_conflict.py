@@ -0,0 +1,41 @@
+"""
+ProviderService name conflict unit tests
+"""
+
+import pytest
+
+from app.common.errors import ConflictError, NotFoundError
+from app.domain.provider import ProviderCreate, ProviderUpdate
+from app.repositories.sqlalchemy.provider_repo import SQLAlchemyProviderRepository
+from app.services.provider_service import ProviderService
+
+
+def _provider(name: str) -> ProviderCreate:
+    return ProviderCreate(
+        name=name, base_url="http://upstream", protocol="openai", api_key="sk-test"
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_reject_taken_names(db_session):
+    service = ProviderService(SQLAlchemyProviderRepository(db_session))
+    first = await service.create(_provider("p1"))
+    await service.create(_provider("p2"))
+
+    with pytest.raises(ConflictError):
+        await service.create(_provider("p1"))
+    with pytest.raises(ConflictError):
+        await service.update(first.id, ProviderUpdate(name="p2"))
+
+    # The session stays usable and keeping its own name is not a conflict
+    updated = await service.update(first.id, ProviderUpdate(name="p1", is_active=False))
+    assert updated.is_active is False
+    assert (await service.get_by_id(first.id)).name == "p1"
+
+
+@pytest.mark.asyncio
+async def test_update_reports_missing_provider(db_session):
+    service = ProviderService(SQLAlchemyProviderRepository(db_session))
+
+    with pytest.raises(NotFoundError):
+        await service.update(999, ProviderUpdate(is_active=False))
@@ -3,12 +3,21 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.common.time import utc_now
+from app.config import get_settings
 from app.domain.model import ModelMapping
 from app.providers.base import ProviderResponse
 from app.rules.models import CandidateProvider
 from app.services.proxy_service import ProxyService
 
 
+@pytest.fixture(autouse=True)
+def direct_log_writes(monkeypatch):
+    monkeypatch.setenv("LOG_WRITE_BATCH_MS", "0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.mark.asyncio
 async def test_process_request_sanitizes_multipart_body_and_binary_response():
     now = utc_now()
@@ -27,8 +27,8 @@ class FakeProviderRepo:
     def __init__(self, providers: dict[int, Provider]):
         self._providers = providers
 
-    async def get_by_id(self, provider_id: int):
-        return self._providers.get(provider_id)
+    async def get_by_ids(self, provider_ids: list[int]):
+        return {pid: self._providers[pid] for pid in provider_ids if pid in self._providers}
 
 
 @pytest.mark.asyncio
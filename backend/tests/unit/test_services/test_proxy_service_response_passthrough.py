@@ -3,12 +3,21 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.config import get_settings
 from app.domain.model import ModelMapping
 from app.providers.base import ProviderResponse
 from app.rules.models import CandidateProvider
 from app.services.proxy_service import ProxyService
 
 
+@pytest.fixture(autouse=True)
+def direct_log_writes(monkeypatch):
+    monkeypatch.setenv("LOG_WRITE_BATCH_MS", "0")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.mark.asyncio
 async def test_process_request_same_protocol_response_body_passthrough_bytes():
     now = utc_now()
@@ -75,3 +84,128 @@ async def test_process_request_same_protocol_response_body_passthrough_bytes():
 
     log_data = service.log_repo.create.await_args.args[0]
     assert log_data.output_tokens == 12
+    assert log_data.response_body == '{"id":"raw","usage":{"completion_tokens":12}}'
+    assert log_data.upstream_response_body == log_data.response_body
+
+
+@pytest.mark.asyncio
+async def test_process_request_defer_log_leaves_write_to_caller():
+    now = utc_now()
+    model_mapping = ModelMapping(
+        requested_model="test-model",
+        strategy="round_robin",
+        matching_rules=None,
+        capabilities=None,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    candidate = CandidateProvider(
+        provider_id=1,
+        provider_name="p-openai",
+        base_url="https://example.com",
+        protocol="openai",
+        api_key="sk-test",
+        target_model="gpt-4o-mini",
+        priority=0,
+        weight=1,
+    )
+
+    service = ProxyService(
+        model_repo=AsyncMock(),
+        provider_repo=AsyncMock(),
+        log_repo=AsyncMock(),
+    )
+    service._resolve_candidates = AsyncMock(return_value=(model_mapping, [candidate], 0, "openai", {}))  # type: ignore[method-assign]
+
+    fake_client = AsyncMock()
+    fake_client.forward = AsyncMock(
+        return_value=ProviderResponse(
+            status_code=200,
+            headers={"content-type": "application/json"},
+            body=b'{"id":"raw","usage":{"completion_tokens":3}}',
+        )
+    )
+
+    with patch("app.services.proxy_service.get_provider_client", return_value=fake_client):
+        response, log_info = await service.process_request(
+            api_key_id=1,
+            api_key_name="k",
+            request_protocol="openai",
+            path="/v1/chat/completions",
+            method="POST",
+            headers={},
+            body={"model": "test-model", "messages": []},
+            defer_log=True,
+        )
+
+    assert response.status_code == 200
+    service.log_repo.create.assert_not_awaited()
+
+    await log_info.pending_log()
+
+    log_data = service.log_repo.create.await_args.args[0]
+    assert log_data.output_tokens == 3
+    assert log_data.trace_id == log_info.trace_id
+
+
+@pytest.mark.asyncio
+async def test_process_request_without_log_bodies_keeps_usage_only(monkeypatch):
+    monkeypatch.setenv("LOG_BODIES", "false")
+    get_settings.cache_clear()
+    now = utc_now()
+    model_mapping = ModelMapping(
+        requested_model="test-model",
+        strategy="round_robin",
+        matching_rules=None,
+        capabilities=None,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    candidate = CandidateProvider(
+        provider_id=1,
+        provider_name="p-openai",
+        base_url="https://example.com",
+        protocol="openai",
+        api_key="sk-test",
+        target_model="gpt-4o-mini",
+        priority=0,
+        weight=1,
+    )
+
+    service = ProxyService(
+        model_repo=AsyncMock(),
+        provider_repo=AsyncMock(),
+        log_repo=AsyncMock(),
+    )
+    service._resolve_candidates = AsyncMock(return_value=(model_mapping, [candidate], 0, "openai", {}))  # type: ignore[method-assign]
+
+    fake_client = AsyncMock()
+    fake_client.forward = AsyncMock(
+        return_value=ProviderResponse(
+            status_code=200,
+            headers={"content-type": "application/json"},
+            body=b'{"id":"raw","usage":{"completion_tokens":12}}',
+        )
+    )
+
+    with patch("app.services.proxy_service.get_provider_client", return_value=fake_client):
+        response, _ = await service.process_request(
+            api_key_id=1,
+            api_key_name="k",
+            request_protocol="openai",
+            path="/v1/chat/completions",
+            method="POST",
+            headers={"authorization": "Bearer sk-client-secret"},
+            body={"model": "test-model", "messages": []},
+        )
+
+    assert response.body == b'{"id":"raw","usage":{"completion_tokens":12}}'
+    log_data = service.log_repo.create.await_args.args[0]
+    assert log_data.output_tokens == 12
+    assert log_data.request_headers["authorization"] != "Bearer sk-client-secret"
+    assert log_data.request_body is None
+    assert log_data.response_body is None
+    assert log_data.upstream_response_body is None
+    assert log_data.converted_request_body is None
@@ -0,0 +1,60 @@
+"""
+ProxyService routing cache unit tests
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.model import (
+    ModelMappingCreate,
+    ModelMappingProviderCreate,
+    ModelMappingUpdate,
+)
+from app.domain.provider import ProviderCreate, ProviderUpdate
+from app.repositories.sqlalchemy.model_repo import SQLAlchemyModelRepository
+from app.repositories.sqlalchemy.provider_repo import SQLAlchemyProviderRepository
+from app.services.proxy_service import ProxyService
+
+
+@pytest.mark.asyncio
+async def test_load_routing_is_cached_until_model_or_provider_write(db_session):
+    model_repo = SQLAlchemyModelRepository(db_session)
+    provider_repo = SQLAlchemyProviderRepository(db_session)
+    service = ProxyService(model_repo, provider_repo, log_repo=AsyncMock())
+
+    provider = await provider_repo.create(
+        ProviderCreate(
+            name="p1",
+            base_url="https://example.com",
+            protocol="openai",
+            api_type="chat",
+        )
+    )
+    await model_repo.create_mapping(ModelMappingCreate(requested_model="gpt-4o"))
+    await model_repo.add_provider_mapping(
+        ModelMappingProviderCreate(
+            requested_model="gpt-4o",
+            provider_id=provider.id,
+            target_model_name="gpt-4o",
+            input_price=0.0,
+            output_price=0.0,
+        )
+    )
+
+    first = await service._load_routing("gpt-4o")
+    assert [pm.provider_id for pm in first.provider_mappings] == [provider.id]
+    assert first.providers == {provider.id: provider}
+
+    with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+        assert await service._load_routing("gpt-4o") is first
+        execute.assert_not_called()
+
+    await provider_repo.update(provider.id, ProviderUpdate(name="p1-renamed"))
+    renamed = await service._load_routing("gpt-4o")
+    assert renamed.providers[provider.id].name == "p1-renamed"
+
+    await model_repo.update_mapping("gpt-4o", ModelMappingUpdate(is_active=False))
+    disabled = await service._load_routing("gpt-4o")
+    assert disabled.model_mapping.is_active is False
+    assert disabled.provider_mappings == []
@@ -44,7 +44,7 @@ def test_smart_truncate_nested():
 def test_serialize_response_body_json_bytes():
     body = b'{"key": "value"}'
     serialized = ProxyService._serialize_response_body(body)
-    assert serialized == '{"key": "value"}'
+    assert serialized == '{"key":"value"}'
 
 def test_serialize_response_body_huge_json_bytes():
     # Create a huge JSON
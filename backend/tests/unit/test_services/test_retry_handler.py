@@ -2,10 +2,17 @@
 Retry Handler Unit Tests
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock
 from app.services.retry_handler import RetryHandler
-from app.services.strategy import RoundRobinStrategy
+from app.services.strategy import (
+    CostFirstStrategy,
+    ModelAffinityStrategy,
+    PriorityStrategy,
+    RoundRobinStrategy,
+)
 from app.providers.base import ProviderResponse
 from app.rules.models import CandidateProvider
 
@@ -19,6 +26,7 @@ class TestRetryHandler:
         self.handler = RetryHandler(self.strategy)
         self.handler.max_retries = 3
         self.handler.retry_delay_ms = 10  # Speed up test
+        self.handler.retry_jitter_ms = 0
         
         self.candidates = [
             CandidateProvider(
@@ -41,6 +49,16 @@ class TestRetryHandler:
             ),
         ]
     
+    def test_retry_delay_backs_off_with_bounded_jitter(self):
+        """Test retry delays grow by the backoff base and add at most the jitter"""
+        self.handler.retry_delay_ms = 100
+        self.handler.retry_backoff_base = 2.0
+        assert [self.handler._retry_delay(n) for n in (1, 2, 3)] == [0.1, 0.2, 0.4]
+        
+        self.handler.retry_jitter_ms = 50
+        delays = [self.handler._retry_delay(2) for _ in range(20)]
+        assert all(0.2 <= d <= 0.25 for d in delays)
+    
     @pytest.mark.asyncio
     async def test_success_on_first_try(self):
         """Test success on first attempt"""
@@ -105,6 +123,43 @@ class TestRetryHandler:
         # Switch to second provider immediately after first failure
         assert provider_calls == [1, 2]
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "strategy_cls",
+        [RoundRobinStrategy, PriorityStrategy, CostFirstStrategy, ModelAffinityStrategy],
+    )
+    async def test_failover_tries_every_provider(self, strategy_cls):
+        """Failover reaches every candidate, not just the first two"""
+        handler = RetryHandler(strategy_cls())
+        handler.max_retries = 3
+        handler.retry_delay_ms = 10
+        handler.retry_jitter_ms = 0
+        candidates = self.candidates + [
+            CandidateProvider(
+                provider_id=3,
+                provider_name="Provider3",
+                base_url="https://api3.com",
+                protocol="openai",
+                api_key="key3",
+                target_model="model3",
+                priority=3,
+            ),
+        ]
+        provider_calls = []
+
+        async def forward_fn(candidate):
+            provider_calls.append(candidate.provider_id)
+            return ProviderResponse(status_code=400, error="Bad request")
+
+        result = await handler.execute_with_retry(
+            candidates=candidates,
+            requested_model="test",
+            forward_fn=forward_fn,
+        )
+
+        assert result.success is False
+        assert sorted(provider_calls) == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_max_retries_then_switch(self):
         """Test switch provider after max retries"""
@@ -157,4 +212,160 @@ class TestRetryHandler:
         )
         
         assert result.success is False
-        assert result.response.status_code == 503
\ No newline at end of file
+        assert result.response.status_code == 503
+    @pytest.mark.asyncio
+    async def test_hedge_returns_faster_provider_and_cancels_slow_one(self):
+        """Test hedged request wins on the backup provider when the first is slow"""
+        self.strategy.reset()
+        self.handler.hedge_delay_ms = 10
+        cancelled: list[int] = []
+
+        async def forward_fn(candidate):
+            if candidate.provider_id == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append(candidate.provider_id)
+                    raise
+                return ProviderResponse(status_code=200, body={"from": 1})
+            return ProviderResponse(status_code=200, body={"from": 2})
+
+        result = await self.handler.execute_with_retry(
+            candidates=self.candidates,
+            requested_model="test",
+            forward_fn=forward_fn,
+            hedge=True,
+        )
+        await asyncio.sleep(0)
+
+        assert result.success is True
+        assert result.final_provider.provider_id == 2
+        assert result.response.body == {"from": 2}
+        assert cancelled == [1]
+
+    @pytest.mark.asyncio
+    async def test_hedge_not_started_when_first_attempt_is_fast(self):
+        """Test no hedged request is sent when the first attempt completes in time"""
+        self.strategy.reset()
+        self.handler.hedge_delay_ms = 1000
+        called: list[int] = []
+
+        async def forward_fn(candidate):
+            called.append(candidate.provider_id)
+            return ProviderResponse(status_code=200, body={"result": "ok"})
+
+        result = await self.handler.execute_with_retry(
+            candidates=self.candidates,
+            requested_model="test",
+            forward_fn=forward_fn,
+            hedge=True,
+        )
+
+        assert result.success is True
+        assert called == [1]
+        assert len(result.attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_failover_starts_next_provider_on_failure(self):
+        """Test parallel mode starts the next provider once the first has used up its retries"""
+        self.strategy.reset()
+        self.handler.failover_mode = "parallel"
+        self.handler.hedge_delay_ms = 10_000
+        on_failure = AsyncMock()
+
+        async def forward_fn(candidate):
+            if candidate.provider_id == 1:
+                return ProviderResponse(status_code=500, error="boom")
+            return ProviderResponse(status_code=200, body={"from": 2})
+
+        result = await asyncio.wait_for(
+            self.handler.execute_with_retry(
+                candidates=self.candidates,
+                requested_model="test",
+                forward_fn=forward_fn,
+                on_failure_attempt=on_failure,
+                hedge=True,
+            ),
+            timeout=1,
+        )
+
+        assert result.success is True
+        assert result.final_provider.provider_id == 2
+        assert result.retry_count == 3
+        assert [a.provider.provider_id for a in result.attempts] == [1, 1, 1, 2]
+        assert on_failure.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_parallel_failover_requires_hedge_route_and_stagger(self):
+        """Test parallel mode falls back to sequential failover unless the route allows hedging"""
+        self.handler.failover_mode = "parallel"
+        called: list[int] = []
+
+        async def forward_fn(candidate):
+            called.append(candidate.provider_id)
+            await asyncio.sleep(0.05)
+            return ProviderResponse(status_code=200, body={"from": candidate.provider_id})
+
+        for hedge, hedge_delay_ms in ((False, 10), (True, 0)):
+            self.strategy.reset()
+            called.clear()
+            self.handler.hedge_delay_ms = hedge_delay_ms
+            result = await self.handler.execute_with_retry(
+                candidates=self.candidates,
+                requested_model="test",
+                forward_fn=forward_fn,
+                hedge=hedge,
+            )
+
+            assert result.success is True
+            assert called == [1]
+
+    @pytest.mark.asyncio
+    async def test_parallel_failover_cancels_slow_provider(self):
+        """Test parallel mode keeps the first success and cancels the rest"""
+        self.strategy.reset()
+        self.handler.failover_mode = "parallel"
+        self.handler.hedge_delay_ms = 10
+        cancelled: list[int] = []
+
+        async def forward_fn(candidate):
+            if candidate.provider_id == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append(candidate.provider_id)
+                    raise
+            return ProviderResponse(status_code=200, body={"from": candidate.provider_id})
+
+        result = await self.handler.execute_with_retry(
+            candidates=self.candidates,
+            requested_model="test",
+            forward_fn=forward_fn,
+            hedge=True,
+        )
+
+        assert result.success is True
+        assert result.response.body == {"from": 2}
+        assert cancelled == [1]
+        assert len(result.attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_failover_returns_last_failure(self):
+        """Test parallel mode reports failure when every provider fails"""
+        self.strategy.reset()
+        self.handler.failover_mode = "parallel"
+        self.handler.hedge_delay_ms = 10
+
+        async def forward_fn(candidate):
+            return ProviderResponse(status_code=400, error=f"bad {candidate.provider_id}")
+
+        result = await self.handler.execute_with_retry(
+            candidates=self.candidates,
+            requested_model="test",
+            forward_fn=forward_fn,
+            hedge=True,
+        )
+
+        assert result.success is False
+        assert result.retry_count == 2
+        assert len(result.attempts) == 2
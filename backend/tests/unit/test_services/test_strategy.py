@@ -4,7 +4,14 @@ Round Robin Strategy Unit Tests
 
 import pytest
 import asyncio
-from app.services.strategy import RoundRobinStrategy, CostFirstStrategy, PriorityStrategy
+from app.common.http_client import get_bulkhead
+from app.config import get_settings
+from app.services.strategy import (
+    RoundRobinStrategy,
+    CostFirstStrategy,
+    PriorityStrategy,
+    ModelAffinityStrategy,
+)
 from app.rules.models import CandidateProvider
 
 
@@ -447,3 +454,105 @@ class TestPriorityStrategy:
 
         next_provider = await self.strategy.get_next(self.candidates, "test-model", next_provider)
         assert next_provider.provider_id == 3
+
+
+class TestModelAffinityStrategy:
+    """Model Affinity Strategy Tests"""
+
+    def setup_method(self):
+        """Setup before test"""
+        self.strategy = ModelAffinityStrategy(max_queued=2)
+        self.candidates = [
+            CandidateProvider(
+                provider_id=1,
+                provider_name="Local1",
+                base_url="http://gpu1:8000",
+                protocol="openai",
+                api_key=None,
+                target_model="llama",
+                priority=0,
+            ),
+            CandidateProvider(
+                provider_id=2,
+                provider_name="Local2",
+                base_url="http://gpu2:8000",
+                protocol="openai",
+                api_key=None,
+                target_model="llama",
+                priority=0,
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_prefers_backend_already_serving_model(self):
+        """A backend that last served the model is preferred over the default order"""
+        self.strategy._last_model[2] = "llama"
+        self.strategy._last_model[1] = "qwen"
+
+        selected = await self.strategy.select(self.candidates, "llama")
+
+        assert selected.provider_id == 2
+        assert self.strategy._last_model == {1: "qwen", 2: "llama"}
+
+    @pytest.mark.asyncio
+    async def test_prefers_least_loaded_backend_without_affinity(self):
+        """Without an affinity hit, the backend with fewer in-flight requests wins"""
+        async with get_bulkhead("http://gpu1:8000").slot():
+            selected = await self.strategy.select(self.candidates, "llama")
+
+        assert selected.provider_id == 2
+
+    @pytest.mark.asyncio
+    async def test_ignores_affinity_when_queue_too_long(self, monkeypatch):
+        """Affinity is dropped once the backend queue exceeds the threshold"""
+        monkeypatch.setenv("UPSTREAM_MAX_CONCURRENCY", "1")
+        get_settings.cache_clear()
+        self.strategy._last_model[1] = "llama"
+        bulkhead = get_bulkhead("http://gpu1:8000")
+        release = asyncio.Event()
+
+        async def hold():
+            async with bulkhead.slot():
+                await release.wait()
+
+        # One request holds the only slot, three more queue behind it
+        holders = [asyncio.create_task(hold()) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert bulkhead.waiting == 3
+        try:
+            selected = await self.strategy.select(self.candidates, "llama")
+        finally:
+            release.set()
+            await asyncio.gather(*holders)
+            get_settings.cache_clear()
+
+        assert selected.provider_id == 2
+
+    @pytest.mark.asyncio
+    async def test_get_next_skips_current(self):
+        """Failover never returns the failed provider"""
+        next_provider = await self.strategy.get_next(
+            self.candidates, "llama", self.candidates[0]
+        )
+
+        assert next_provider.provider_id == 2
+        assert await self.strategy.get_next(self.candidates[:1], "llama", self.candidates[0]) is None
+
+    @pytest.mark.asyncio
+    async def test_get_next_walks_all_candidates_without_recording(self):
+        """Repeated failover visits every provider and leaves affinity untouched"""
+        candidates = self.candidates + [
+            self.candidates[1]._replace(
+                provider_id=3, provider_name="Local3", base_url="http://gpu3:8000"
+            )
+        ]
+        selected = await self.strategy.select(candidates, "llama")
+
+        visited = [selected.provider_id]
+        current = selected
+        for _ in range(len(candidates) - 1):
+            current = await self.strategy.get_next(candidates, "llama", current)
+            visited.append(current.provider_id)
+
+        assert sorted(visited) == [1, 2, 3]
+        assert self.strategy._last_model == {selected.provider_id: "llama"}
@@ -42,27 +42,30 @@ class TestWeightedRoundRobin:
         """Test weighted selection distribution"""
         self.strategy.reset()
         
-        # Expected sequence for weights 3:1 is A, A, A, B
-        
-        # 1st selection -> A
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
-        
-        # 2nd selection -> A
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
+        # Expected smooth sequence for weights 3:1 is A, A, B, A, then it loops back
+        selected = [
+            (await self.strategy.select(self.candidates, "test-model")).provider_id
+            for _ in range(5)
+        ]
         
-        # 3rd selection -> A
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
+        assert selected == [1, 1, 2, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_weighted_selection_interleaves(self):
+        """Test heavy providers are interleaved with light ones, not served in a burst"""
+        candidates = [
+            self.candidates[0]._replace(weight=5),
+            self.candidates[1],
+            self.candidates[1]._replace(provider_id=3, provider_name="ProviderC"),
+        ]
+        self.strategy.reset()
         
-        # 4th selection -> B
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 2
+        selected = [
+            (await self.strategy.select(candidates, "test-model")).provider_id
+            for _ in range(14)
+        ]
         
-        # 5th selection -> A (Loop back)
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
+        assert selected == [1, 1, 2, 1, 3, 1, 1] * 2
 
     @pytest.mark.asyncio
     async def test_zero_or_negative_weight_fallback(self):
@@ -137,19 +140,10 @@ class TestWeightedPriorityStrategy:
         """Test weighted selection within priority group"""
         self.strategy.reset()
         
-        # Expected sequence for weights 3:1 is A, A, A, B
-        
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
-        
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
-        
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
-        
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 2
+        # Expected smooth sequence for weights 3:1 is A, A, B, A, then it loops back
+        selected = [
+            (await self.strategy.select(self.candidates, "test-model")).provider_id
+            for _ in range(5)
+        ]
         
-        selected = await self.strategy.select(self.candidates, "test-model")
-        assert selected.provider_id == 1
+        assert selected == [1, 1, 2, 1, 1]
@@ -1,20 +1,31 @@
-
 import asyncio
 import pytest
-from sqlalchemy import text
+from sqlalchemy import inspect
 from app.db.session import init_db, engine
 
+EXPECTED_COLUMNS = {
+    "request_protocol",
+    "supplier_protocol",
+    "converted_request_body",
+    "upstream_response_body",
+}
+
 async def verify_columns():
     # Run the initialization which triggers migrations
     await init_db()
     
     async with engine.connect() as conn:
-        # Check if columns exist by selecting them (limit 0 to avoid fetching data)
-        try:
-            await conn.execute(text("SELECT request_protocol, supplier_protocol, converted_request_body, upstream_response_body FROM request_logs LIMIT 0"))
-            print("SUCCESS: Columns exist.")
-        except Exception as e:
-            print(f"FAILURE: {e}")
+        # Read the column list from the catalog (PRAGMA on SQLite, information_schema on PostgreSQL)
+        existing = await conn.run_sync(
+            lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns("request_logs")}
+        )
+    # Close pooled connections so the process can exit
+    await engine.dispose()
+    missing = EXPECTED_COLUMNS - existing
+    if missing:
+        print(f"FAILURE: Missing columns: {sorted(missing)}")
+    else:
+        print("SUCCESS: Columns exist.")
 
 if __name__ == "__main__":
     asyncio.run(verify_columns())
@@ -110,6 +110,7 @@ export function ModelFilters({ filters, onFilterChange }: ModelFiltersProps) {
                 <SelectItem value="round_robin">Round Robin</SelectItem>
                 <SelectItem value="cost_first">Cost First</SelectItem>
                 <SelectItem value="priority">Priority</SelectItem>
+                <SelectItem value="model_affinity">Model Affinity</SelectItem>
               </SelectContent>
             </Select>
           </div>
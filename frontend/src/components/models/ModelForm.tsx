@@ -271,7 +271,7 @@ export function ModelForm({
               name="strategy"
               control={control}
               render={({ field }) => (
-                <div className="grid grid-cols-1 md:grid-cols-3 gap-3">
+                <div className="grid grid-cols-1 md:grid-cols-2 gap-3">
                   {/* Round Robin Strategy */}
                   <Card
                     className={`cursor-pointer transition-all duration-200 hover:shadow-md ${
@@ -346,6 +346,43 @@ export function ModelForm({
                     </div>
                   </Card>
 
+                  {/* Model Affinity Strategy */}
+                  <Card
+                    className={`cursor-pointer transition-all duration-200 hover:shadow-md ${
+                      field.value === 'model_affinity'
+                        ? 'border-primary border-2 bg-primary/5'
+                        : 'border-border hover:border-primary/50'
+                    }`}
+                    onClick={() => field.onChange('model_affinity')}
+                  >
+                    <div className="p-4 space-y-2">
+                      <div className="flex items-center gap-3">
+                        <div className={`w-5 h-5 rounded-full border-2 flex items-center justify-center ${
+                          field.value === 'model_affinity'
+                            ? 'border-primary bg-primary'
+                            : 'border-muted-foreground'
+                        }`}>
+                          {field.value === 'model_affinity' && (
+                            <div className="w-2 h-2 rounded-full bg-white"></div>
+                          )}
+                        </div>
+                        <div className="flex items-center gap-2">
+                          <span className="text-2xl">🧲</span>
+                          <span className="font-semibold text-base">Model Affinity</span>
+                        </div>
+                      </div>
+                      <p className="text-sm text-muted-foreground pl-8">
+                        Prefer backends already serving this model, then the least loaded
+                      </p>
+                      <div className="pl-8 pt-1">
+                        <div className="inline-flex items-center gap-1 px-2 py-0.5 rounded-md bg-purple-100 dark:bg-purple-900/30 text-purple-700 dark:text-purple-300 text-xs">
+                          <span>🔥</span>
+                          <span>Warm Models</span>
+                        </div>
+                      </div>
+                    </div>
+                  </Card>
+
                   {/* Cost First Strategy */}
                   <Card
                     className={`transition-all duration-200 ${
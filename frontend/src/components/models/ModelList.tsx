@@ -78,7 +78,9 @@ export function ModelList({
                     ? 'Cost First'
                     : model.strategy === 'priority'
                       ? 'Priority'
-                      : 'Round Robin'}
+                      : model.strategy === 'model_affinity'
+                        ? 'Model Affinity'
+                        : 'Round Robin'}
                 </Badge>
               </TableCell>
               <TableCell>